@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Benchmark do parsing das páginas de resultados.
+Compara o tempo por página do parsing original (html.parser, página inteira)
+com o lxml, com e sem a restrição aos contêineres de resultados, e confere se
+os itens extraídos são os mesmos.
+
+Uso:
+    python cli/benchmark_parsing.py                       # página OJS 3 sintética
+    python cli/benchmark_parsing.py --html pagina.html    # página salva do navegador
+    python cli/benchmark_parsing.py --repeat 200
+"""
+
+import argparse
+import os
+import sys
+import time
+
+# Add the src directory to the Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from design_scraper.scrapers.arcosdesign_scraper import ArcosDesignScraper
+from design_scraper.scrapers.parser_engine import ParserEngine, engine_available
+
+
+def build_sample_page(items=20):
+    """Gera uma página de busca OJS 3 com menus, barra lateral e rodapé"""
+    menu = "".join(
+        f'<li><a href="https://example.org/menu/{i}">Item de menu {i}</a>'
+        f'<ul>{"".join(f"<li><a href=/sub/{i}/{j}>Subitem {j}</a></li>" for j in range(8))}</ul></li>'
+        for i in range(12)
+    )
+    sidebar = "".join(
+        f'<div class="pkp_block"><h2>Bloco {i}</h2><p>{"Texto da barra lateral. " * 30}</p></div>'
+        for i in range(10)
+    )
+    results = "".join(
+        '<li><div class="obj_article_summary">'
+        f'<h3 class="title"><a href="https://example.org/article/view/{i}">Artigo sobre design {i}</a></h3>'
+        f'<div class="authors">Autor {i}, Coautor {i}</div>'
+        f'<div class="published">2024-0{i % 9 + 1}-10</div>'
+        '</div></li>'
+        for i in range(items)
+    )
+    footer = f'<footer><p>{"Rodapé institucional. " * 80}</p></footer>'
+    return (
+        "<!DOCTYPE html><html><head><title>Busca</title>"
+        f'{"<link rel=stylesheet href=/style.css>" * 10}'
+        f'<script>{"var x = 1;" * 500}</script></head><body>'
+        f'<nav class="pkp_navigation_primary"><ul>{menu}</ul></nav>'
+        f'<div class="pkp_structure_main"><ul class="search_results">{results}</ul>'
+        '<div class="cmp_pagination">1 - 20 de 95 itens '
+        '<a class="next" href="?searchPage=2">Próximo</a></div></div>'
+        f'<div class="pkp_structure_sidebar">{sidebar}</div>{footer}</body></html>'
+    ).encode("utf-8")
+
+
+def time_parse(scraper, parser, content, repeat):
+    """Retorna (milissegundos por página, itens extraídos)"""
+    scraper.parser = parser
+    items = []
+    start = time.perf_counter()
+    for _ in range(repeat):
+        soup = scraper.parse(content)
+        items = scraper.parse_results(soup)
+        scraper.has_next_page(soup, 1)
+    elapsed = time.perf_counter() - start
+    return elapsed / repeat * 1000, items
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark do parsing das páginas de resultados")
+    parser.add_argument("--html", help="Arquivo HTML de uma página de busca OJS 3 (padrão: página sintética)")
+    parser.add_argument("--repeat", type=int, default=100, help="Parsings por configuração (padrão: 100)")
+    args = parser.parse_args()
+
+    if args.html:
+        with open(args.html, "rb") as f:
+            content = f.read()
+    else:
+        content = build_sample_page()
+
+    scraper = ArcosDesignScraper(base_url="https://example.org/search/index")
+    configurations = [
+        ("html.parser, página inteira (antes)", "html.parser", False),
+        ("lxml, página inteira", "lxml", False),
+        ("html.parser, restrito", "html.parser", True),
+        ("lxml, restrito (padrão)", "lxml", True),
+    ]
+
+    print(f"📄 Página de {len(content) / 1024:.1f} KB, {args.repeat} parsings por configuração\n")
+
+    baseline_ms, baseline_items = None, None
+    for label, engine, restrict in configurations:
+        if not engine_available(engine):
+            print(f"   {label:<38} parser não instalado")
+            continue
+
+        ms, items = time_parse(scraper, ParserEngine(engine, restrict), content, args.repeat)
+        if baseline_ms is None:
+            baseline_ms, baseline_items = ms, items
+
+        same = "✅" if items == baseline_items else "❌ itens diferentes"
+        print(f"   {label:<38} {ms:7.2f} ms/página  {baseline_ms / ms:5.1f}x  {len(items)} itens {same}")
+
+
+if __name__ == "__main__":
+    main()
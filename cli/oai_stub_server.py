@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""
+Servidor OAI-PMH local que imita o endpoint de um periódico OJS.
+Serve registros Dublin Core fictícios em páginas ListRecords com resumptionToken
+e respeita o parâmetro from=, permitindo validar o OAIPMHScraper sem acessar
+os servidores das universidades.
+
+Uso:
+    python cli/oai_stub_server.py --port 8765            # apenas sobe o servidor
+    python cli/oai_stub_server.py --check                # sobe, colhe e mostra o resultado
+"""
+
+import argparse
+import sys
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+from xml.sax.saxutils import escape
+
+# Add the src directory to the Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+PAGE_SIZE = 2
+
+SAMPLE_RECORDS = [
+    {
+        "identifier": "oai:stub:article/101",
+        "datestamp": "2023-03-10T12:00:00Z",
+        "title": "Usabilidade de interfaces digitais para idosos",
+        "creators": ["Silva, Ana", "Souza, Bruno"],
+        "subjects": ["usabilidade", "ergonomia"],
+        "description": "Avaliação da experiência do usuário em aplicativos bancários.",
+        "date": "2023-03-01",
+        "link": "https://stub.local/index.php/revista/article/view/101",
+    },
+    {
+        "identifier": "oai:stub:article/102",
+        "datestamp": "2023-08-22T09:30:00Z",
+        "title": "Design thinking na educação",
+        "creators": ["Pereira, Carla"],
+        "subjects": ["design thinking"],
+        "description": "Estudo de caso sobre metodologias de projeto.",
+        "date": "2023-08-15",
+        "link": "https://stub.local/index.php/revista/article/view/102",
+    },
+    {
+        "identifier": "oai:stub:article/103",
+        "datestamp": "2024-01-05T08:00:00Z",
+        "title": "Sistemas de informação e acessibilidade",
+        "creators": ["Lima, Diego", "Costa, Eva"],
+        "subjects": ["acessibilidade", "tecnologia"],
+        "description": "Revisão sistemática sobre interação em sistemas digitais.",
+        "date": "2024-01-02",
+        "link": "https://stub.local/index.php/revista/article/view/103",
+    },
+    {
+        "identifier": "oai:stub:article/104",
+        "datestamp": "2024-06-18T15:45:00Z",
+        "title": "Tipografia vernacular brasileira",
+        "creators": ["Rocha, Fábio"],
+        "subjects": ["tipografia"],
+        "description": "Levantamento histórico de letreiros populares.",
+        "date": "2024-06-10",
+        "link": "https://stub.local/index.php/revista/article/view/104",
+    },
+]
+
+
+def render_record(record):
+    """Gera o XML de um registro oai_dc"""
+    creators = "".join(f"<dc:creator>{escape(c)}</dc:creator>" for c in record["creators"])
+    subjects = "".join(f"<dc:subject>{escape(s)}</dc:subject>" for s in record["subjects"])
+    return (
+        "<record><header>"
+        f"<identifier>{record['identifier']}</identifier>"
+        f"<datestamp>{record['datestamp']}</datestamp>"
+        "</header><metadata>"
+        '<oai_dc:dc xmlns:oai_dc="http://www.openarchives.org/OAI/2.0/oai_dc/" '
+        'xmlns:dc="http://purl.org/dc/elements/1.1/">'
+        f"<dc:title>{escape(record['title'])}</dc:title>"
+        f"{creators}{subjects}"
+        f"<dc:description>{escape(record['description'])}</dc:description>"
+        f"<dc:date>{record['date']}</dc:date>"
+        f"<dc:identifier>{record['link']}</dc:identifier>"
+        "</oai_dc:dc></metadata></record>"
+    )
+
+
+def render_list_records(records, offset, from_date):
+    """Gera uma página ListRecords a partir do deslocamento informado"""
+    if from_date:
+        records = [r for r in records if r["datestamp"][:10] >= from_date]
+
+    if not records:
+        body = '<error code="noRecordsMatch">Nenhum registro encontrado</error>'
+    else:
+        page = records[offset:offset + PAGE_SIZE]
+        body = "<ListRecords>" + "".join(render_record(r) for r in page)
+        next_offset = offset + PAGE_SIZE
+        if next_offset < len(records):
+            token = f"{next_offset}:{from_date or ''}"
+            body += f'<resumptionToken completeListSize="{len(records)}">{token}</resumptionToken>'
+        else:
+            body += "<resumptionToken/>"
+        body += "</ListRecords>"
+
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>'
+        '<OAI-PMH xmlns="http://www.openarchives.org/OAI/2.0/">'
+        "<responseDate>2024-07-01T00:00:00Z</responseDate>"
+        f"{body}</OAI-PMH>"
+    ).encode("utf-8")
+
+
+class OAIStubHandler(BaseHTTPRequestHandler):
+    """Responde ao verbo ListRecords com os registros de exemplo"""
+
+    records = SAMPLE_RECORDS
+
+    def do_GET(self):
+        query = parse_qs(urlparse(self.path).query)
+
+        if query.get("verb", [""])[0] != "ListRecords":
+            self.send_error(400, "Apenas ListRecords é suportado")
+            return
+
+        offset, from_date = 0, query.get("from", [None])[0]
+        if "resumptionToken" in query:
+            raw_offset, _, token_from = query["resumptionToken"][0].partition(":")
+            offset, from_date = int(raw_offset), token_from or None
+
+        body = render_list_records(self.records, offset, from_date)
+        self.send_response(200)
+        self.send_header("Content-Type", "text/xml; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_server(port=0):
+    """Sobe o servidor em uma thread e retorna (servidor, URL do endpoint)"""
+    server = ThreadingHTTPServer(("127.0.0.1", port), OAIStubHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}/index.php/revista/oai"
+
+
+def run_check():
+    """Colhe o servidor local com o OAIPMHScraper e mostra os registros obtidos"""
+    from design_scraper.scrapers.oai_pmh_scraper import OAIPMHScraper
+
+    server, endpoint = start_server()
+    print(f"🧪 Servidor OAI-PMH local em {endpoint}")
+
+    try:
+        scraper = OAIPMHScraper(endpoint)
+
+        records = list(scraper.iter_records())
+        print(f"\n📥 Colheita completa: {len(records)} registros")
+        for record in records:
+            print(f"   • [{record['year']}] {record['title']} — {record['author']}")
+
+        incremental = list(scraper.iter_records(from_date="2024-01-01"))
+        print(f"\n📈 Colheita incremental (from=2024-01-01): {len(incremental)} registros")
+
+        results = scraper.search_batch(["usabilidade", "acessibilidade", "interacao"], None)
+        print(f"\n🔍 Filtragem local por termos: {len(results)} resultados")
+        for result in results:
+            print(f"   • '{result['termo']}': {result['title']}")
+    finally:
+        server.shutdown()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Servidor OAI-PMH local para testes do scraper")
+    parser.add_argument("--port", type=int, default=8765, help="Porta do servidor (padrão: 8765)")
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="Colhe o servidor com o OAIPMHScraper e mostra o resultado"
+    )
+    args = parser.parse_args()
+
+    if args.check:
+        run_check()
+        return
+
+    server, endpoint = start_server(args.port)
+    print(f"🚀 Servidor OAI-PMH local em {endpoint} (Ctrl+C para encerrar)")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
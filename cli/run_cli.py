@@ -4,6 +4,7 @@ Command-line entry point for the Design Publications Scraper application.
 This script provides a clean CLI interface for the automated pipeline.
 """
 
+import argparse
 import sys
 import os
 
@@ -12,14 +13,38 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 from design_scraper.core.automated_pipeline import AutomatedPipeline
 
-def main():
+def parse_args(argv=None):
+    """Parse command-line options"""
+    parser = argparse.ArgumentParser(
+        description="Executa o pipeline automatizado de scraping"
+    )
+    parser.add_argument(
+        "--config",
+        default="src/design_scraper/config/config.yaml",
+        help="Caminho para o arquivo de configuração (padrão: src/design_scraper/config/config.yaml)"
+    )
+    parser.add_argument(
+        "--offline",
+        action="store_true",
+        help="Executa apenas a partir do cache HTTP, sem acessar a rede"
+    )
+    parser.add_argument(
+        "--resume",
+        metavar="RUN_ID",
+        help="Retoma uma execução interrompida, relendo do diário as unidades já concluídas"
+    )
+    return parser.parse_args(argv)
+
+def main(argv=None):
     """Main CLI function"""
+    args = parse_args(argv)
     print("🚀 Design Publications Scraper - Pipeline Automatizado")
     print("=" * 60)
     
+    pipeline = None
     try:
         # Create and run the automated pipeline
-        pipeline = AutomatedPipeline()
+        pipeline = AutomatedPipeline(args.config, offline=args.offline, resume=args.resume)
         
         # Show pipeline status before running
         print("📊 Status do Pipeline:")
@@ -41,8 +66,14 @@ def main():
             print("\n❌ Pipeline falhou ou não retornou resultados!")
             return 1
         
+    except KeyboardInterrupt:
+        print("\n⏹️ Pipeline interrompido pelo usuário")
+        print_resume_hint(pipeline)
+        return 130
+        
     except Exception as e:
         print(f"\n❌ Erro executando pipeline: {e}")
+        print_resume_hint(pipeline)
         print("\nPara debugging, você pode executar:")
         print("  python test_filtering.py")
         print("  python src/design_scraper/core/automated_pipeline.py")
@@ -50,5 +81,11 @@ def main():
     
     return 0
 
+def print_resume_hint(pipeline):
+    """Mostra como retomar a execução, se ela tem um diário de checkpoints"""
+    if pipeline is not None and pipeline.journal is not None:
+        print(f"\n♻️ As unidades concluídas estão no diário: {pipeline.journal.path}")
+        print(f"   Para retomar: python cli/run_cli.py --resume {pipeline.run_id}")
+
 if __name__ == "__main__":
     sys.exit(main())
@@ -4,21 +4,57 @@ Este módulo executa o processo completo de scraping, filtragem e deduplicação
 baseado na configuração do arquivo YAML.
 """
 
-import time
 import pandas as pd
 import yaml
 import os
+from urllib.parse import urlparse
+from .fetch_engine import FetchEngine
+from ..scrapers.parse_pool import configure_parse_pool
+from ..scrapers.parser_engine import configure_parser_engine
+from ..scrapers.publication import publications_to_frame
+from ..scrapers.transport import configure_transport
 from ..utils.scrapers_factory import ScrapterFactory
-from ..utils.deduplication import run_deduplication
-from ..utils.data_transformer import transform_search_results
+from ..utils.high_water_marks import IncrementalState
+from ..utils.deduplication import Deduplicator, deduplicate_results
+from ..utils.columnar import parquet_path, require_pyarrow, write_parquet
+from ..utils.data_transformer import DataTransformer, transform_raw_results
+from ..utils.export_csv import IncrementalCSVWriter
+from ..utils.near_duplicates import NearDuplicateDetector
+from ..utils.raw_store import RawResultsStore, new_run_id
+from ..utils.run_journal import COMPLETED, RunJournal
+from ..utils.sqlite_store import FILTERED_TABLE, NEW_RECORDS_TABLE, RAW_TABLE, SQLiteStore
 
 
 class AutomatedPipeline:
     """Pipeline automatizado para scraping de publicações"""
     
-    def __init__(self, config_path="src/design_scraper/config/config.yaml"):
+    def __init__(self, config_path="src/design_scraper/config/config.yaml", offline=False, resume=None):
         self.config_path = config_path
         self.config = self.load_config()
+        if offline:
+            # Modo offline: executa apenas a partir do cache HTTP
+            cache_config = dict(self.config.get("http_cache") or {})
+            cache_config.update(enabled=True, offline=True)
+            self.config["http_cache"] = cache_config
+        self.transport = configure_transport(self.config)
+        self.parser = configure_parser_engine(self.config)
+        self.parse_pool = configure_parse_pool(self.config)
+        # Resultados brutos: uma partição por execução em data/raw/runs/
+        self.raw_store = RawResultsStore.from_config(self.config)
+        # Armazenamento opcional em SQLite (storage.backend: sqlite); None = arquivos CSV
+        self.storage = SQLiteStore.from_config(self.config)
+        # Formato de troca entre as etapas: "parquet" grava cópias Parquet das saídas
+        # (os CSVs continuam sendo gravados para a importação no Softr)
+        self.parquet = self.config.get("interchange_format", "csv") == "parquet"
+        if self.parquet:
+            require_pyarrow()
+        # Streaming: resultados processados e gravados em blocos durante as buscas
+        self.streaming = bool((self.config.get("streaming") or {}).get("enabled", False))
+        # Execução interrompida a retomar (run_id) e diário de checkpoints da execução
+        self.resume = resume
+        self.run_id = None
+        self.journal = None
+        self._configure_rate_limits()
         
     def load_config(self, path=None):
         """Carrega configuração do arquivo YAML"""
@@ -26,16 +62,33 @@ class AutomatedPipeline:
         with open(config_path, "r", encoding="utf-8") as f:
             return yaml.safe_load(f)
     
+    def _configure_rate_limits(self):
+        """Aplica os limites de taxa específicos de cada repositório ao host correspondente"""
+        for scraper_key, limits in (self.config.get("rate_limits") or {}).items():
+            scraper = ScrapterFactory.get_scraper(scraper_key)
+            host = urlparse(scraper.base_url).netloc
+            self.transport.rate_limiter.configure_host(
+                host,
+                delay_between_requests=limits.get("delay_between_requests"),
+                burst=limits.get("burst"),
+            )
+    
     def run(self):
         """Executa o pipeline automatizado completo"""
         print("🚀 Iniciando Pipeline Automatizado...")
         print("=" * 60)
         
         try:
-            return self._run_all_scrapers()
+            result = self._run_all_scrapers()
+            if self.journal:
+                self.journal.finish()
+            return result
         except Exception as e:
             print(f"❌ Erro no pipeline: {e}")
             raise
+        finally:
+            if self.parse_pool:
+                self.parse_pool.close()
     
     def _run_all_scrapers(self):
         """Executa todos os scrapers configurados"""
@@ -48,41 +101,51 @@ class AutomatedPipeline:
         filtered_results_filename = config.get("filtered_results_filename", "data/processed/filtered_results.csv")
         new_records_filename = config.get("new_records_filename", "data/processed/new_records.csv")
         
-        all_results = []
-        
         print(f"📚 Repositórios configurados: {', '.join(repos.keys())}")
         print(f"🔍 Termos de busca: {', '.join(terms)}")
         print(f"📄 Máximo de páginas por busca: {max_pages}")
-        print(f"📁 Arquivo de resultados brutos: {raw_results_filename}")
+        if self.transport.offline:
+            print(f"📴 Modo offline: apenas páginas em cache ({self.transport.cache.directory})")
+        self.run_id = self.resume or new_run_id()
+        self.journal = self._open_journal(self.run_id)
+        if self.storage:
+            print(f"🗃️ Armazenamento SQLite: {self.storage.path} (CSVs exportados para o Softr)")
+        else:
+            print(f"📁 Resultados brutos: {self.raw_store.directory} ({self.raw_store.file_format}, uma partição por execução)")
         print(f"📁 Arquivo de resultados filtrados: {filtered_results_filename}")
         print(f"📁 Arquivo de novos registros: {new_records_filename}")
         print("-" * 60)
         
-        # Step 1: Scraping
-        for repo_name, scraper_key in repos.items():
-            print(f"\n🔍 Executando scraper: {repo_name}")
-            scraper = ScrapterFactory.get_scraper(scraper_key)
-            
-            for term in terms:
-                try:
-                    print(f"   🔎 Buscando por: '{term}'")
-                    results = scraper.search(term, max_pages)
-                    
-                    if results:
-                        # Add metadata
-                        for r in results:
-                            r["fonte"] = repo_name
-                            r["termo"] = term
-                        all_results.extend(results)
-                        print(f"   ✅ {len(results)} resultados encontrados")
-                    else:
-                        print(f"   ⚠️ Nenhum resultado para '{term}'")
-                        
-                except Exception as e:
-                    print(f"   ❌ Erro no scraper {repo_name} para '{term}': {e}")
-            
-            # Pausa para evitar requisições seguidas
-            time.sleep(2)
+        # Step 1: Scraping (repositórios em paralelo, um servidor por vez)
+        self.transport.reset_stats()
+        self.transport.circuit_breaker.reset()
+        if self.parse_pool:
+            self.parse_pool.reset_stats()
+        incremental = None
+        if (config.get("incremental") or {}).get("enabled", False):
+            incremental = IncrementalState.from_config(config)
+            print(
+                f"📈 Modo incremental: {len(incremental.known_links)} links conhecidos, "
+                f"{len(incremental.marks.marks)} marcas salvas"
+            )
+        engine = FetchEngine.from_config(config, self.transport, incremental, self.journal)
+        print(f"⚙️ Concorrência: até {engine.max_workers} buscas simultâneas, {engine.per_host} por servidor")
+        if self.parse_pool:
+            print(f"🧮 Parsing: {self.parse_pool.workers} processos, fila de até {self.parse_pool.queue_size} páginas")
+        if engine.term_batching:
+            print(f"🧩 Agrupamento de termos: consultas OR de até {engine.max_query_length} caracteres")
+        
+        if self.streaming:
+            return self._run_streaming(
+                engine, repos, terms, max_pages, incremental, raw_results_filename,
+                filtered_results_filename, new_records_filename, self.run_id
+            )
+        
+        all_results, repo_stats = engine.run(repos, terms, max_pages)
+        if incremental:
+            incremental.marks.save()
+        
+        http_stats = self._report_fetch(repo_stats)
         
         if not all_results:
             print("\n⚠️ Nenhum resultado encontrado pelos scrapers!")
@@ -90,11 +153,17 @@ class AutomatedPipeline:
         
         # Step 2: Save raw results
         print(f"\n💾 Salvando {len(all_results)} resultados brutos...")
-        self._save_raw_results(raw_results_filename, all_results)
+        run_id = self.run_id
+        if self.storage:
+            raw_partition = self._save_raw_results_sqlite(raw_results_filename, all_results, run_id)
+        else:
+            raw_partition = self._save_raw_results(raw_results_filename, all_results, run_id)
         
-        # Step 3: Transform and filter results
+        # Step 3: Transform and filter results (histórico completo, lido partição a partição)
         print(f"\n🔄 Transformando e filtrando resultados...")
-        filtered_df = transform_search_results(raw_results_filename, filtered_results_filename)
+        filtered_df = transform_raw_results(
+            self.storage or self.raw_store, filtered_results_filename, parquet=self.parquet
+        )
         
         if filtered_df.empty:
             print("⚠️ Nenhum resultado passou pelos filtros aplicados!")
@@ -105,56 +174,318 @@ class AutomatedPipeline:
         dedup_config = config.get("deduplication", {})
         base_db_path = dedup_config.get("base_database", "data/raw/base_database.csv")
         
-        new_records = run_deduplication(
-            filtered_results_path=filtered_results_filename,
-            base_db_path=base_db_path,
-            output_path=new_records_filename
+        if self.storage:
+            new_records = self._deduplicate_sqlite(
+                filtered_df, base_db_path, new_records_filename, dedup_config, run_id
+            )
+        else:
+            # Os resultados filtrados seguem em memória (sem reler o arquivo recém-gravado)
+            new_records = deduplicate_results(
+                filtered_df,
+                base_db_path=base_db_path,
+                output_path=new_records_filename,
+                index_path=dedup_config.get("index_path", "data/state/link_index.sqlite"),
+                near_duplicates=dedup_config.get("near_duplicates"),
+                export_parquet=self.parquet
+            )
+        
+        return self._summarize(
+            len(all_results), len(filtered_df), len(new_records), raw_partition,
+            filtered_results_filename, new_records_filename, repo_stats, http_stats
         )
+    
+    def _open_journal(self, run_id):
+        """
+        Abre o diário de checkpoints da execução (seção 'checkpoints')
         
-        # Final summary
+        Ao retomar, o diário precisa existir, e os resultados brutos já gravados
+        pela tentativa interrompida são descartados (a execução os grava de novo).
+        """
+        if not self.resume:
+            journal = RunJournal.from_config(self.config, run_id)
+            if journal:
+                journal.save()
+                print(f"💾 Checkpoints por unidade de trabalho: {journal.path}")
+                print(f"   (se interrompida, retome com --resume {run_id})")
+            return journal
+        
+        journal = RunJournal.from_config(self.config, run_id, force=True)
+        if not journal.exists:
+            raise ValueError(f"Diário da execução {run_id} não encontrado em {journal.path}")
+        if journal.status == COMPLETED:
+            raise ValueError(f"A execução {run_id} já foi concluída")
+        
+        if self.storage:
+            discarded = self.storage.delete_run(RAW_TABLE, run_id)
+        else:
+            discarded = self.raw_store.remove_run(run_id)
+        print(
+            f"♻️ Retomando a execução {run_id}: {len(journal.completed_units())} unidades concluídas "
+            f"serão relidas do diário"
+        )
+        if discarded:
+            print(f"   🗑️ {discarded} resultados brutos da tentativa anterior descartados")
+        return journal
+    
+    def _report_fetch(self, repo_stats):
+        """Mostra o tempo por repositório e as estatísticas HTTP e de parsing"""
+        print(f"\n⏱️ Tempo por repositório:")
+        for repo_name, stats in repo_stats.items():
+            circuit = " 🔌 circuito aberto" if stats['circuit_open'] else ""
+            print(
+                f"   • {repo_name}: {stats['wall_time']:.1f}s "
+                f"({stats['results']} resultados, {stats['errors']} erros, "
+                f"{stats['skipped']} termos ignorados){circuit}"
+            )
+        
+        http_stats = self.transport.get_stats()
+        print(
+            f"🌐 Requisições HTTP: {http_stats['requests']} "
+            f"(conexões abertas: {http_stats['connections_opened']}, "
+            f"reutilizadas: {http_stats['connections_reused']}, "
+            f"espera por limite de taxa: {http_stats['throttled_seconds']:.1f}s, "
+            f"novas tentativas: {http_stats['retries']}, falhas: {http_stats['failures']})"
+        )
+        if self.transport.cache:
+            print(
+                f"🗄️ Cache HTTP: {http_stats['cache_hits']} acertos, "
+                f"{http_stats['cache_revalidated']} revalidados, "
+                f"{http_stats['cache_misses']} ausentes"
+            )
+        if self.parse_pool:
+            parse_stats = self.parse_pool.get_stats()
+            print(
+                f"🧮 Parsing: {parse_stats['pages']} páginas em {parse_stats['workers']} processos "
+                f"(espera na fila: {parse_stats['queue_wait_seconds']:.1f}s)"
+            )
+        return http_stats
+    
+    def _summarize(self, raw_count, filtered_count, new_records_count, raw_partition,
+                   filtered_results_filename, new_records_filename, repo_stats, http_stats):
+        """Mostra o resumo final e monta o resultado da execução"""
         print(f"\n✨ Pipeline automatizado concluído com sucesso!")
         print("=" * 60)
-        print(f"📊 Resultados brutos: {len(all_results)}")
-        print(f"🎯 Resultados filtrados: {len(filtered_df)}")
-        print(f"✨ Novos registros: {len(new_records)}")
+        print(f"📊 Resultados brutos: {raw_count}")
+        print(f"🎯 Resultados filtrados: {filtered_count}")
+        print(f"✨ Novos registros: {new_records_count}")
         print(f"📁 Arquivos gerados:")
-        print(f"   • {raw_results_filename}")
+        print(f"   • {raw_partition}")
         print(f"   • {filtered_results_filename}")
         print(f"   • {new_records_filename}")
         
         return {
-            'raw_count': len(all_results),
-            'filtered_count': len(filtered_df),
-            'new_records_count': len(new_records),
-            'raw_file': raw_results_filename,
+            'raw_count': raw_count,
+            'filtered_count': filtered_count,
+            'new_records_count': new_records_count,
+            'raw_file': raw_partition,
             'filtered_file': filtered_results_filename,
-            'new_records_file': new_records_filename
+            'new_records_file': new_records_filename,
+            'repo_wall_times': {
+                repo_name: round(stats['wall_time'], 2)
+                for repo_name, stats in repo_stats.items()
+            },
+            'http_stats': http_stats,
+            'repo_outcomes': {
+                repo_name: {
+                    'errors': stats['errors'],
+                    'skipped_terms': stats['skipped'],
+                    'circuit_open': stats['circuit_open'],
+                }
+                for repo_name, stats in repo_stats.items()
+            }
         }
     
-    def _save_raw_results(self, filename, new_results):
-        """Salva resultados brutos dos scrapers"""
-        df_new = pd.DataFrame(new_results)
+    def _run_streaming(self, engine, repos, terms, max_pages, incremental, raw_results_filename,
+                       filtered_results_filename, new_records_filename, run_id):
+        """
+        Busca, filtra, deduplica e grava os resultados em blocos, durante as buscas
+        
+        Cada bloco entregue pelos scrapers é gravado na partição bruta da execução,
+        filtrado, comparado com o índice de links da base e acrescentado aos CSVs
+        de resultados filtrados e de novos registros. A memória usada não depende
+        do tamanho da execução, e os arquivos intermediários não são relidos.
+        Os CSVs contêm apenas os registros desta execução.
+        """
+        dedup_config = self.config.get("deduplication", {})
+        base_db_path = dedup_config.get("base_database", "data/raw/base_database.csv")
+        
+        if self.storage:
+            self._import_raw_history_sqlite(raw_results_filename)
+            raw_writer = None
+            raw_partition = f"{self.storage.path}#{RAW_TABLE}/{run_id}"
+        else:
+            imported = self.raw_store.import_legacy(raw_results_filename)
+            if imported:
+                print(f"   📦 Histórico importado de {raw_results_filename}: {imported['rows']} linhas")
+            raw_writer = self.raw_store.open_run(run_id)
+            raw_partition = os.path.join(self.raw_store.directory, run_id)
+        
+        transformer = DataTransformer()
+        detector = NearDuplicateDetector.from_config(
+            {"near_duplicates": dedup_config.get("near_duplicates")}
+        )
+        deduplicator = Deduplicator(
+            base_db_path, dedup_config.get("index_path", "data/state/link_index.sqlite"), detector
+        )
+        seen_links = set()
+        counts = {'raw': 0, 'portuguese': 0, 'filtered': 0, 'new': 0}
+        
+        print(f"🌊 Modo streaming: blocos de até {engine.stream_batch_size} resultados (execução {run_id})")
+        repo_stats = engine.new_stats(repos)
+        with IncrementalCSVWriter(filtered_results_filename) as filtered_writer, \
+                IncrementalCSVWriter(new_records_filename) as new_writer:
+            try:
+                for records in engine.stream(repos, terms, max_pages, repo_stats):
+                    raw_df = publications_to_frame(records)
+                    if self.storage:
+                        self.storage.write(RAW_TABLE, raw_df, run_id=run_id)
+                    else:
+                        raw_writer.write(raw_df)
+                    
+                    result = transformer.transform_batch(raw_df)
+                    filtered_df = result.mapped_df
+                    new_records = deduplicator.deduplicate_stream(filtered_df, seen_links)
+                    if self.storage:
+                        self.storage.write(FILTERED_TABLE, filtered_df, run_id=run_id,
+                                           replace=counts['filtered'] == 0)
+                        self.storage.write(NEW_RECORDS_TABLE, new_records, run_id=run_id,
+                                           replace=counts['new'] == 0)
+                    filtered_writer.write(filtered_df)
+                    new_writer.write(new_records)
+                    
+                    counts['raw'] += result.total
+                    counts['portuguese'] += result.portuguese_count
+                    counts['filtered'] += len(filtered_df)
+                    counts['new'] += len(new_records)
+                    print(
+                        f"   🌊 +{result.total} brutos, +{len(filtered_df)} filtrados, "
+                        f"+{len(new_records)} novos (total de novos: {counts['new']})"
+                    )
+            finally:
+                if raw_writer is not None:
+                    raw_writer.close()
+        
+        if incremental:
+            incremental.marks.save()
+        http_stats = self._report_fetch(repo_stats)
+        
+        if counts['raw'] == 0:
+            print("\n⚠️ Nenhum resultado encontrado pelos scrapers!")
+            return None
+        
+        print(f"\n📊 Estatísticas do filtro:")
+        print(f"   Total original: {counts['raw']}")
+        print(f"   Títulos em português: {counts['portuguese']}")
+        print(f"   Com palavras-chave: {counts['filtered']}")
+        print(f"   Filtrados: {counts['raw'] - counts['filtered']}")
+        
+        if self.parquet:
+            # Cópias Parquet gravadas ao final (o CSV é a saída incremental)
+            for path, rows in ((filtered_results_filename, counts['filtered']),
+                               (new_records_filename, counts['new'])):
+                if rows:
+                    write_parquet(pd.read_csv(path), parquet_path(path))
+        
+        return self._summarize(
+            counts['raw'], counts['filtered'], counts['new'], raw_partition,
+            filtered_results_filename, new_records_filename, repo_stats, http_stats
+        )
+    
+    def _save_raw_results(self, legacy_filename, new_results, run_id=None):
+        """
+        Salva resultados brutos dos scrapers como uma nova partição
+        
+        Apenas as linhas desta execução são gravadas; o CSV acumulado antigo
+        (legacy_filename) é importado uma única vez como a primeira partição.
+        
+        Returns:
+            str: caminho da partição gravada
+        """
+        df_new = publications_to_frame(new_results)
         if df_new.empty:
+            return None
+        
+        imported = self.raw_store.import_legacy(legacy_filename)
+        if imported:
+            print(f"   📦 Histórico importado de {legacy_filename}: {imported['rows']} linhas")
+        
+        entry = self.raw_store.append(df_new, run_id=run_id)
+        path = self.raw_store.partition_path(entry)
+        print(
+            f"   📂 Partição gravada: {path} ({entry['rows']} linhas; "
+            f"histórico: {self.raw_store.total_rows()} linhas em {len(self.raw_store)} execuções)"
+        )
+        return path
+    
+    def _save_raw_results_sqlite(self, legacy_filename, new_results, run_id):
+        """
+        Salva os resultados brutos desta execução na tabela raw_results
+        
+        Na primeira execução com SQLite, o histórico das partições (e do CSV
+        acumulado antigo) é copiado para a tabela.
+        
+        Returns:
+            str: descrição do destino dos resultados
+        """
+        df_new = publications_to_frame(new_results)
+        if df_new.empty:
+            return None
+        
+        self._import_raw_history_sqlite(legacy_filename)
+        self.storage.write(RAW_TABLE, df_new, run_id=run_id)
+        print(
+            f"   🗃️ Execução {run_id} gravada em {self.storage.path} ({len(df_new)} linhas; "
+            f"histórico: {self.storage.count(RAW_TABLE)} linhas)"
+        )
+        return f"{self.storage.path}#{RAW_TABLE}/{run_id}"
+    
+    def _import_raw_history_sqlite(self, legacy_filename):
+        """Na primeira execução com SQLite, copia o histórico das partições (e do CSV antigo)"""
+        if self.storage.count(RAW_TABLE) > 0:
             return
+        self.raw_store.import_legacy(legacy_filename)
+        imported = 0
+        for run in self.raw_store.runs():
+            for chunk in self.raw_store.iter_partitions(run_ids=[run["run_id"]], chunksize=50000):
+                imported += self.storage.write(RAW_TABLE, chunk, run_id=run["run_id"])
+        if imported:
+            print(f"   📦 Histórico importado para o SQLite: {imported} linhas")
+    
+    def _deduplicate_sqlite(self, filtered_df, base_db_path, output_path, dedup_config, run_id):
+        """Deduplicação por anti-join no SQLite; os novos registros são exportados em CSV"""
+        print("🔄 Iniciando processo de deduplicação...")
         
-        # Ensure directory exists
-        os.makedirs(os.path.dirname(filename), exist_ok=True)
+        if self.storage.sync_base(base_db_path) == "missing":
+            print(f"⚠️ Base de dados não encontrada em: {base_db_path}")
         
-        try:
-            df_old = pd.read_csv(filename)
-        except FileNotFoundError:
-            df_old = pd.DataFrame()
+        self.storage.write(FILTERED_TABLE, filtered_df, run_id=run_id, replace=True)
+        new_records = self.storage.find_new_records()
+        print(f"✅ {len(new_records)} registros novos encontrados")
         
-        df = pd.concat([df_old, df_new], ignore_index=True)
-        df.to_csv(filename, index=False)
-        print(f"   📂 Arquivo atualizado: {filename} ({len(df)} linhas no total)")
+        detector = NearDuplicateDetector.from_config(
+            {"near_duplicates": dedup_config.get("near_duplicates")}
+        )
+        if detector is not None:
+            new_records = detector.apply(new_records, base_db_path)
+        
+        self.storage.write(NEW_RECORDS_TABLE, new_records, run_id=run_id, replace=True)
+        self.storage.export_csv(NEW_RECORDS_TABLE, output_path)
+        print(f"💾 Novos registros exportados em: {output_path}")
+        if self.parquet:
+            write_parquet(new_records, parquet_path(output_path))
+        
+        base_stats = self.storage.statistics()
+        print(f"\n📊 Estatísticas da base de dados:")
+        print(f"   Total de registros: {base_stats['total_records']}")
+        print(f"   Fontes únicas: {base_stats['unique_sources']}")
+        print(f"   Categorias únicas: {base_stats['unique_terms']}")
+        return new_records
     
     def get_status(self):
         """Retorna o status atual do pipeline"""
         config = self.config
         
         # Check if output files exist
-        raw_file = config.get("raw_results_filename", "data/raw/search_results.csv")
         filtered_file = config.get("filtered_results_filename", "data/processed/filtered_results.csv")
         new_records_file = config.get("new_records_filename", "data/processed/new_records.csv")
         
@@ -162,13 +493,17 @@ class AutomatedPipeline:
             'config_loaded': bool(self.config),
             'repos_count': len(config.get("repos", {})),
             'terms_count': len(config.get("terms", [])),
-            'raw_file_exists': os.path.exists(raw_file),
+            'raw_runs': len(self.raw_store),
+            'raw_rows': self.raw_store.total_rows(),
             'filtered_file_exists': os.path.exists(filtered_file),
             'new_records_file_exists': os.path.exists(new_records_file)
         }
         
+        if self.storage:
+            status.update(self.storage.status())
+        
         # Add file sizes if they exist
-        for file_path in [raw_file, filtered_file, new_records_file]:
+        for file_path in [filtered_file, new_records_file]:
             if os.path.exists(file_path):
                 size = os.path.getsize(file_path)
                 status[f'{os.path.basename(file_path)}_size'] = size
@@ -176,9 +511,9 @@ class AutomatedPipeline:
         return status
 
 
-def run_automated_pipeline(config_path="src/design_scraper/config/config.yaml"):
+def run_automated_pipeline(config_path="src/design_scraper/config/config.yaml", offline=False, resume=None):
     """Função de conveniência para executar o pipeline automatizado"""
-    pipeline = AutomatedPipeline(config_path)
+    pipeline = AutomatedPipeline(config_path, offline=offline, resume=resume)
     return pipeline.run()
 
 
@@ -0,0 +1,422 @@
+"""
+Motor de execução concorrente para o pipeline automatizado.
+Distribui as unidades de trabalho (repositório, termo) entre threads, de modo que
+repositórios hospedados em servidores diferentes sejam consultados em paralelo,
+enquanto as requisições para um mesmo servidor respeitam o limite configurado.
+No modo streaming, os resultados são entregues em blocos enquanto as buscas
+ainda estão em andamento. Com um diário de execução (RunJournal), cada unidade
+concluída é gravada em disco, e uma execução retomada relê essas unidades em
+vez de buscá-las novamente.
+"""
+
+import queue as queue_module
+import time
+import threading
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse
+
+from ..scrapers.fetch_policy import CircuitOpenError, FetchError
+from ..scrapers.publication import set_source
+from ..scrapers.transport import get_transport
+from ..utils.run_journal import DONE, FAILED, SKIPPED
+from ..utils.scrapers_factory import ScrapterFactory
+
+
+class WorkUnit:
+    """Unidade de trabalho: um termo (ou grupo de termos em OR) buscado em um repositório"""
+
+    def __init__(self, repo_name, scraper_key, term, index, host=None, terms=None):
+        self.repo_name = repo_name
+        self.scraper_key = scraper_key
+        self.term = term
+        self.terms = terms
+        self.index = index
+        self.host = host
+        self.results = []
+        # Resultados obtidos (no modo streaming, os entregues em blocos)
+        self.count = 0
+        self.error = None
+        self.skipped = False
+        # Resultados relidos do diário de uma execução interrompida
+        self.resumed = False
+
+
+class StreamCancelled(Exception):
+    """O consumidor dos blocos parou antes do fim das buscas"""
+
+
+# Marca o fim dos blocos na fila do modo streaming
+_END_OF_STREAM = object()
+
+
+class FetchEngine:
+    """Executa unidades de trabalho em paralelo com limite de concorrência por host"""
+
+    def __init__(self, max_workers=8, per_host=1, host_limits=None, transport=None,
+                 term_batching=False, max_query_length=200, incremental=None,
+                 stream_batch_size=200, stream_queue_size=8, journal=None):
+        self.max_workers = max(1, int(max_workers))
+        self.per_host = max(1, int(per_host))
+        self.host_limits = host_limits or {}
+        self.term_batching = term_batching
+        self.max_query_length = max_query_length
+        self.incremental = incremental
+        # Streaming: resultados por bloco e blocos aguardando o consumidor
+        self.stream_batch_size = max(1, int(stream_batch_size))
+        self.stream_queue_size = max(1, int(stream_queue_size))
+        # Diário de execução: checkpoints por unidade de trabalho (None = desativado)
+        self.journal = journal
+        self.transport = transport or get_transport()
+        self._lock = threading.Lock()
+        self._cancelled = threading.Event()
+
+    @classmethod
+    def from_config(cls, config, transport=None, incremental=None, journal=None):
+        """Cria o motor a partir das seções 'concurrency', 'term_batching' e 'streaming' da configuração"""
+        concurrency = config.get("concurrency", {}) or {}
+        batching = config.get("term_batching", {}) or {}
+        streaming = config.get("streaming", {}) or {}
+        return cls(
+            max_workers=concurrency.get("max_workers", 8),
+            per_host=concurrency.get("per_host", 1),
+            host_limits=concurrency.get("hosts", {}),
+            transport=transport,
+            term_batching=batching.get("enabled", False),
+            max_query_length=batching.get("max_query_length", 200),
+            incremental=incremental,
+            stream_batch_size=streaming.get("batch_size", 200),
+            stream_queue_size=streaming.get("queue_size", 8),
+            journal=journal,
+        )
+
+    def host_limit(self, host):
+        """Retorna o número máximo de buscas simultâneas para um host"""
+        return max(1, int(self.host_limits.get(host, self.per_host)))
+
+    def plan(self, repos, terms):
+        """Gera as unidades de trabalho agrupadas por host"""
+        lanes = OrderedDict()
+        index = 0
+
+        for repo_name, scraper_key in repos.items():
+            scraper = ScrapterFactory.get_scraper(scraper_key)
+            host = urlparse(scraper.base_url).netloc
+
+            if self.term_batching and scraper.supports_or_queries:
+                # Uma consulta OR por grupo de termos em vez de uma busca por termo
+                for group in scraper.batch_queries(terms, self.max_query_length):
+                    lanes.setdefault(host, deque()).append(
+                        WorkUnit(repo_name, scraper_key, " OR ".join(group), index, host, group)
+                    )
+                    index += 1
+                continue
+
+            for term in terms:
+                lanes.setdefault(host, deque()).append(
+                    WorkUnit(repo_name, scraper_key, term, index, host)
+                )
+                index += 1
+
+        return lanes
+
+    def run(self, repos, terms, max_pages):
+        """
+        Executa todas as buscas configuradas
+
+        Args:
+            repos: Dicionário nome do repositório -> chave do scraper
+            terms: Lista de termos de busca
+            max_pages: Número máximo de páginas por busca
+
+        Returns:
+            tuple: (lista de resultados na ordem repositório/termo, estatísticas por repositório)
+        """
+        repo_stats = self.new_stats(repos)
+        self._cancelled.clear()
+        units = self._execute(repos, terms, max_pages, repo_stats)
+
+        all_results = []
+        for unit in units:
+            all_results.extend(unit.results)
+
+        return all_results, repo_stats
+
+    def stream(self, repos, terms, max_pages, repo_stats):
+        """
+        Executa as buscas entregando os resultados em blocos, à medida que chegam
+
+        A fila de blocos é limitada: se o consumidor atrasa, as buscas esperam.
+        As estatísticas (ver new_stats) ficam completas ao fim da iteração.
+
+        Yields:
+            list[Publication]: blocos de até stream_batch_size resultados
+        """
+        batches = queue_module.Queue(maxsize=self.stream_queue_size)
+        failure = []
+
+        def sink(batch):
+            while not self._cancelled.is_set():
+                try:
+                    batches.put(batch, timeout=0.2)
+                    return
+                except queue_module.Full:
+                    continue
+            raise StreamCancelled()
+
+        def produce():
+            try:
+                self._execute(repos, terms, max_pages, repo_stats, sink)
+            except BaseException as e:
+                failure.append(e)
+            finally:
+                batches.put(_END_OF_STREAM)
+
+        self._cancelled.clear()
+        producer = threading.Thread(target=produce, name="fetch-stream", daemon=True)
+        producer.start()
+        try:
+            while True:
+                batch = batches.get()
+                if batch is _END_OF_STREAM:
+                    break
+                yield batch
+        finally:
+            # Consumidor interrompido: as buscas restantes são canceladas
+            self._cancelled.set()
+            while producer.is_alive():
+                try:
+                    batches.get(timeout=0.2)
+                except queue_module.Empty:
+                    pass
+            producer.join()
+            self._cancelled.clear()
+
+        if failure:
+            raise failure[0]
+
+    @staticmethod
+    def new_stats(repos):
+        """Estatísticas vazias por repositório"""
+        return OrderedDict(
+            (repo_name, {
+                'host': None,
+                'results': 0,
+                'errors': 0,
+                'skipped': 0,
+                'terms': 0,
+                'started_at': None,
+                'finished_at': None,
+                'wall_time': 0.0,
+            })
+            for repo_name in repos
+        )
+
+    def _execute(self, repos, terms, max_pages, repo_stats, sink=None):
+        """Executa as unidades de trabalho; retorna as unidades na ordem repositório/termo"""
+        lanes = self.plan(repos, terms)
+        units = sorted((u for lane in lanes.values() for u in lane), key=lambda u: u.index)
+
+        # Cada "faixa" consome sequencialmente a fila de unidades de um host;
+        # o número de faixas por host é o limite de concorrência daquele host.
+        workers = []
+        for host, queue in lanes.items():
+            for _ in range(min(self.host_limit(host), len(queue))):
+                workers.append((host, queue))
+
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(workers) or 1)) as executor:
+            futures = [
+                executor.submit(self._drain, queue, max_pages, repo_stats, sink)
+                for _, queue in workers
+            ]
+            try:
+                for future in futures:
+                    future.result()
+            except BaseException:
+                # Interrupção (ex.: Ctrl-C): as faixas param após as unidades em andamento,
+                # que ainda chegam ao diário
+                self._cancelled.set()
+                raise
+
+        breaker = self.transport.circuit_breaker
+        for stats in repo_stats.values():
+            if stats['started_at'] is not None:
+                stats['wall_time'] = stats['finished_at'] - stats['started_at']
+            stats['circuit_open'] = bool(stats['host']) and breaker.is_open(stats['host'])
+
+        return units
+
+    def _drain(self, queue, max_pages, repo_stats, sink=None):
+        """Consome a fila de um host até esvaziá-la"""
+        while not self._cancelled.is_set():
+            with self._lock:
+                if not queue:
+                    return
+                unit = queue.popleft()
+            self._run_unit(unit, max_pages, repo_stats[unit.repo_name], sink)
+
+    def _run_unit(self, unit, max_pages, stats, sink=None):
+        """
+        Executa uma unidade de trabalho e atualiza as estatísticas do repositório
+
+        Com `sink`, os resultados são entregues em blocos durante a busca em vez
+        de acumulados em unit.results.
+        """
+        started = time.perf_counter()
+        with self._lock:
+            stats['host'] = unit.host
+            if stats['started_at'] is None:
+                stats['started_at'] = started
+
+        restored = self.journal.restore(unit.repo_name, unit.term) if self.journal else None
+        if restored is not None:
+            self._resume_unit(unit, restored, sink)
+            self._finish_unit(unit, stats)
+            return
+
+        if self.transport.circuit_breaker.is_open(unit.host):
+            # O servidor já falhou repetidamente nesta execução: pula o termo
+            self.transport.circuit_breaker.record_skip(unit.host)
+            unit.skipped = True
+            print(f"   ⏭️ {unit.repo_name} / '{unit.term}': ignorado (circuito aberto)")
+            if self.journal:
+                self.journal.complete(unit.repo_name, unit.term, SKIPPED)
+            self._finish_unit(unit, stats)
+            return
+
+        try:
+            scraper = ScrapterFactory.get_scraper(unit.scraper_key)
+            search_options = {}
+            if self.incremental:
+                # Busca do mais recente para o mais antigo, parando no conteúdo já conhecido
+                scraper.newest_first = True
+                search_options = {
+                    'known_links': self.incremental.known_links,
+                    'stop_link': self.incremental.stop_link(unit.repo_name, unit.term),
+                }
+                if scraper.harvests_by_datestamp:
+                    search_options['from_date'] = self.incremental.from_date(unit.repo_name, unit.term)
+
+            if sink is not None:
+                if unit.terms:
+                    items = scraper.iter_search_batch(unit.terms, max_pages, **search_options)
+                else:
+                    items = scraper.iter_search(unit.term, max_pages, **search_options)
+                self._stream_unit(unit, items, sink)
+            else:
+                if unit.terms:
+                    # O termo de cada resultado já foi atribuído localmente
+                    results = scraper.search_batch(unit.terms, max_pages, **search_options)
+                else:
+                    results = scraper.search(unit.term, max_pages, **search_options)
+
+                if self.incremental:
+                    self.incremental.marks.update(unit.repo_name, unit.term, results)
+
+                # Add metadata
+                unit.results = set_source(results, unit.repo_name, unit.term)
+                unit.count = len(results)
+
+            if unit.count:
+                print(f"   ✅ {unit.repo_name} / '{unit.term}': {unit.count} resultados encontrados")
+            else:
+                print(f"   ⚠️ {unit.repo_name} / '{unit.term}': nenhum resultado")
+
+        except StreamCancelled:
+            unit.skipped = True
+
+        except FetchError as e:
+            # Mantém o que já foi coletado antes da falha (no streaming, já entregue)
+            if sink is None:
+                unit.results = set_source(e.partial_results, unit.repo_name, unit.term)
+                unit.count = len(unit.results)
+
+            if isinstance(e, CircuitOpenError):
+                self.transport.circuit_breaker.record_skip(unit.host)
+                unit.skipped = True
+                print(f"   ⏭️ {unit.repo_name} / '{unit.term}': interrompido (circuito aberto)")
+            else:
+                unit.error = str(e)
+                print(f"   ❌ Falha de rede em {unit.repo_name} para '{unit.term}': {e}")
+
+        except Exception as e:
+            unit.error = str(e)
+            print(f"   ❌ Erro no scraper {unit.repo_name} para '{unit.term}': {e}")
+
+        if self.journal:
+            self._checkpoint_unit(unit, sink)
+        self._finish_unit(unit, stats)
+
+    def _finish_unit(self, unit, stats):
+        """Acrescenta o resultado da unidade às estatísticas do repositório"""
+        finished = time.perf_counter()
+        with self._lock:
+            stats['terms'] += 1
+            stats['skipped'] += 1 if unit.skipped else 0
+            stats['results'] += unit.count
+            stats['errors'] += 1 if unit.error else 0
+            stats['finished_at'] = max(stats['finished_at'] or finished, finished)
+
+    def _checkpoint_unit(self, unit, sink=None):
+        """Registra a unidade no diário (no streaming, os blocos já foram gravados)"""
+        if unit.error:
+            status = FAILED
+        elif unit.skipped:
+            status = SKIPPED
+        else:
+            status = DONE
+            if sink is None:
+                self.journal.add(unit.repo_name, unit.term, unit.results)
+        self.journal.complete(unit.repo_name, unit.term, status, unit.count, unit.error)
+
+    def _resume_unit(self, unit, records, sink=None):
+        """Entrega os resultados de uma unidade concluída antes da interrupção"""
+        unit.resumed = True
+        try:
+            if sink is not None:
+                for start in range(0, len(records), self.stream_batch_size):
+                    sink(records[start:start + self.stream_batch_size])
+            else:
+                unit.results = records
+            unit.count = len(records)
+        except StreamCancelled:
+            unit.skipped = True
+            return
+
+        if self.incremental:
+            self.incremental.marks.update(unit.repo_name, unit.term, records)
+        print(f"   ♻️ {unit.repo_name} / '{unit.term}': {unit.count} resultados relidos do diário")
+
+    def _stream_unit(self, unit, items, sink):
+        """Entrega os resultados de uma unidade em blocos, com a fonte e o termo atribuídos"""
+        batch = []
+        newest = None
+        latest = None
+
+        def flush():
+            # O bloco é esvaziado antes da entrega (sink pode interromper a busca)
+            delivered = set_source(batch[:], unit.repo_name, unit.term)
+            batch.clear()
+            if self.journal:
+                self.journal.add(unit.repo_name, unit.term, delivered)
+            sink(delivered)
+            unit.count += len(delivered)
+
+        try:
+            for item in items:
+                if newest is None:
+                    newest = item
+                datestamp = item.get("datestamp")
+                if datestamp and (latest is None or datestamp > latest.get("datestamp")):
+                    latest = item
+                batch.append(item)
+                if len(batch) >= self.stream_batch_size:
+                    flush()
+        finally:
+            if batch:
+                flush()
+
+        if self.incremental and newest is not None:
+            # O primeiro resultado e o de maior datestamp bastam para as marcas
+            sample = [newest] + ([latest] if latest is not None and latest is not newest else [])
+            self.incremental.marks.update(unit.repo_name, unit.term, sample)
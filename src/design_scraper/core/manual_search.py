@@ -4,11 +4,13 @@ Este módulo gerencia as operações de busca manual independente da interface S
 """
 
 import pandas as pd
-import tempfile
-import os
 from ..utils.scrapers_factory import ScrapterFactory
-from ..utils.data_transformer import transform_search_results
-from ..utils.deduplication import run_deduplication
+from ..scrapers.parser_engine import configure_parser_engine
+from ..scrapers.publication import publications_to_frame, set_source
+from ..scrapers.transport import configure_transport
+from ..utils.data_transformer import transform_records
+from ..utils.deduplication import deduplicate_records
+from ..utils.link_index import DEFAULT_INDEX_PATH
 
 
 class ManualSearch:
@@ -17,6 +19,9 @@ class ManualSearch:
     def __init__(self, config_path="src/design_scraper/config/manual_search_config.yaml"):
         self.config_path = config_path
         self.config = self._load_config()
+        # Transporte (e cache HTTP) compartilhado entre buscas do mesmo processo
+        self.transport = configure_transport(self.config, replace=False)
+        self.parser = configure_parser_engine(self.config)
     
     def _load_config(self):
         """Carrega configuração para busca manual"""
@@ -72,10 +77,7 @@ class ManualSearch:
                 
                 if results:
                     # Add metadata
-                    for r in results:
-                        r["fonte"] = repo_name
-                        r["termo"] = term
-                    all_results.extend(results)
+                    all_results.extend(set_source(results, repo_name, term))
                     scraping_stats[repo_name] = len(results)
                 else:
                     scraping_stats[repo_name] = 0
@@ -91,7 +93,7 @@ class ManualSearch:
             }
         
         # Step 2: Retorna resultados brutos sem processamento
-        results_df = pd.DataFrame(all_results)
+        results_df = publications_to_frame(all_results)
         
         # Prepare results
         return {
@@ -143,10 +145,7 @@ class ManualSearch:
                 
                 if results:
                     # Add metadata
-                    for r in results:
-                        r["fonte"] = repo_name
-                        r["termo"] = term
-                    all_results.extend(results)
+                    all_results.extend(set_source(results, repo_name, term))
                     scraping_stats[repo_name] = len(results)
                 else:
                     scraping_stats[repo_name] = 0
@@ -162,24 +161,11 @@ class ManualSearch:
             }
         
         # Step 2: Data transformation and filtering
-        results_df = pd.DataFrame(all_results)
+        results_df = publications_to_frame(all_results)
         
         if apply_filters:
-            # Create temporary file for raw results
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as tmp_file:
-                results_df.to_csv(tmp_file.name, index=False)
-                tmp_raw_path = tmp_file.name
-            
-            # Create temporary file for filtered results
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as tmp_file:
-                tmp_filtered_path = tmp_file.name
-            
-            # Transform and filter
-            filtered_df = transform_search_results(tmp_raw_path, tmp_filtered_path)
-            
-            # Clean up temp files
-            os.unlink(tmp_raw_path)
-            os.unlink(tmp_filtered_path)
+            # Transform and filter in memory
+            filtered_df = transform_records(results_df)
             
             if filtered_df.empty:
                 return {
@@ -193,27 +179,14 @@ class ManualSearch:
         
         # Step 3: Deduplication (optional)
         if run_dedup and not results_df.empty:
-            # Create temporary file for results
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as tmp_file:
-                results_df.to_csv(tmp_file.name, index=False)
-                tmp_results_path = tmp_file.name
-            
-            # Create temporary file for new records
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as tmp_file:
-                tmp_new_records_path = tmp_file.name
-            
-            # Run deduplication
-            new_records = run_deduplication(
-                filtered_results_path=tmp_results_path,
-                base_db_path="data/raw/base_database.csv",
-                output_path=tmp_new_records_path
+            # Base de dados carregada uma vez por processo (recarregada quando o arquivo muda)
+            dedup_config = self.config.get("manual_search", {}).get("deduplication", {})
+            results_df = deduplicate_records(
+                results_df,
+                base_db_path=dedup_config.get("base_database", "data/raw/base_database.csv"),
+                index_path=dedup_config.get("index_path", DEFAULT_INDEX_PATH),
+                near_duplicates=dedup_config.get("near_duplicates")
             )
-            
-            # Clean up temp files
-            os.unlink(tmp_results_path)
-            os.unlink(tmp_new_records_path)
-            
-            results_df = new_records
         
         # Prepare results
         return {
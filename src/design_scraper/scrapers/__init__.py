@@ -3,21 +3,42 @@ Scrapers for various design publication sources.
 """
 
 from .base_scraper import BaseScraper
+from .publication import Publication, publications_to_frame
+from .parse_pool import ParsePool, configure_parse_pool, get_parse_pool
+from .parser_engine import ParserEngine, configure_parser_engine, get_parser_engine
+from .transport import HTTPTransport, configure_transport, get_transport
 from .arcosdesign_scraper import ArcosDesignScraper
 from .designetecnologia_scraper import DesigneTecnologiaScraper
 from .educacaografica_scraper import EducacaoGraficaScraper
 from .estudosemdesign_scraper import EstudosEmDesignScraper
 from .humanfactorsindesign_scraper import HumanFactorsinDesignScraper
 from .infodesign_scraper import InfoDesignScraper
+from .oai_pmh_scraper import OAIPMHScraper
+from .ojs_scraper import OJSScraper
+from .poliedro_scraper import PoliedroScraper
 from .triades_scraper import TriadesScraper
 
 __all__ = [
     "BaseScraper",
+    "HTTPTransport",
+    "Publication",
+    "publications_to_frame",
+    "ParsePool",
+    "configure_parse_pool",
+    "get_parse_pool",
+    "ParserEngine",
+    "configure_parser_engine",
+    "get_parser_engine",
+    "configure_transport",
+    "get_transport",
     "ArcosDesignScraper",
     "DesigneTecnologiaScraper",
     "EducacaoGraficaScraper",
     "EstudosEmDesignScraper",
     "HumanFactorsinDesignScraper",
     "InfoDesignScraper",
+    "OAIPMHScraper",
+    "OJSScraper",
+    "PoliedroScraper",
     "TriadesScraper",
 ]
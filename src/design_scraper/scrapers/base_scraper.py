@@ -1,10 +1,328 @@
+import re
 from abc import ABC, abstractmethod
 
+from .fetch_policy import FetchError
+from .http_cache import normalize_link, normalize_url
+from .parse_pool import get_parse_pool
+from .parser_engine import get_parser_engine
+from .term_matching import batch_terms, build_or_query, match_terms
+from .transport import get_transport
+
+# "Itens 1 - 25 de 40" (OJS 2) / "1 - 20 de 40 itens" (OJS 3)
+ITEMS_RANGE_PATTERN = re.compile(
+    r"(?:itens|items)?\s*(\d+)\s*-\s*(\d+)\s+(?:de|of)\s+(\d+)\s*(?:itens|items)?",
+    re.IGNORECASE,
+)
+# "Página 2 de 5" / "Page 2 of 5"
+PAGE_OF_PATTERN = re.compile(r"(?:página|pagina|page)\s+(\d+)\s+(?:de|of)\s+(\d+)", re.IGNORECASE)
+# Links numerados de paginação (OJS: searchPage=N, WordPress: /page/N/ ou paged=N)
+PAGE_LINK_PATTERN = re.compile(r"(?:searchPage=|paged=|/page/)(\d+)")
+
+PAGINATION_SELECTOR = "div.cmp_pagination, .pagination, .nav-links, table.listing"
+NEXT_LINK_SELECTOR = "a.next, a[rel~=next]"
+
+# Próxima página não buscada antecipadamente (fila do pool de parsing cheia)
+_NOT_FETCHED = object()
+
+
+class _LocalPage:
+    """Página extraída na própria thread de busca, quando é consumida"""
+
+    def __init__(self, scraper, content, page):
+        self.scraper = scraper
+        self.content = content
+        self.page = page
+
+    def result(self):
+        return self.scraper.extract_page(self.content, self.page)
+
+    def cancel(self):
+        pass
+
+
+class _FailedPage:
+    """Página cuja busca falhou: a falha só é relatada quando chega a sua vez"""
+
+    def __init__(self, page, status_code=None, error=None):
+        self.page = page
+        self.status_code = status_code
+        self.error = error
+
+    def result(self):
+        if self.error is not None:
+            raise self.error
+        print(f"Erro ao acessar a página {self.page}: {self.status_code}")
+        return [], False
+
+    def cancel(self):
+        pass
+
+
 class BaseScraper(ABC):
-    def __init__(self, base_url):
+    # Repositórios cuja busca aceita o operador booleano OR (OJS)
+    supports_or_queries = False
+    # Parâmetros de URL que ordenam a busca do mais recente para o mais antigo
+    newest_first_params = None
+    # Scrapers que colhem incrementalmente por datestamp (OAI-PMH) em vez de paginar
+    harvests_by_datestamp = False
+    # Contêineres de resultados e de paginação: apenas eles são construídos no
+    # parsing (classes CSS como ".search_results" ou tags como "article");
+    # None faz o parsing da página inteira
+    result_containers = None
+
+    def __init__(self, base_url, transport=None, parser=None):
         self.base_url = base_url
+        self.transport = transport
+        self.parser = parser
+        self.newest_first = False
+
+    def fetch(self, url):
+        """Obtém uma página através do transporte HTTP compartilhado"""
+        transport = self.transport or get_transport()
+        return transport.get(url)
+
+    def parse(self, content):
+        """Faz o parsing de uma página restrito aos contêineres do scraper"""
+        parser = self.parser or get_parser_engine()
+        return parser.parse(content, self.result_containers)
+
+    def extract_page(self, content, page):
+        """
+        Faz o parsing de uma página de resultados
+
+        Returns:
+            tuple: (itens extraídos, se há próxima página)
+        """
+        soup = self.parse(content)
+        return self.parse_results(soup), self.has_next_page(soup, page)
+
+    def parse_page(self, content, page):
+        """Extrai a página no pool de parsing, se configurado, ou na própria thread"""
+        pool = get_parse_pool()
+        if pool is not None and self.parser is None:
+            return pool.parse(self, content, page)
+        return self.extract_page(content, page)
+
+    def parse_spec(self):
+        """Classe e argumentos para recriar o scraper em um processo de parsing"""
+        return type(self), {"base_url": self.base_url}
+
+    def search(self, term, max_pages, known_links=None, stop_link=None):
+        """
+        Busca o termo e retorna todos os resultados em uma lista (ver iter_search)
+
+        Raises:
+            FetchError: com os resultados obtidos até a falha em `partial_results`
+        """
+        return self._collect(
+            self.iter_search(term, max_pages, known_links=known_links, stop_link=stop_link)
+        )
+
+    @staticmethod
+    def _collect(items):
+        """Lista os itens de um gerador; em FetchError, anexa os já obtidos à exceção"""
+        results = []
+        try:
+            for item in items:
+                results.append(item)
+        except FetchError as e:
+            e.partial_results = results
+            raise
+        return results
+
+    def iter_search(self, term, max_pages, known_links=None, stop_link=None):
+        """
+        Busca o termo paginando até a última página real de resultados
+
+        Gerador: os itens de cada página são entregues assim que ela é extraída.
+
+        A paginação para quando a página vem vazia, quando repete apenas itens já
+        vistos, quando a marcação de paginação indica a última página ou quando
+        a URL da próxima página já foi buscada.
+
+        No modo incremental (busca ordenada por data), também para quando todos
+        os links da página já são conhecidos (`known_links`, normalizados com
+        normalize_link) ou quando a página alcança o resultado mais recente da
+        execução anterior (`stop_link`). Os links são comparados normalizados.
+
+        Com o pool de parsing, a página seguinte é buscada enquanto a atual está
+        no parsing (se houver lugar na fila); se a paginação parar na atual, a
+        página buscada à frente é descartada.
+
+        Raises:
+            FetchError: na falha de uma requisição (os itens já entregues permanecem válidos)
+        """
+        pool = get_parse_pool() if self.parser is None else None
+        stop_link = normalize_link(stop_link) if stop_link else None
+        fetched_urls = set()
+        seen_items = set()
+
+        current = self._request_page(term, 1, max_pages, fetched_urls, pool)
+        try:
+            while current is not None:
+                page, pending = current
+                current = _NOT_FETCHED
+                if pool is not None:
+                    current = self._request_page(term, page + 1, max_pages, fetched_urls, pool,
+                                                 block=False)
+
+                items, has_next = pending.result()
+                if not items:
+                    break
+
+                item_keys = {self.item_key(item) for item in items}
+                if item_keys <= seen_items:
+                    break
+                seen_items |= item_keys
+
+                yield from items
+
+                if known_links is not None or stop_link:
+                    links = {normalize_link(item.link) for item in items}
+                    if stop_link in links:
+                        break
+                    if known_links is not None and links <= known_links:
+                        break
+
+                if not has_next:
+                    break
+
+                if current is _NOT_FETCHED:
+                    current = self._request_page(term, page + 1, max_pages, fetched_urls, pool)
+        finally:
+            if current is not None and current is not _NOT_FETCHED:
+                current[1].cancel()
+
+    def _request_page(self, term, page, max_pages, fetched_urls, pool, block=True):
+        """
+        Busca uma página e a envia ao parsing
+
+        Returns:
+            tuple | None: (página, resultado pendente), None se não há mais páginas
+                a buscar ou _NOT_FETCHED se a fila do pool está cheia e block=False
+        """
+        if page > max_pages:
+            return None
+        url = self.build_url(term, page)
+        if self.newest_first and self.newest_first_params:
+            url = self.sort_newest_first(url)
+        url_key = normalize_url(url)
+        if url_key in fetched_urls:
+            return None
+
+        if pool is not None and not pool.reserve(block=block):
+            return _NOT_FETCHED
+        fetched_urls.add(url_key)
+
+        try:
+            response = self.fetch(url)
+        except FetchError as e:
+            if pool is not None:
+                pool.release()
+            return page, _FailedPage(page, error=e)
+        except BaseException:
+            if pool is not None:
+                pool.release()
+            raise
+
+        if response.status_code != 200:
+            if pool is not None:
+                pool.release()
+            return page, _FailedPage(page, status_code=response.status_code)
+        if pool is None:
+            return page, _LocalPage(self, response.content, page)
+        try:
+            return page, pool.submit(self, response.content, page)
+        except BaseException:
+            pool.release()
+            raise
+
+    def batch_queries(self, terms, max_query_length=200):
+        """Agrupa os termos em consultas OR (um termo por grupo se o repositório não suportar OR)"""
+        if not self.supports_or_queries:
+            return [[term] for term in terms]
+        return batch_terms(terms, max_query_length)
+
+    def sort_newest_first(self, url):
+        """Substitui (ou adiciona) na URL os parâmetros de ordenação por data"""
+        base, hash_sign, fragment = url.partition("#")
+        for name, value in self.newest_first_params.items():
+            pattern = re.compile(rf"([?&]){name}=[^&]*")
+            if pattern.search(base):
+                base = pattern.sub(rf"\g<1>{name}={value}", base, count=1)
+            else:
+                base += f"{'&' if '?' in base else '?'}{name}={value}"
+        return f"{base}{hash_sign}{fragment}"
+
+    def search_batch(self, terms, max_pages, **search_options):
+        """
+        Executa uma única consulta OR para um grupo de termos
+
+        Cada resultado recebe em 'termo' os termos do grupo encontrados no título;
+        resultados que casam com vários termos são repetidos, um por termo, como
+        aconteceria em buscas separadas. Resultados cujo título não contém nenhum
+        dos termos (casaram pelo resumo ou texto completo) recebem a consulta OR.
+
+        Raises:
+            FetchError: com os resultados obtidos até a falha em `partial_results`
+        """
+        return self._collect(self.iter_search_batch(terms, max_pages, **search_options))
+
+    def iter_search_batch(self, terms, max_pages, **search_options):
+        """Gerador equivalente a search_batch (resultados entregues página a página)"""
+        query = build_or_query(terms)
+
+        for item in self.iter_search(query, max_pages, **search_options):
+            matched = match_terms(item.title or "", terms) or [query]
+            for term in matched:
+                yield item.replace(termo=term)
 
     @abstractmethod
-    def search(self, term, max_pages):
-        
+    def build_url(self, term, page):
+        """Monta a URL de busca para o termo e a página (a partir de 1)"""
         pass
+
+    @abstractmethod
+    def parse_results(self, soup):
+        """Extrai os itens (Publication) de uma página de resultados"""
+        pass
+
+    @staticmethod
+    def item_key(item):
+        """Identifica um item para detectar páginas repetidas"""
+        link = item.link
+        if link and link != "Sem URL":
+            return link
+        return tuple(item.values())
+
+    def has_next_page(self, soup, page):
+        """
+        Verifica, pela marcação de paginação, se existe uma página após a atual
+
+        Quando a página não traz nenhuma marcação reconhecível, assume que pode
+        haver mais resultados (a busca então para na primeira página vazia).
+        """
+        if soup.select_one(NEXT_LINK_SELECTOR):
+            return True
+
+        containers = soup.select(PAGINATION_SELECTOR)
+        text = " ".join(c.get_text(" ", strip=True) for c in containers)
+
+        match = ITEMS_RANGE_PATTERN.search(text)
+        if match:
+            last_item, total = int(match.group(2)), int(match.group(3))
+            return last_item < total
+
+        match = PAGE_OF_PATTERN.search(text)
+        if match:
+            return int(match.group(1)) < int(match.group(2))
+
+        page_numbers = []
+        for link in soup.find_all("a", href=True):
+            found = PAGE_LINK_PATTERN.search(link["href"])
+            if found:
+                page_numbers.append(int(found.group(1)))
+        if page_numbers:
+            return max(page_numbers) > page
+
+        return True
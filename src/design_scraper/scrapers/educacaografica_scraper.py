@@ -1,37 +1,29 @@
-from bs4 import BeautifulSoup
-import requests
 from .base_scraper import BaseScraper
+from .publication import Publication
 
 class EducacaoGraficaScraper(BaseScraper):
-    def search(self, term, max_pages):
-        results = []
+    newest_first_params = {"orderby": "date", "order": "desc"}
+    result_containers = ("article", "nav")
 
-        for page in range(max_pages):
-            url = f"{self.base_url}?s={term}"
-            response = requests.get(url)
+    def build_url(self, term, page):
+        # WordPress: a primeira página não leva o parâmetro de paginação
+        if page == 1:
+            return f"{self.base_url}?s={term}"
+        return f"{self.base_url}?s={term}&paged={page}"
 
-            if response.status_code == 200:
-                soup = BeautifulSoup(response.content, "html.parser")
+    def parse_results(self, soup):
+        results = []
 
-                for item in soup.select("article"):
-                    title_tag = item.find("h1", class_="entry-title")
-                    author_tag = item.find("p", class_="author")
-                    date_tag = item.find("p", class_="date")
+        for item in soup.select("article"):
+            title_tag = item.find("h1", class_="entry-title")
+            author_tag = item.find("p", class_="author")
+            date_tag = item.find("p", class_="date")
 
-                    title = title_tag.get_text(strip=True) if title_tag else "Sem título"
-                    author = author_tag.get_text(strip=True) if author_tag else "Autor desconhecido"
-                    link = title_tag.find("a")["href"] if title_tag and title_tag.find("a") else "Sem URL"
-                    date = date_tag.get_text(strip=True) if date_tag else "Data não informada"
+            title = title_tag.get_text(strip=True) if title_tag else "Sem título"
+            author = author_tag.get_text(strip=True) if author_tag else "Autor desconhecido"
+            link = title_tag.find("a")["href"] if title_tag and title_tag.find("a") else "Sem URL"
+            date = date_tag.get_text(strip=True) if date_tag else "Data não informada"
 
-                    results.append({
-                        "title": title,
-                        "author": author,
-                        "link": link,
-                        "date": date,
-                    })
-            
-            else:
-                print(f"Errro ao acessar a página {page + 1}: {response.status_code}")
-                break
+            results.append(Publication(title=title, author=author, link=link, date=date))
 
         return results
@@ -0,0 +1,116 @@
+"""
+Política de requisições dos scrapers: novas tentativas com backoff exponencial
+e jitter para falhas transitórias (5xx, 429, erros de conexão e timeouts) e um
+circuit breaker por repositório, que abre após N falhas consecutivas e faz o
+restante da execução pular aquele servidor.
+"""
+
+import random
+import threading
+
+
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+
+class FetchError(Exception):
+    """Falha definitiva ao obter uma página, após esgotar as novas tentativas"""
+
+    def __init__(self, message, url=None, response=None):
+        super().__init__(message)
+        self.url = url
+        # Última resposta recebida (5xx/429), se a falha não foi de conexão
+        self.response = response
+        self.partial_results = []
+
+
+class CircuitOpenError(FetchError):
+    """O circuito do repositório está aberto: a requisição nem foi enviada"""
+
+
+class RetryPolicy:
+    """Define quantas novas tentativas fazer e quanto esperar entre elas"""
+
+    def __init__(self, max_retries=3, backoff_base=1.0, backoff_max=30.0,
+                 retry_statuses=RETRY_STATUSES):
+        self.max_retries = max(int(max_retries), 0)
+        self.backoff_base = float(backoff_base)
+        self.backoff_max = float(backoff_max)
+        self.retry_statuses = tuple(retry_statuses)
+
+    @classmethod
+    def from_config(cls, config):
+        """Cria a política a partir da seção 'retry' da configuração"""
+        retry_config = config.get("retry", {}) or {}
+        return cls(
+            max_retries=retry_config.get("max_retries", 3),
+            backoff_base=retry_config.get("backoff_base", 1.0),
+            backoff_max=retry_config.get("backoff_max", 30.0),
+            retry_statuses=retry_config.get("retry_statuses", RETRY_STATUSES),
+        )
+
+    def should_retry(self, status_code):
+        return status_code in self.retry_statuses
+
+    def backoff(self, attempt, retry_after=None):
+        """Tempo de espera antes da tentativa seguinte (full jitter, respeita Retry-After)"""
+        if retry_after is not None:
+            try:
+                return min(float(retry_after), self.backoff_max)
+            except (TypeError, ValueError):
+                pass
+        ceiling = min(self.backoff_max, self.backoff_base * (2 ** attempt))
+        return random.uniform(0, ceiling)
+
+
+class CircuitBreaker:
+    """Circuit breaker por repositório (um servidor por repositório)"""
+
+    def __init__(self, failure_threshold=5):
+        self.failure_threshold = max(int(failure_threshold), 1)
+        self._failures = {}
+        self._open = set()
+        self._skipped = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, config):
+        """Cria o circuit breaker a partir da seção 'circuit_breaker' da configuração"""
+        breaker_config = config.get("circuit_breaker", {}) or {}
+        return cls(failure_threshold=breaker_config.get("failure_threshold", 5))
+
+    def is_open(self, key):
+        with self._lock:
+            return key in self._open
+
+    def record_success(self, key):
+        with self._lock:
+            if key not in self._open:
+                self._failures[key] = 0
+
+    def record_failure(self, key):
+        """Registra uma falha; retorna True se o circuito abriu agora"""
+        with self._lock:
+            self._failures[key] = self._failures.get(key, 0) + 1
+            if key not in self._open and self._failures[key] >= self.failure_threshold:
+                self._open.add(key)
+                return True
+            return False
+
+    def record_skip(self, key):
+        with self._lock:
+            self._skipped[key] = self._skipped.get(key, 0) + 1
+
+    def reset(self):
+        with self._lock:
+            self._failures.clear()
+            self._open.clear()
+            self._skipped.clear()
+
+    def state(self, key):
+        """Estado do circuito de um repositório"""
+        with self._lock:
+            return {
+                'open': key in self._open,
+                'consecutive_failures': self._failures.get(key, 0),
+                'skipped': self._skipped.get(key, 0),
+            }
@@ -0,0 +1,265 @@
+"""
+Cache persistente de respostas HTTP para os scrapers.
+Armazena o corpo das páginas em disco, indexado pela URL normalizada, com TTL
+configurável, remoção LRU limitada por tamanho e revalidação condicional via
+ETag/Last-Modified.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from urllib.parse import parse_qsl, urlencode, urlparse, urlunparse
+
+import pandas as pd
+import requests
+from requests.structures import CaseInsensitiveDict
+
+
+# Cabeçalhos preservados junto com o corpo da resposta
+STORED_HEADERS = ("Content-Type", "ETag", "Last-Modified")
+
+
+def normalize_url(url):
+    """Normaliza a URL para uso como chave (esquema/host em minúsculas, query ordenada, sem fragmento)"""
+    parsed = urlparse(url)
+    query = urlencode(sorted(parse_qsl(parsed.query, keep_blank_values=True)))
+    return urlunparse((
+        parsed.scheme.lower(),
+        parsed.netloc.lower(),
+        parsed.path or "/",
+        parsed.params,
+        query,
+        "",
+    ))
+
+
+def normalize_link(link):
+    """Normaliza um link para comparação (URLs: host em minúsculas, sem fragmento nem barra final)"""
+    if link is None or pd.isna(link):
+        return None
+    link = str(link).strip()
+    if not link.lower().startswith(("http://", "https://")):
+        return link
+    normalized = normalize_url(link)
+    base, _, query = normalized.partition("?")
+    base = base.rstrip("/") if base.count("/") > 3 else base
+    return f"{base}?{query}" if query else base
+
+
+class CacheEntry:
+    """Resposta armazenada no cache"""
+
+    def __init__(self, key, meta, body_path):
+        self.key = key
+        self.meta = meta
+        self.body_path = body_path
+
+    @property
+    def etag(self):
+        return self.meta["headers"].get("ETag")
+
+    @property
+    def last_modified(self):
+        return self.meta["headers"].get("Last-Modified")
+
+    def is_fresh(self, ttl_seconds):
+        """Indica se a entrada ainda está dentro do TTL"""
+        if ttl_seconds is None:
+            return True
+        return time.time() - self.meta["stored_at"] < ttl_seconds
+
+    def to_response(self):
+        """Reconstrói um requests.Response a partir da entrada"""
+        with open(self.body_path, "rb") as f:
+            content = f.read()
+
+        response = requests.Response()
+        response.status_code = self.meta["status_code"]
+        response.url = self.meta["url"]
+        response.headers = CaseInsensitiveDict(self.meta["headers"])
+        response.encoding = self.meta.get("encoding")
+        response._content = content
+        response.from_cache = True
+        return response
+
+
+class ResponseCache:
+    """Cache de respostas em disco com TTL e remoção LRU por tamanho"""
+
+    def __init__(self, directory="data/cache/http", ttl_seconds=86400, max_size_mb=200):
+        self.directory = directory
+        self.ttl_seconds = ttl_seconds
+        self.max_size_bytes = int(max_size_mb * 1024 * 1024)
+        self._lock = threading.Lock()
+        self._total_size = None
+
+    @classmethod
+    def from_config(cls, cache_config):
+        """Cria o cache a partir da seção 'http_cache' da configuração"""
+        return cls(
+            directory=cache_config.get("directory", "data/cache/http"),
+            ttl_seconds=cache_config.get("ttl_seconds", 86400),
+            max_size_mb=cache_config.get("max_size_mb", 200),
+        )
+
+    def _paths(self, key):
+        folder = os.path.join(self.directory, key[:2])
+        return os.path.join(folder, f"{key}.json"), os.path.join(folder, f"{key}.body")
+
+    @staticmethod
+    def key_for(url):
+        return hashlib.sha256(normalize_url(url).encode("utf-8")).hexdigest()
+
+    def lookup(self, url):
+        """Retorna a entrada armazenada para a URL, ou None"""
+        key = self.key_for(url)
+        meta_path, body_path = self._paths(key)
+
+        try:
+            with open(meta_path, "r", encoding="utf-8") as f:
+                meta = json.load(f)
+        except (FileNotFoundError, ValueError):
+            return None
+
+        if not os.path.exists(body_path):
+            return None
+
+        # Marca o acesso para a política LRU
+        now = time.time()
+        try:
+            os.utime(meta_path, (now, now))
+        except OSError:
+            pass
+
+        return CacheEntry(key, meta, body_path)
+
+    def store(self, url, response):
+        """Armazena uma resposta 200 no cache"""
+        key = self.key_for(url)
+        meta_path, body_path = self._paths(key)
+        os.makedirs(os.path.dirname(meta_path), exist_ok=True)
+
+        meta = {
+            "url": url,
+            "status_code": response.status_code,
+            "headers": {
+                name: response.headers[name]
+                for name in STORED_HEADERS
+                if name in response.headers
+            },
+            "encoding": response.encoding,
+            "stored_at": time.time(),
+        }
+
+        # O tamanho total é lido do disco antes da escrita: depois dela, a
+        # varredura já contaria a entrada nova, somada de novo abaixo
+        self._current_size()
+        previous_size = self._entry_size(meta_path, body_path)
+        content = response.content
+
+        # Escrita atômica: arquivos temporários substituídos via os.replace
+        tmp_body = f"{body_path}.{threading.get_ident()}.tmp"
+        with open(tmp_body, "wb") as f:
+            f.write(content)
+        os.replace(tmp_body, body_path)
+
+        tmp_meta = f"{meta_path}.{threading.get_ident()}.tmp"
+        with open(tmp_meta, "w", encoding="utf-8") as f:
+            json.dump(meta, f)
+        os.replace(tmp_meta, meta_path)
+
+        new_size = self._entry_size(meta_path, body_path)
+        self._adjust_size(new_size - previous_size)
+        self.evict()
+
+    def refresh(self, entry, response=None):
+        """Renova o TTL de uma entrada revalidada com 304 Not Modified"""
+        entry.meta["stored_at"] = time.time()
+        if response is not None:
+            for name in STORED_HEADERS[1:]:
+                if name in response.headers:
+                    entry.meta["headers"][name] = response.headers[name]
+
+        meta_path, _ = self._paths(entry.key)
+        tmp_meta = f"{meta_path}.{threading.get_ident()}.tmp"
+        with open(tmp_meta, "w", encoding="utf-8") as f:
+            json.dump(entry.meta, f)
+        os.replace(tmp_meta, meta_path)
+
+    def evict(self):
+        """Remove as entradas menos usadas até o cache caber no limite de tamanho"""
+        if self._current_size() <= self.max_size_bytes:
+            return
+
+        with self._lock:
+            entries = []
+            for meta_path, body_path in self._iter_entries():
+                try:
+                    last_access = os.path.getmtime(meta_path)
+                except OSError:
+                    continue
+                entries.append((last_access, meta_path, body_path))
+
+            entries.sort()
+            total = self._total_size
+            for _, meta_path, body_path in entries:
+                if total <= self.max_size_bytes:
+                    break
+                size = self._entry_size(meta_path, body_path)
+                for path in (meta_path, body_path):
+                    try:
+                        os.remove(path)
+                    except OSError:
+                        pass
+                total -= size
+            self._total_size = total
+
+    def clear(self):
+        """Remove todas as entradas do cache"""
+        with self._lock:
+            for meta_path, body_path in self._iter_entries():
+                for path in (meta_path, body_path):
+                    try:
+                        os.remove(path)
+                    except OSError:
+                        pass
+            self._total_size = 0
+
+    def _iter_entries(self):
+        if not os.path.isdir(self.directory):
+            return
+        for folder in os.listdir(self.directory):
+            folder_path = os.path.join(self.directory, folder)
+            if not os.path.isdir(folder_path):
+                continue
+            for name in os.listdir(folder_path):
+                if name.endswith(".json"):
+                    meta_path = os.path.join(folder_path, name)
+                    yield meta_path, meta_path[:-len(".json")] + ".body"
+
+    @staticmethod
+    def _entry_size(meta_path, body_path):
+        size = 0
+        for path in (meta_path, body_path):
+            try:
+                size += os.path.getsize(path)
+            except OSError:
+                pass
+        return size
+
+    def _current_size(self):
+        with self._lock:
+            if self._total_size is None:
+                self._total_size = sum(
+                    self._entry_size(meta_path, body_path)
+                    for meta_path, body_path in self._iter_entries()
+                )
+            return self._total_size
+
+    def _adjust_size(self, delta):
+        with self._lock:
+            # Sem tamanho conhecido, a próxima varredura do disco já inclui a alteração
+            if self._total_size is not None:
+                self._total_size += delta
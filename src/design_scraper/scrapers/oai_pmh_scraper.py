@@ -0,0 +1,227 @@
+"""
+Scraper baseado em OAI-PMH para os periódicos que rodam OJS.
+Em vez de paginar a busca HTML termo a termo, colhe os metadados Dublin Core
+em lote (ListRecords + resumptionToken) e filtra os termos localmente.
+"""
+
+import re
+import threading
+import time
+import xml.etree.ElementTree as ET
+from io import BytesIO
+from urllib.parse import quote
+
+from .base_scraper import BaseScraper
+from .fetch_policy import FetchError
+from .http_cache import normalize_link
+from .publication import Publication
+from .term_matching import OR_OPERATOR, match_terms
+
+OAI_NS = "{http://www.openarchives.org/OAI/2.0/}"
+DC_NS = "{http://purl.org/dc/elements/1.1/}"
+
+YEAR_PATTERN = re.compile(r"\d{4}")
+
+# Por quanto tempo uma colheita é reaproveitada dentro do mesmo processo
+HARVEST_TTL_SECONDS = 3600
+
+
+class OAIPMHScraper(BaseScraper):
+    supports_or_queries = True
+    # A colheita incremental usa o parâmetro from= (datestamp) do OAI-PMH
+    harvests_by_datestamp = True
+
+    # Colheitas já feitas neste processo: um ListRecords atende a todos os termos
+    _harvests = {}
+    _harvests_lock = threading.Lock()
+
+    def __init__(self, base_url, transport=None, metadata_prefix="oai_dc", set_spec=None):
+        super().__init__(base_url, transport)
+        self.metadata_prefix = metadata_prefix
+        self.set_spec = set_spec
+
+    def build_url(self, term, page, from_date=None):
+        """URL inicial do ListRecords (os termos são filtrados localmente)"""
+        url = f"{self.base_url}?verb=ListRecords&metadataPrefix={self.metadata_prefix}"
+        if self.set_spec:
+            url += f"&set={quote(self.set_spec)}"
+        if from_date:
+            url += f"&from={from_date}"
+        return url
+
+    def resumption_url(self, token):
+        return f"{self.base_url}?verb=ListRecords&resumptionToken={quote(token)}"
+
+    def iter_records(self, max_pages=None, from_date=None):
+        """
+        Percorre o ListRecords seguindo os resumptionTokens
+
+        Args:
+            max_pages: Número máximo de respostas do ListRecords (None = todas)
+            from_date: Datestamp (AAAA-MM-DD) para colheita incremental
+
+        Yields:
+            Publication: um registro por artigo
+
+        Raises:
+            FetchError: se uma resposta do ListRecords não vier com status 200
+        """
+        url = self.build_url(None, 1, from_date)
+        pages = 0
+
+        while url:
+            response = self.fetch(url)
+            if response.status_code != 200:
+                raise FetchError(f"Falha ao acessar {url}: HTTP {response.status_code}", url, response)
+
+            records, token = self.parse_results(response.content)
+            yield from records
+
+            pages += 1
+            if not token or (max_pages is not None and pages >= max_pages):
+                return
+            url = self.resumption_url(token)
+
+    def parse_results(self, content):
+        """
+        Extrai os registros de uma resposta ListRecords
+
+        Returns:
+            tuple: (lista de registros, resumptionToken ou None)
+        """
+        records = []
+        token = None
+
+        for _, element in ET.iterparse(BytesIO(content), events=("end",)):
+            if element.tag == f"{OAI_NS}record":
+                record = self._parse_record(element)
+                if record:
+                    records.append(record)
+                element.clear()
+
+            elif element.tag == f"{OAI_NS}resumptionToken":
+                token = (element.text or "").strip() or None
+
+            elif element.tag == f"{OAI_NS}error":
+                # noRecordsMatch é a resposta normal de uma colheita sem novidades
+                if element.get("code") != "noRecordsMatch":
+                    print(f"Erro OAI-PMH ({element.get('code')}): {(element.text or '').strip()}")
+
+        return records, token
+
+    @staticmethod
+    def _parse_record(element):
+        header = element.find(f"{OAI_NS}header")
+        if header is None or header.get("status") == "deleted":
+            return None
+
+        def values(name):
+            return [
+                (node.text or "").strip()
+                for node in element.iter(f"{DC_NS}{name}")
+                if node.text and node.text.strip()
+            ]
+
+        titles = values("title")
+        creators = values("creator")
+        dates = values("date")
+        identifiers = values("identifier")
+
+        links = [i for i in identifiers if i.startswith("http")]
+        article_links = [i for i in links if "/article/view/" in i]
+        link = (article_links or links or ["Sem URL"])[0]
+
+        date = dates[0] if dates else "Data não informada"
+        year_match = YEAR_PATTERN.search(date)
+
+        return Publication(
+            title=titles[0] if titles else "Sem título",
+            # dc:creator vem como "Sobrenome, Nome"; autores separados por ';'
+            author="; ".join(creators) if creators else "Autor desconhecido",
+            link=link,
+            date=date,
+            year=year_match.group(0) if year_match else "N/A",
+            datestamp=(header.findtext(f"{OAI_NS}datestamp") or "").strip(),
+            subjects="; ".join(values("subject")),
+            description=" ".join(values("description")),
+        )
+
+    def harvest(self, max_pages=None, from_date=None):
+        """Colhe os registros (reaproveitando colheitas idênticas já feitas no processo)"""
+        key = (self.base_url, self.set_spec, max_pages, from_date)
+        with self._harvests_lock:
+            cached = self._harvests.get(key)
+        if cached is not None and time.monotonic() - cached[0] < HARVEST_TTL_SECONDS:
+            return cached[1]
+
+        records = []
+        try:
+            for record in self.iter_records(max_pages, from_date):
+                records.append(record)
+        except FetchError as e:
+            e.partial_results = records
+            raise
+
+        with self._harvests_lock:
+            self._harvests[key] = (time.monotonic(), records)
+        return records
+
+    def batch_queries(self, terms, max_query_length=200):
+        """Todos os termos cabem em um único grupo: a filtragem é local"""
+        return [list(terms)]
+
+    def _harvest_partial(self, max_pages, from_date):
+        """
+        Colhe os registros; em FetchError, retorna os já colhidos junto com a exceção
+
+        A exceção é relançada depois que os registros colhidos foram filtrados,
+        de modo que `partial_results` contenha apenas os resultados do termo.
+        """
+        try:
+            return self.harvest(max_pages, from_date), None
+        except FetchError as e:
+            records, e.partial_results = e.partial_results, []
+            return records, e
+
+    def search(self, term, max_pages=None, known_links=None, stop_link=None, from_date=None):
+        """
+        Retorna os registros cujo título, assuntos ou resumo contêm o termo (ou termos em OR)
+
+        Raises:
+            FetchError: com os resultados do termo colhidos até a falha em `partial_results`
+        """
+        return self._collect(self.iter_search(term, max_pages, known_links, stop_link, from_date))
+
+    def iter_search(self, term, max_pages=None, known_links=None, stop_link=None, from_date=None):
+        terms = [t.strip().strip('"') for t in term.split(OR_OPERATOR)]
+        records, error = self._harvest_partial(max_pages, from_date)
+
+        for record in records:
+            if known_links is not None and normalize_link(record.link) in known_links:
+                continue
+            if match_terms(self._searchable_text(record), terms):
+                yield record.replace()
+
+        if error is not None:
+            raise error
+
+    def search_batch(self, terms, max_pages, **search_options):
+        """Uma única colheita atende a todos os termos; cada termo casado gera uma linha"""
+        return self._collect(self.iter_search_batch(terms, max_pages, **search_options))
+
+    def iter_search_batch(self, terms, max_pages, **search_options):
+        known_links = search_options.get("known_links")
+        records, error = self._harvest_partial(max_pages, search_options.get("from_date"))
+
+        for record in records:
+            if known_links is not None and normalize_link(record.link) in known_links:
+                continue
+            for matched in match_terms(self._searchable_text(record), terms):
+                yield record.replace(termo=matched)
+
+        if error is not None:
+            raise error
+
+    @staticmethod
+    def _searchable_text(record):
+        return f"{record.title} {record['subjects']} {record['description']}"
@@ -0,0 +1,155 @@
+"""
+Scraper único para os periódicos OJS.
+Cada periódico é descrito por um perfil em config/ojs_profiles.yaml (URL de busca,
+versão do OJS e seletores); os seletores são compilados uma única vez por processo
+e reutilizados em todas as páginas e termos.
+"""
+
+import os
+import threading
+from functools import lru_cache
+
+import soupsieve
+import yaml
+
+from .base_scraper import BaseScraper
+from .publication import Publication
+
+PROFILES_PATH = os.path.join(os.path.dirname(__file__), "..", "config", "ojs_profiles.yaml")
+
+DEFAULT_MAX_PAGES = 5
+
+_profiles = {}
+_profiles_lock = threading.Lock()
+
+
+@lru_cache(maxsize=None)
+def compile_selector(selector):
+    """Compila um seletor CSS (uma vez por processo)"""
+    return soupsieve.compile(selector)
+
+
+class FieldSpec:
+    """Regra de extração de um campo do resultado"""
+
+    __slots__ = ("name", "selector", "attr", "next_row", "default")
+
+    def __init__(self, name, selector=None, attr=None, source="item", default="N/A"):
+        if source not in ("item", "next_row"):
+            raise ValueError(f"Origem inválida para o campo '{name}': {source}")
+        self.name = name
+        self.selector = compile_selector(selector) if selector else None
+        self.attr = attr
+        self.next_row = source == "next_row"
+        self.default = default
+
+    def extract(self, item):
+        scope = item.find_next_sibling("tr") if self.next_row else item
+        if scope is None:
+            return self.default
+
+        element = self.selector.select_one(scope) if self.selector else scope
+        if element is None:
+            return self.default
+
+        if self.attr:
+            return element.get(self.attr, self.default)
+        return element.get_text(strip=True)
+
+
+class OJSProfile:
+    """Perfil de um periódico: URL de busca e seletores já compilados"""
+
+    def __init__(self, name, flavor, base_url, url_template, item_selector, fields,
+                 result_containers=None, oai_url=None, max_pages=DEFAULT_MAX_PAGES):
+        self.name = name
+        self.flavor = flavor
+        self.base_url = base_url
+        self.url_template = url_template
+        self.item_selector = compile_selector(item_selector)
+        self.fields = tuple(FieldSpec(field_name, **spec) for field_name, spec in fields.items())
+        self.result_containers = tuple(result_containers) if result_containers else None
+        self.oai_url = oai_url
+        self.max_pages = max_pages
+
+    @classmethod
+    def from_dict(cls, name, data, flavors):
+        """Combina o perfil com os padrões do seu flavor (ojs2/ojs3)"""
+        flavor_name = data.get("flavor", "ojs3")
+        if flavor_name not in flavors:
+            raise ValueError(f"Flavor OJS desconhecido no perfil '{name}': {flavor_name}")
+        flavor = flavors[flavor_name]
+
+        fields = dict(flavor.get("fields", {}))
+        fields.update(data.get("fields", {}))
+
+        return cls(
+            name=name,
+            flavor=flavor_name,
+            base_url=data["base_url"],
+            url_template=data["url_template"],
+            item_selector=data.get("item_selector", flavor.get("item_selector")),
+            fields=fields,
+            result_containers=data.get("result_containers", flavor.get("result_containers")),
+            oai_url=data.get("oai_url"),
+            max_pages=data.get("max_pages", DEFAULT_MAX_PAGES),
+        )
+
+
+def load_ojs_profiles(path=PROFILES_PATH):
+    """Carrega (uma vez por processo) os perfis dos periódicos OJS"""
+    with _profiles_lock:
+        if path not in _profiles:
+            with open(path, "r", encoding="utf-8") as f:
+                data = yaml.safe_load(f)
+            flavors = data.get("flavors", {})
+            _profiles[path] = {
+                name: OJSProfile.from_dict(name, journal, flavors)
+                for name, journal in data.get("journals", {}).items()
+            }
+        return _profiles[path]
+
+
+def get_ojs_profile(name):
+    """Retorna o perfil de um periódico OJS"""
+    profiles = load_ojs_profiles()
+    if name not in profiles:
+        raise ValueError(f"Perfil OJS '{name}' não encontrado.")
+    return profiles[name]
+
+
+class OJSScraper(BaseScraper):
+    supports_or_queries = True
+    newest_first_params = {"orderBy": "publicationDate", "orderDir": "desc"}
+    # Perfil usado pelas subclasses mantidas por compatibilidade
+    profile_name = None
+
+    def __init__(self, base_url=None, transport=None, parser=None, profile=None):
+        if profile is None or isinstance(profile, str):
+            profile = get_ojs_profile(profile or self.profile_name)
+        super().__init__(base_url or profile.base_url, transport, parser)
+        self.profile = profile
+        self.result_containers = profile.result_containers
+
+    def search(self, term, max_pages=None, **options):
+        if max_pages is None:
+            max_pages = self.profile.max_pages
+        return super().search(term, max_pages, **options)
+
+    def iter_search(self, term, max_pages=None, **options):
+        if max_pages is None:
+            max_pages = self.profile.max_pages
+        return super().iter_search(term, max_pages, **options)
+
+    def parse_spec(self):
+        return type(self), {"base_url": self.base_url, "profile": self.profile.name}
+
+    def build_url(self, term, page):
+        return self.profile.url_template.format(base_url=self.base_url, term=term, page=page)
+
+    def parse_results(self, soup):
+        fields = self.profile.fields
+        return [
+            Publication(**{field.name: field.extract(item) for field in fields})
+            for item in self.profile.item_selector.select(soup)
+        ]
@@ -0,0 +1,200 @@
+"""
+Etapa de parsing em processos separados.
+As threads de busca entregam o conteúdo bruto das páginas a um ProcessPoolExecutor
+de parsers, de modo que o BeautifulSoup não disputa o GIL com a espera pela rede.
+Cada busca envia uma página e segue buscando a seguinte enquanto ela está no
+parsing; os resultados são recolhidos na ordem das páginas. O número de páginas
+enviadas e ainda não recolhidas é limitado (backpressure): com a fila cheia, uma
+busca sem página pendente espera por um lugar, e as demais não buscam à frente.
+"""
+
+import multiprocessing
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from pickle import PicklingError
+
+from .parser_engine import configure_parser_engine
+
+DEFAULT_QUEUE_SIZE = 16
+
+# Scrapers já instanciados em cada processo de parsing
+_worker_scrapers = {}
+
+
+def _init_worker(parser_config):
+    configure_parser_engine({"parser": parser_config})
+
+
+def _parse_in_worker(scraper_class, scraper_args, content, page):
+    key = (scraper_class, tuple(sorted(scraper_args.items())))
+    scraper = _worker_scrapers.get(key)
+    if scraper is None:
+        scraper = _worker_scrapers[key] = scraper_class(**scraper_args)
+    return scraper.extract_page(content, page)
+
+
+class ParsedPage:
+    """Página enviada ao pool; o resultado é recolhido por quem a enviou"""
+
+    def __init__(self, pool, scraper, content, page, future):
+        self.pool = pool
+        self.scraper = scraper
+        self.content = content
+        self.page = page
+        self._future = future
+        self._released = False
+
+    def result(self):
+        """
+        Aguarda o parsing e libera o lugar na fila
+
+        Returns:
+            tuple: (itens extraídos, se há próxima página)
+        """
+        try:
+            return self._future.result()
+        except (BrokenProcessPool, PicklingError) as e:
+            print(f"⚠️ Falha no processo de parsing ({e}) - fazendo o parsing localmente")
+            self.pool.record_fallback()
+            return self.scraper.extract_page(self.content, self.page)
+        finally:
+            self._release()
+
+    def cancel(self):
+        """Descarta a página (a paginação parou antes de ela ser necessária)"""
+        self._future.cancel()
+        self._release()
+
+    def _release(self):
+        if not self._released:
+            self._released = True
+            self.pool.release()
+
+
+class ParsePool:
+    """Processos de parsing compartilhados pelas threads de busca"""
+
+    def __init__(self, workers=2, queue_size=DEFAULT_QUEUE_SIZE, parser_config=None):
+        self.workers = max(1, int(workers))
+        self.queue_size = max(1, int(queue_size))
+        self.parser_config = dict(parser_config or {})
+        self._slots = threading.BoundedSemaphore(self.queue_size)
+        self._executor = None
+        self._lock = threading.Lock()
+        self.stats = {"pages": 0, "queue_wait_seconds": 0.0, "local_fallbacks": 0}
+
+    @classmethod
+    def from_config(cls, config):
+        """Cria o pool a partir da seção 'parser'; None quando parser.workers é 0"""
+        parser_config = config.get("parser", {}) or {}
+        workers = parser_config.get("workers", 0)
+        if not workers:
+            return None
+        return cls(
+            workers=workers,
+            queue_size=parser_config.get("queue_size", DEFAULT_QUEUE_SIZE),
+            parser_config=parser_config,
+        )
+
+    def _get_executor(self):
+        with self._lock:
+            if self._executor is None:
+                # spawn: o processo principal já tem threads de rede em execução
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_init_worker,
+                    initargs=(self.parser_config,),
+                )
+            return self._executor
+
+    def reserve(self, block=True):
+        """
+        Reserva um lugar na fila antes de buscar a página a enviar
+
+        Returns:
+            bool: False se a fila está cheia e block=False
+        """
+        if not block:
+            return self._slots.acquire(blocking=False)
+        waited = time.perf_counter()
+        self._slots.acquire()
+        waited = time.perf_counter() - waited
+        with self._lock:
+            self.stats["queue_wait_seconds"] += waited
+        return True
+
+    def release(self):
+        """Libera um lugar reservado (página recolhida, descartada ou não buscada)"""
+        self._slots.release()
+
+    def submit(self, scraper, content, page):
+        """
+        Envia uma página ao parsing em um lugar já reservado, sem esperar o resultado
+
+        Returns:
+            ParsedPage: o resultado é obtido com result(), que libera o lugar
+        """
+        scraper_class, scraper_args = scraper.parse_spec()
+        try:
+            future = self._get_executor().submit(
+                _parse_in_worker, scraper_class, scraper_args, content, page
+            )
+        except (BrokenProcessPool, PicklingError) as e:
+            future = Future()
+            future.set_exception(e)
+        with self._lock:
+            self.stats["pages"] += 1
+        return ParsedPage(self, scraper, content, page, future)
+
+    def parse(self, scraper, content, page):
+        """
+        Faz o parsing de uma página em um processo de parsing e aguarda o resultado
+
+        Returns:
+            tuple: (itens extraídos, se há próxima página)
+        """
+        self.reserve()
+        return self.submit(scraper, content, page).result()
+
+    def record_fallback(self):
+        with self._lock:
+            self.stats["local_fallbacks"] += 1
+
+    def reset_stats(self):
+        with self._lock:
+            self.stats = {"pages": 0, "queue_wait_seconds": 0.0, "local_fallbacks": 0}
+
+    def get_stats(self):
+        with self._lock:
+            return dict(self.stats, workers=self.workers, queue_size=self.queue_size)
+
+    def close(self):
+        """Encerra os processos de parsing"""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown()
+
+
+_default_pool = None
+_default_lock = threading.Lock()
+
+
+def get_parse_pool():
+    """Retorna o pool de parsing do processo (None = parsing nas threads de busca)"""
+    with _default_lock:
+        return _default_pool
+
+
+def configure_parse_pool(config):
+    """Substitui o pool de parsing compartilhado por um configurado a partir do YAML"""
+    global _default_pool
+    pool = ParsePool.from_config(config)
+    with _default_lock:
+        previous, _default_pool = _default_pool, pool
+    if previous is not None:
+        previous.close()
+    return pool
@@ -0,0 +1,114 @@
+"""
+Motor de parsing HTML compartilhado pelos scrapers.
+Permite escolher o parser do BeautifulSoup (lxml por padrão) e restringir a
+árvore aos contêineres de resultados e de paginação, sem construir menus,
+barras laterais e rodapés das páginas.
+"""
+
+import re
+import threading
+
+from bs4 import BeautifulSoup, FeatureNotFound, SoupStrainer
+
+DEFAULT_ENGINE = "lxml"
+FALLBACK_ENGINE = "html.parser"
+# O html5lib ignora parse_only: a página é sempre construída por inteiro
+UNRESTRICTED_ENGINES = {"html5lib"}
+
+
+def engine_available(engine):
+    """Verifica se o parser está instalado"""
+    try:
+        BeautifulSoup("", engine)
+    except FeatureNotFound:
+        return False
+    return True
+
+
+def build_strainer(containers):
+    """
+    Monta o SoupStrainer para uma lista de contêineres
+
+    Args:
+        containers: classes CSS (".search_results") ou nomes de tags ("article");
+            os dois tipos não podem ser misturados
+
+    Returns:
+        SoupStrainer que mantém os contêineres e todo o seu conteúdo
+    """
+    classes = [c[1:] for c in containers if c.startswith(".")]
+    tags = [c for c in containers if not c.startswith(".")]
+
+    if classes and tags:
+        raise ValueError(f"Contêineres devem ser todos classes ou todos tags: {containers}")
+
+    if tags:
+        return SoupStrainer(tags)
+
+    # Durante o parsing o atributo class chega como texto ("search_results foo")
+    pattern = re.compile(r"(?:^|\s)(?:%s)(?:\s|$)" % "|".join(re.escape(c) for c in classes))
+    return SoupStrainer(attrs={"class": pattern})
+
+
+class ParserEngine:
+    """Converte o conteúdo de uma página em uma árvore BeautifulSoup"""
+
+    def __init__(self, engine=DEFAULT_ENGINE, restrict=True):
+        if not engine_available(engine):
+            print(f"⚠️ Parser '{engine}' não instalado - usando '{FALLBACK_ENGINE}'")
+            engine = FALLBACK_ENGINE
+        self.engine = engine
+        self.restrict = restrict and engine not in UNRESTRICTED_ENGINES
+        self._strainers = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, config):
+        """Cria o motor a partir da seção 'parser' da configuração"""
+        parser_config = config.get("parser", {}) or {}
+        return cls(
+            engine=parser_config.get("engine", DEFAULT_ENGINE),
+            restrict=parser_config.get("restrict", True),
+        )
+
+    def strainer_for(self, containers):
+        """Retorna o SoupStrainer (criado uma única vez) para os contêineres"""
+        key = tuple(containers)
+        with self._lock:
+            strainer = self._strainers.get(key)
+            if strainer is None:
+                strainer = self._strainers[key] = build_strainer(key)
+            return strainer
+
+    def parse(self, content, containers=None):
+        """
+        Faz o parsing do conteúdo
+
+        Args:
+            content: HTML (bytes ou texto)
+            containers: contêineres a manter; None constrói a página inteira
+        """
+        parse_only = self.strainer_for(containers) if self.restrict and containers else None
+        return BeautifulSoup(content, self.engine, parse_only=parse_only)
+
+
+_default_engine = None
+_default_lock = threading.Lock()
+
+
+def get_parser_engine():
+    """Retorna o motor de parsing compartilhado do processo"""
+    global _default_engine
+    with _default_lock:
+        if _default_engine is None:
+            _default_engine = ParserEngine()
+        return _default_engine
+
+
+def configure_parser_engine(config):
+    """Substitui o motor de parsing compartilhado por um configurado a partir do YAML"""
+    global _default_engine
+    engine = ParserEngine.from_config(config)
+    with _default_lock:
+        _default_engine = engine
+    return engine
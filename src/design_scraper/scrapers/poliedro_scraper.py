@@ -1,2 +1,6 @@
-#In progress 
-# https://periodicos.ifsul.edu.br/index.php/poliedro/search/index?query=design&dateFromYear=&dateFromMonth=&dateFromDay=&dateToYear=&dateToMonth=&dateToDay=&authors=
+from .ojs_scraper import OJSScraper
+
+class PoliedroScraper(OJSScraper):
+    # Mantido por compatibilidade: o periódico é descrito pelo perfil
+    # "poliedro" em config/ojs_profiles.yaml
+    profile_name = "poliedro"
@@ -0,0 +1,148 @@
+"""
+Registro compacto de um resultado de busca.
+Os scrapers emitem objetos Publication (com __slots__, sem um dict por linha); os
+valores que se repetem entre registros (fonte, termo, datas, edições) são
+internados, e a conversão para DataFrame é feita de uma vez, coluna a coluna.
+"""
+
+import sys
+from operator import attrgetter
+
+import pandas as pd
+
+# Campos comuns a todos os scrapers, na ordem das colunas; "fonte" e "termo"
+# ficam por último, depois dos campos específicos de cada scraper
+FIELDS = ("title", "author", "link", "date", "fonte", "termo")
+_FIELD_SET = frozenset(FIELDS)
+_LEADING_FIELDS = FIELDS[:4]
+_TRAILING_FIELDS = FIELDS[4:]
+
+# Campos específicos com poucos valores distintos (internados)
+INTERNED_EXTRA_FIELDS = frozenset(("year", "edition", "edition_link", "datestamp"))
+
+_NO_EXTRA = {}
+
+
+def _intern(value):
+    return sys.intern(value) if type(value) is str else value
+
+
+class Publication:
+    """
+    Um resultado de busca
+
+    Os campos comuns ocupam slots; os específicos de cada scraper (ex.: year e
+    datestamp do OAI-PMH, edition e pdf_link do OJS 2, campos de um perfil OJS)
+    ficam em `extra`. Campos ausentes valem None e viram células vazias no
+    DataFrame. O acesso por chave (record["title"], record.get("year"))
+    continua disponível.
+    """
+
+    __slots__ = FIELDS + ("extra",)
+
+    def __init__(self, title=None, author=None, link=None, date=None, fonte=None, termo=None, **extra):
+        self.title = title
+        self.author = author
+        self.link = link
+        self.date = _intern(date)
+        self.fonte = _intern(fonte)
+        self.termo = _intern(termo)
+        if extra:
+            for name in INTERNED_EXTRA_FIELDS.intersection(extra):
+                extra[name] = _intern(extra[name])
+            self.extra = extra
+        else:
+            self.extra = None
+
+    # ------------------------------------------------------------------
+    # Acesso por chave (compatível com os antigos dicts)
+    # ------------------------------------------------------------------
+
+    def get(self, name, default=None):
+        if name in _FIELD_SET:
+            value = getattr(self, name)
+        else:
+            value = (self.extra or _NO_EXTRA).get(name)
+        return default if value is None else value
+
+    def __getitem__(self, name):
+        value = self.get(name)
+        if value is None:
+            raise KeyError(name)
+        return value
+
+    def __contains__(self, name):
+        return self.get(name) is not None
+
+    def keys(self):
+        """Campos preenchidos, na ordem das colunas"""
+        names = _LEADING_FIELDS + tuple(self.extra or ()) + _TRAILING_FIELDS
+        return [n for n in names if self.get(n) is not None]
+
+    def values(self):
+        return [self.get(n) for n in self.keys()]
+
+    def items(self):
+        return [(n, self.get(n)) for n in self.keys()]
+
+    def to_dict(self):
+        return dict(self.items())
+
+    def replace(self, **changes):
+        """Cópia do registro com os campos alterados"""
+        return Publication(**dict(self.items(), **changes))
+
+    def __eq__(self, other):
+        if not isinstance(other, Publication):
+            return NotImplemented
+        return self.items() == other.items()
+
+    def __repr__(self):
+        return f"Publication({self.title!r}, link={self.link!r})"
+
+    def __reduce__(self):
+        # Recria pelo construtor (reinterna os valores ao voltar do pool de parsing)
+        return _restore, (self.to_dict(),)
+
+
+def _restore(fields):
+    return Publication(**fields)
+
+
+def set_source(records, fonte, termo):
+    """Atribui a fonte a todos os registros e o termo aos que ainda não têm um"""
+    fonte = _intern(fonte)
+    termo = _intern(termo)
+    for record in records:
+        record.fonte = fonte
+        if record.termo is None:
+            record.termo = termo
+    return records
+
+
+def publications_to_frame(records):
+    """
+    Converte os registros em um DataFrame em um único passo colunar
+
+    Cada campo vira uma coluna (lista de valores) e os campos que nenhum
+    registro preencheu são omitidos, como acontecia com uma lista de dicts.
+    """
+    records = list(records)
+    total = len(records)
+
+    extras = [record.extra or _NO_EXTRA for record in records]
+    extra_names = {}
+    for extra in extras:
+        if extra:
+            extra_names.update(dict.fromkeys(extra))
+
+    columns = {}
+    for name in _LEADING_FIELDS + tuple(extra_names) + _TRAILING_FIELDS:
+        if name in _FIELD_SET:
+            values = list(map(attrgetter(name), records))
+        else:
+            values = [extra.get(name) for extra in extras]
+        if values.count(None) != total:
+            columns[name] = values
+
+    return pd.DataFrame(columns)
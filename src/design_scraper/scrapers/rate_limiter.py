@@ -0,0 +1,86 @@
+"""
+Limitador de taxa por host baseado em token bucket.
+Cada servidor recebe um balde próprio, compartilhado entre threads: buscas em
+servidores diferentes seguem em paralelo, enquanto cada servidor vê no máximo
+uma requisição a cada `delay_between_requests` segundos (com rajadas de até
+`burst` requisições).
+"""
+
+import threading
+import time
+from urllib.parse import urlparse
+
+
+class TokenBucket:
+    """Token bucket thread-safe com reserva de fichas"""
+
+    def __init__(self, delay_between_requests, burst=1):
+        self.delay = max(float(delay_between_requests), 0.0)
+        self.capacity = max(int(burst), 1)
+        self.tokens = float(self.capacity)
+        self.updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Consome uma ficha, aguardando se necessário; retorna o tempo de espera"""
+        if self.delay <= 0:
+            return 0.0
+
+        with self._lock:
+            now = time.monotonic()
+            elapsed = now - self.updated_at
+            self.tokens = min(self.capacity, self.tokens + elapsed / self.delay)
+            self.updated_at = now
+
+            # Fichas negativas funcionam como fila de reservas: cada chamada
+            # sabe exatamente quanto esperar sem precisar segurar o lock.
+            self.tokens -= 1
+            wait = max(0.0, -self.tokens * self.delay)
+
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+
+class RateLimiter:
+    """Registro de token buckets por host"""
+
+    def __init__(self, delay_between_requests=0, burst=1):
+        self.default_delay = delay_between_requests
+        self.default_burst = burst
+        self._host_settings = {}
+        self._buckets = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, config):
+        """Cria o limitador a partir de 'delay_between_requests' e 'burst' da configuração"""
+        return cls(
+            delay_between_requests=config.get("delay_between_requests", 0) or 0,
+            burst=config.get("burst", 1) or 1,
+        )
+
+    def configure_host(self, host, delay_between_requests=None, burst=None):
+        """Define um limite específico para um host"""
+        with self._lock:
+            self._host_settings[host] = (
+                self.default_delay if delay_between_requests is None else delay_between_requests,
+                self.default_burst if burst is None else burst,
+            )
+            self._buckets.pop(host, None)
+
+    def bucket_for(self, host):
+        """Retorna (criando se necessário) o balde de um host"""
+        with self._lock:
+            bucket = self._buckets.get(host)
+            if bucket is None:
+                delay, burst = self._host_settings.get(
+                    host, (self.default_delay, self.default_burst)
+                )
+                bucket = TokenBucket(delay, burst)
+                self._buckets[host] = bucket
+            return bucket
+
+    def acquire(self, url):
+        """Aguarda a vez de enviar uma requisição para o host da URL"""
+        return self.bucket_for(urlparse(url).netloc).acquire()
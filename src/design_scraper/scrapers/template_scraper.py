@@ -1,38 +1,25 @@
-from bs4 import BeautifulSoup
-import requests
 from .base_scraper import BaseScraper
+from .publication import Publication
 
 class TemplateRepoScraper(BaseScraper):
-    def search(self, term, max_pages=5):
-    
-        results = []
+    result_containers = (".result-item", ".pagination")
 
-        for page in range(max_pages):
-            url = f"{self.base_url}?search={term}&page={page+1}"
-            response = requests.get(url)
+    def build_url(self, term, page):
+        return f"{self.base_url}?search={term}&page={page}"
 
-            if response.status_code == 200:
-                soup = BeautifulSoup(response.contet, "htmlparser")
+    def parse_results(self, soup):
+        results = []
 
-                for item in soup.select(".result-item"):
-                    title_tag = item.find("h3")
-                    author_tag = item.find("p", class_="author")
-                    date_tag = item.find("p", class_="date")
+        for item in soup.select(".result-item"):
+            title_tag = item.find("h3")
+            author_tag = item.find("p", class_="author")
+            date_tag = item.find("p", class_="date")
 
-                    title = title_tag.get_text(strip=True) if title_tag else "Sem título"
-                    author = author_tag.get_text(strip=True) if author_tag else "Autor desconhecido"
-                    link = title_tag.find("a")["href"] if title_tag and title_tag.find("a") else "Sem URL"
-                    date = date_tag.get_text(strip=True) if date_tag else "Data não informada"
+            title = title_tag.get_text(strip=True) if title_tag else "Sem título"
+            author = author_tag.get_text(strip=True) if author_tag else "Autor desconhecido"
+            link = title_tag.find("a")["href"] if title_tag and title_tag.find("a") else "Sem URL"
+            date = date_tag.get_text(strip=True) if date_tag else "Data não informada"
 
-                    results.append({
-                        "title": title,
-                        "author": author,
-                        "link": link,
-                        "date": date,
-                    })
-            
-            else:
-                print(f"Errro ao acessar a página {page + 1}: {response.status_code}")
-                break
+            results.append(Publication(title=title, author=author, link=link, date=date))
 
         return results
@@ -0,0 +1,61 @@
+"""
+Utilitários para combinar termos em consultas OR e atribuir localmente o termo
+de busca a cada resultado retornado por uma consulta combinada.
+"""
+
+import re
+import unicodedata
+
+OR_OPERATOR = " OR "
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_text(text):
+    """Remove acentos, converte para minúsculas e normaliza espaços"""
+    if not text:
+        return ""
+    decomposed = unicodedata.normalize("NFKD", str(text))
+    stripped = "".join(c for c in decomposed if not unicodedata.combining(c))
+    return _WHITESPACE.sub(" ", stripped).strip().lower()
+
+
+def quote_term(term):
+    """Coloca entre aspas termos com mais de uma palavra"""
+    term = term.strip()
+    return f'"{term}"' if " " in term else term
+
+
+def build_or_query(terms):
+    """Monta a consulta booleana OR para um grupo de termos"""
+    return OR_OPERATOR.join(quote_term(t) for t in terms)
+
+
+def batch_terms(terms, max_query_length=200):
+    """
+    Agrupa os termos em consultas OR que respeitam o limite de tamanho
+
+    Returns:
+        list: grupos de termos, na ordem original
+    """
+    groups = []
+    current = []
+
+    for term in terms:
+        candidate = current + [term]
+        if current and len(build_or_query(candidate)) > max_query_length:
+            groups.append(current)
+            current = [term]
+        else:
+            current = candidate
+
+    if current:
+        groups.append(current)
+
+    return groups
+
+
+def match_terms(text, terms):
+    """Retorna os termos (ignorando acentos e maiúsculas) presentes no texto"""
+    normalized = normalize_text(text)
+    return [term for term in terms if normalize_text(term) in normalized]
@@ -0,0 +1,306 @@
+"""
+Camada de transporte HTTP compartilhada pelos scrapers.
+Mantém uma sessão com pool de conexões keep-alive por host, cabeçalhos padrão,
+compressão e timeouts, além de contadores de conexões abertas e reutilizadas.
+Opcionalmente consulta um cache em disco antes de ir à rede (ou apenas o cache,
+no modo offline). Requisições que saem para a rede passam pelo limitador de
+taxa do host e pela política de novas tentativas / circuit breaker.
+"""
+
+import threading
+import time
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3 import HTTPConnectionPool, HTTPSConnectionPool
+
+from .fetch_policy import CircuitBreaker, CircuitOpenError, FetchError, RetryPolicy
+from .http_cache import ResponseCache
+from .rate_limiter import RateLimiter
+
+
+DEFAULT_HEADERS = {
+    "User-Agent": (
+        "design-publications-scraper/1.0 "
+        "(+https://github.com/gustvomartins/design-publications-scraper)"
+    ),
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    "Accept-Language": "pt-BR,pt;q=0.9,en;q=0.8",
+    "Accept-Encoding": "gzip, deflate",
+    "Connection": "keep-alive",
+}
+
+
+class TransportStats:
+    """Contadores de requisições e conexões de uma execução"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.requests = 0
+            self.connections_opened = 0
+            self.cache_hits = 0
+            self.cache_revalidated = 0
+            self.cache_misses = 0
+            self.throttled_seconds = 0.0
+            self.retries = 0
+            self.failures = 0
+
+    def increment(self, counter, amount=1):
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + amount)
+
+    def as_dict(self):
+        with self._lock:
+            return {
+                'requests': self.requests,
+                'connections_opened': self.connections_opened,
+                'connections_reused': max(self.requests - self.connections_opened, 0),
+                'cache_hits': self.cache_hits,
+                'cache_revalidated': self.cache_revalidated,
+                'cache_misses': self.cache_misses,
+                'throttled_seconds': round(self.throttled_seconds, 2),
+                'retries': self.retries,
+                'failures': self.failures,
+            }
+
+
+class _CountingAdapter(HTTPAdapter):
+    """HTTPAdapter cujos pools registram cada nova conexão aberta"""
+
+    def __init__(self, stats, **kwargs):
+        self._stats = stats
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, connections, maxsize, block=False, **pool_kwargs):
+        super().init_poolmanager(connections, maxsize, block=block, **pool_kwargs)
+        stats = self._stats
+
+        class CountingHTTPConnectionPool(HTTPConnectionPool):
+            def _new_conn(self):
+                stats.increment('connections_opened')
+                return super()._new_conn()
+
+        class CountingHTTPSConnectionPool(HTTPSConnectionPool):
+            def _new_conn(self):
+                stats.increment('connections_opened')
+                return super()._new_conn()
+
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": CountingHTTPConnectionPool,
+            "https": CountingHTTPSConnectionPool,
+        }
+
+
+class HTTPTransport:
+    """Gerencia sessões HTTP com pool de conexões, uma por host"""
+
+    def __init__(self, pool_maxsize=4, connect_timeout=5, read_timeout=30, headers=None,
+                 cache=None, offline=False, rate_limiter=None, retry_policy=None,
+                 circuit_breaker=None):
+        self.pool_maxsize = pool_maxsize
+        self.timeout = (connect_timeout, read_timeout)
+        self.cache = cache
+        self.offline = offline
+        self.rate_limiter = rate_limiter or RateLimiter()
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.circuit_breaker = circuit_breaker or CircuitBreaker()
+        self.headers = dict(DEFAULT_HEADERS)
+        self.headers.update(headers or {})
+        self.stats = TransportStats()
+        self._sessions = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, config):
+        """Cria o transporte a partir das seções de rede, cache, limites de taxa e novas tentativas"""
+        http_config = config.get("http", {}) or {}
+        cache_config = config.get("http_cache", {}) or {}
+        headers = {}
+        if http_config.get("user_agent"):
+            headers["User-Agent"] = http_config["user_agent"]
+
+        offline = bool(cache_config.get("offline", False))
+        cache = None
+        if cache_config.get("enabled", False) or offline:
+            cache = ResponseCache.from_config(cache_config)
+
+        return cls(
+            pool_maxsize=http_config.get("pool_maxsize", 4),
+            connect_timeout=http_config.get("connect_timeout", 5),
+            read_timeout=http_config.get("read_timeout", 30),
+            headers=headers,
+            cache=cache,
+            offline=offline,
+            rate_limiter=RateLimiter.from_config(config),
+            retry_policy=RetryPolicy.from_config(config),
+            circuit_breaker=CircuitBreaker.from_config(config),
+        )
+
+    def session_for(self, url):
+        """Retorna (criando se necessário) a sessão associada ao host da URL"""
+        parsed = urlparse(url)
+        host = f"{parsed.scheme}://{parsed.netloc}"
+
+        with self._lock:
+            session = self._sessions.get(host)
+            if session is None:
+                session = requests.Session()
+                session.headers.update(self.headers)
+                adapter = _CountingAdapter(
+                    self.stats,
+                    pool_connections=1,
+                    pool_maxsize=self.pool_maxsize,
+                )
+                session.mount(f"{parsed.scheme}://", adapter)
+                self._sessions[host] = session
+            return session
+
+    def get(self, url, **kwargs):
+        """
+        Executa um GET reutilizando as conexões abertas para o host
+
+        Com cache habilitado, entradas dentro do TTL são servidas do disco e
+        entradas expiradas são revalidadas com If-None-Match/If-Modified-Since.
+        No modo offline, nenhuma requisição sai para a rede.
+
+        Raises:
+            CircuitOpenError: se o circuito do host estiver aberto
+            FetchError: se a conexão falhar ou a resposta for 5xx/429 em todas as tentativas
+        """
+        entry = self.cache.lookup(url) if self.cache else None
+
+        if entry is not None and (self.offline or entry.is_fresh(self.cache.ttl_seconds)):
+            self.stats.increment('cache_hits')
+            return entry.to_response()
+
+        if self.offline:
+            self.stats.increment('cache_misses')
+            return self._offline_miss(url)
+
+        if self.cache:
+            self.stats.increment('cache_misses')
+
+        headers = dict(kwargs.pop("headers", None) or {})
+        if entry is not None:
+            if entry.etag:
+                headers["If-None-Match"] = entry.etag
+            if entry.last_modified:
+                headers["If-Modified-Since"] = entry.last_modified
+
+        kwargs.setdefault("timeout", self.timeout)
+        response = self._send(url, headers, **kwargs)
+
+        if self.cache:
+            if response.status_code == 304 and entry is not None:
+                self.stats.increment('cache_revalidated')
+                self.cache.refresh(entry, response)
+                return entry.to_response()
+            if response.status_code == 200:
+                self.cache.store(url, response)
+
+        return response
+
+    def _send(self, url, headers, **kwargs):
+        """Envia a requisição aplicando limite de taxa, novas tentativas e circuit breaker"""
+        host = urlparse(url).netloc
+        if self.circuit_breaker.is_open(host):
+            raise CircuitOpenError(f"Circuito aberto para {host}", url)
+
+        session = self.session_for(url)
+        policy = self.retry_policy
+
+        for attempt in range(policy.max_retries + 1):
+            waited = self.rate_limiter.acquire(url)
+            if waited:
+                self.stats.increment('throttled_seconds', waited)
+            self.stats.increment('requests')
+
+            error = None
+            retry_after = None
+            try:
+                response = session.get(url, headers=headers, **kwargs)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                error = e
+            else:
+                if not policy.should_retry(response.status_code):
+                    self.circuit_breaker.record_success(host)
+                    return response
+                retry_after = response.headers.get("Retry-After")
+
+            if attempt < policy.max_retries:
+                self.stats.increment('retries')
+                time.sleep(policy.backoff(attempt, retry_after))
+
+        self.stats.increment('failures')
+        if self.circuit_breaker.record_failure(host):
+            print(f"   🔌 Circuito aberto para {host} após falhas consecutivas")
+
+        if error is not None:
+            raise FetchError(f"Falha ao acessar {url}: {error}", url) from error
+        raise FetchError(f"Falha ao acessar {url}: HTTP {response.status_code}", url, response)
+
+    @staticmethod
+    def _offline_miss(url):
+        """Resposta sintética para URLs ausentes do cache no modo offline"""
+        response = requests.Response()
+        response.status_code = 504
+        response.reason = "Not in cache (offline)"
+        response.url = url
+        response._content = b""
+        return response
+
+    def reset_stats(self):
+        """Zera os contadores (chamado no início de cada execução)"""
+        self.stats.reset()
+
+    def get_stats(self):
+        """Retorna os contadores de requisições e conexões"""
+        return self.stats.as_dict()
+
+    def close(self):
+        """Fecha todas as sessões abertas"""
+        with self._lock:
+            for session in self._sessions.values():
+                session.close()
+            self._sessions.clear()
+
+
+_default_transport = None
+_default_configured = False
+_default_lock = threading.Lock()
+
+
+def get_transport():
+    """Retorna o transporte compartilhado do processo"""
+    global _default_transport
+    with _default_lock:
+        if _default_transport is None:
+            _default_transport = HTTPTransport()
+        return _default_transport
+
+
+def configure_transport(config, replace=True):
+    """
+    Substitui o transporte compartilhado por um configurado a partir do YAML
+
+    Com replace=False, um transporte já configurado é mantido (útil para sessões
+    Streamlit, que recriam os objetos a cada interação).
+    """
+    global _default_transport, _default_configured
+    with _default_lock:
+        if not replace and _default_configured:
+            return _default_transport
+
+    transport = HTTPTransport.from_config(config)
+    with _default_lock:
+        previous = _default_transport
+        _default_transport = transport
+        _default_configured = True
+    if previous is not None:
+        previous.close()
+    return transport
@@ -6,12 +6,24 @@ from .data_transformer import DataTransformer
 from .deduplication import Deduplicator
 from .export_csv import CSVExporter
 from .html_parsing import HTMLParser
+from .keyword_matcher import KeywordMatcher
+from .language_detection import PortugueseDetector
+from .link_index import LinkIndex
+from .near_duplicates import NearDuplicateDetector
+from .raw_store import RawResultsStore
 from .scrapers_factory import ScrapterFactory
+from .sqlite_store import SQLiteStore
 
 __all__ = [
     "DataTransformer",
     "Deduplicator",
     "CSVExporter",
     "HTMLParser",
+    "KeywordMatcher",
+    "PortugueseDetector",
+    "LinkIndex",
+    "NearDuplicateDetector",
+    "RawResultsStore",
     "ScrapterFactory",
+    "SQLiteStore",
 ]
@@ -0,0 +1,134 @@
+"""
+Formato colunar (Parquet) para os dados trocados entre as etapas do pipeline.
+As colunas de baixa cardinalidade (fonte, termo, database, category, type) são
+gravadas com codificação de dicionário e lidas de volta como categoricals do
+pandas. A leitura lê apenas as colunas pedidas e aplica os filtros por valor
+durante a varredura do arquivo (predicate pushdown).
+
+O pyarrow é opcional: só é importado quando um arquivo Parquet é lido ou gravado.
+"""
+
+import os
+
+import pandas as pd
+
+CATEGORICAL_COLUMNS = ("fonte", "termo", "database", "category", "type")
+PARQUET_COMPRESSION = "zstd"
+PARQUET_SUFFIX = ".parquet"
+
+
+def require_pyarrow():
+    """Importa o pyarrow, com uma mensagem de instalação quando ele não existe"""
+    try:
+        import pyarrow
+        import pyarrow.dataset  # noqa: F401
+        import pyarrow.parquet  # noqa: F401
+    except ImportError:
+        raise ImportError("pyarrow não está instalado. Instale com: pip install pyarrow") from None
+    return pyarrow
+
+
+def is_parquet(path):
+    return str(path).endswith(PARQUET_SUFFIX)
+
+
+def parquet_path(path):
+    """Caminho Parquet correspondente a um arquivo de saída (filtered_results.csv -> .parquet)"""
+    return os.path.splitext(path)[0] + PARQUET_SUFFIX
+
+
+def with_categoricals(df, columns=CATEGORICAL_COLUMNS):
+    """Converte as colunas de baixa cardinalidade presentes em categoricals"""
+    converted = {
+        column: df[column].astype("category")
+        for column in columns
+        if column in df.columns and not isinstance(df[column].dtype, pd.CategoricalDtype)
+    }
+    return df.assign(**converted) if converted else df
+
+
+def write_parquet(df, path):
+    """Grava um DataFrame em Parquet (categoricals como dicionário; gravação atômica)"""
+    pa = require_pyarrow()
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+    table = pa.Table.from_pandas(with_categoricals(df), preserve_index=False)
+    tmp_path = f"{path}.tmp"
+    pa.parquet.write_table(table, tmp_path, compression=PARQUET_COMPRESSION)
+    os.replace(tmp_path, path)
+
+
+def _filter_expression(filters):
+    """Expressão do pyarrow para {coluna: valores aceitos}"""
+    import pyarrow.dataset as ds
+
+    expression = None
+    for column, values in filters.items():
+        condition = ds.field(column).isin(list(values))
+        expression = condition if expression is None else expression & condition
+    return expression
+
+
+def iter_parquet(path, columns=None, filters=None, batch_size=None):
+    """
+    Lê um arquivo Parquet com projeção de colunas e filtros na varredura
+
+    Args:
+        columns: colunas a ler (as ausentes no arquivo são ignoradas)
+        filters: {coluna: valores aceitos}
+        batch_size: linhas por bloco (None = o arquivo inteiro de uma vez)
+
+    Yields:
+        DataFrame de cada bloco
+    """
+    require_pyarrow()
+    import pyarrow.dataset as ds
+
+    dataset = ds.dataset(path, format="parquet")
+    names = dataset.schema.names
+    filters = {c: v for c, v in (filters or {}).items() if v is not None}
+    if any(column not in names for column in filters):
+        # Nenhuma linha pode ter o valor pedido em uma coluna inexistente
+        return
+
+    scanner = dataset.scanner(
+        columns=[c for c in names if c in columns] if columns is not None else None,
+        filter=_filter_expression(filters) if filters else None,
+        **({"batch_size": batch_size} if batch_size else {}),
+    )
+    if not batch_size:
+        yield scanner.to_table().to_pandas()
+        return
+    for batch in scanner.to_batches():
+        if batch.num_rows:
+            yield batch.to_pandas()
+
+
+def read_table(path, columns=None, filters=None):
+    """
+    Lê um arquivo CSV ou Parquet (pelo sufixo) com projeção e filtros
+
+    Args:
+        columns: colunas a ler (as ausentes no arquivo são ignoradas)
+        filters: {coluna: valores aceitos}
+    """
+    filters = {c: v for c, v in (filters or {}).items() if v is not None}
+
+    if is_parquet(path):
+        frames = list(iter_parquet(path, columns, filters))
+        return frames[0] if frames else pd.DataFrame(columns=columns or [])
+
+    usecols = None
+    if columns is not None:
+        wanted = set(columns) | set(filters)
+        usecols = wanted.__contains__
+    df = pd.read_csv(path, usecols=usecols)
+    for column, values in filters.items():
+        if column not in df.columns:
+            return df.iloc[0:0]
+        df = df[df[column].isin(values)]
+    if columns is not None:
+        df = df[[c for c in df.columns if c in columns]]
+    return df
@@ -1,9 +1,59 @@
+import numpy as np
 import pandas as pd
 import uuid
 from datetime import datetime
 import re
 import os
 
+from .columnar import parquet_path, write_parquet
+from .keyword_matcher import KeywordMatcher
+from .language_detection import PortugueseDetector
+
+# Raw rows read and filtered at a time by transform_search_results
+TRANSFORM_CHUNK_ROWS = 50000
+
+# Scraped column -> base database column
+COLUMN_MAPPING = {
+    'title': 'title',
+    'author': 'author',
+    'link': 'link',
+    'fonte': 'database',
+    'termo': 'category',
+    'year': 'year'
+}
+
+
+class FilterResult:
+    """
+    Outcome of a single transform pass
+
+    Holds the Portuguese and keyword masks (aligned with the raw DataFrame rows),
+    the language scores, their counts and the mapped output, so statistics do
+    not need another pass over the titles.
+    """
+    
+    def __init__(self, total, portuguese_mask, keyword_mask, language_scores, mapped_df):
+        self.total = total
+        self.portuguese_mask = portuguese_mask
+        self.keyword_mask = keyword_mask
+        self.language_scores = language_scores
+        self.mapped_df = mapped_df
+        self.portuguese_count = int(portuguese_mask.sum())
+        self.keyword_count = int(keyword_mask.sum())
+    
+    @property
+    def filtered_out(self):
+        return self.total - self.keyword_count
+    
+    def stats(self):
+        """Same keys as DataTransformer.get_filtering_stats"""
+        return {
+            'total_original': self.total,
+            'portuguese_titles': self.portuguese_count,
+            'with_keywords': self.keyword_count,
+            'filtered_out': self.filtered_out
+        }
+
 
 class DataTransformer:
     """Classe para transformação e limpeza de dados"""
@@ -23,6 +73,12 @@ class DataTransformer:
             'ergodesign', 'design participativo', 'product', 'neurodesign', 'user experience',
             'user', 'experience', 'comportamento', 'web'
         ]
+        self.keyword_matcher = KeywordMatcher(self.required_keywords)
+        self.language_detector = PortugueseDetector()
+        # Scores of the last DataFrame passed to filter_results (reused by get_filtering_stats)
+        self.language_scores = None
+        self._scored_df = None
+        self.last_result = None
         
         # Base database column structure
         self.base_columns = [
@@ -35,54 +91,40 @@ class DataTransformer:
         Check if the title is in Portuguese by looking for Portuguese-specific characters
         and common Portuguese words
         """
-        if not title or pd.isna(title):
-            return False
-        
-        title_lower = str(title).lower()
-        
-        # Portuguese-specific characters
-        portuguese_chars = ['á', 'à', 'ã', 'â', 'é', 'ê', 'í', 'ó', 'ô', 'õ', 'ú', 'ç', 'ñ']
-        
-        # Common Portuguese words
-        portuguese_words = [
-            'de', 'da', 'do', 'das', 'dos', 'para', 'com', 'sem', 'em', 'na', 'no',
-            'nas', 'nos', 'por', 'pelo', 'pela', 'pelos', 'pelas', 'que', 'qual',
-            'quais', 'como', 'onde', 'quando', 'quem', 'cujo', 'cuja', 'cujos', 'cujas',
-            'este', 'esta', 'estes', 'estas', 'esse', 'essa', 'esses', 'essas',
-            'aquele', 'aquela', 'aqueles', 'aquelas', 'mesmo', 'mesma', 'mesmos', 'mesmas',
-            'próprio', 'própria', 'próprios', 'próprias', 'outro', 'outra', 'outros', 'outras',
-            'todo', 'toda', 'todos', 'todas', 'algum', 'alguma', 'alguns', 'algumas',
-            'nenhum', 'nenhuma', 'nenhuns', 'nenhumas', 'certo', 'certa', 'certos', 'certas',
-            'vário', 'vária', 'vários', 'várias', 'pouco', 'pouca', 'poucos', 'poucas',
-            'muito', 'muita', 'muitos', 'muitas', 'bastante', 'bastantes', 'demasiado',
-            'demasiada', 'demasiados', 'demasiadas', 'mais', 'menos', 'melhor', 'pior',
-            'maior', 'menor', 'ótimo', 'ótima', 'ótimas', 'ótimas', 'péssimo', 'péssima',
-            'péssimos', 'péssimas', 'bom', 'boa', 'bons', 'boas', 'mau', 'má', 'maus', 'más'
-        ]
-        
-        # Check for Portuguese characters
-        has_portuguese_chars = any(char in title_lower for char in portuguese_chars)
-        
-        # Check for Portuguese words (at least 3)
-        portuguese_word_count = sum(1 for word in portuguese_words if word in title_lower.split())
-        
-        return has_portuguese_chars or portuguese_word_count >= 3
+        return self.language_detector.is_portuguese(title)
     
     def contains_required_keywords(self, title):
         """
         Check if the title contains any of the required keywords
         """
-        if not title or pd.isna(title):
-            return False
+        return self.keyword_matcher.contains_any(title)
+    
+    def _apply_filters(self, df):
+        """
+        Compute the language and keyword masks once over the whole DataFrame
+
+        Returns:
+            tuple: (language scores Series, Portuguese mask, final mask), the
+            masks as boolean arrays in the row order of df
+        """
+        titles = df['title']
         
-        title_lower = str(title).lower()
+        # Portuguese language (whole column at once)
+        scores = self.language_detector.scores(titles)
+        portuguese_mask = self.language_detector.mask(titles, scores).to_numpy()
         
-        # Check if any required keyword is present
-        for keyword in self.required_keywords:
-            if keyword in title_lower:
-                return True
+        # Required keywords (only the Portuguese titles)
+        keyword_mask = np.zeros(len(df), dtype=bool)
+        keyword_mask[portuguese_mask] = self.keyword_matcher.mask(titles[portuguese_mask]).to_numpy()
         
-        return False
+        return scores, portuguese_mask, keyword_mask
+    
+    def _select(self, df, scores, keyword_mask):
+        """Rows that passed both filters, with the filter evidence columns"""
+        filtered_df = df[keyword_mask].copy()
+        filtered_df['portuguese_score'] = scores.to_numpy()[keyword_mask]
+        filtered_df['matched_keywords'] = self.keyword_matcher.matches(filtered_df['title'])
+        return filtered_df
     
     def filter_results(self, df):
         """
@@ -93,17 +135,13 @@ class DataTransformer:
         
         print(f"🔍 Filtrando {len(df)} resultados...")
         
-        # Filter by Portuguese language
-        portuguese_mask = df['title'].apply(self.is_portuguese_title)
-        portuguese_df = df[portuguese_mask]
-        print(f"   📝 Títulos em português: {len(portuguese_df)}")
-        
-        # Filter by required keywords
-        keyword_mask = portuguese_df['title'].apply(self.contains_required_keywords)
-        filtered_df = portuguese_df[keyword_mask]
-        print(f"   🎯 Contém palavras-chave: {len(filtered_df)}")
+        scores, portuguese_mask, keyword_mask = self._apply_filters(df)
+        self.language_scores = scores
+        self._scored_df = df
+        print(f"   📝 Títulos em português: {int(portuguese_mask.sum())}")
+        print(f"   🎯 Contém palavras-chave: {int(keyword_mask.sum())}")
         
-        return filtered_df
+        return self._select(df, scores, keyword_mask)
     
     def map_to_base_structure(self, df):
         """
@@ -113,46 +151,119 @@ class DataTransformer:
             return df
         
         print(f"🔄 Mapeando {len(df)} registros para estrutura da base...")
+        mapped_df = self._map_rows(df)
+        print(f"✅ Mapeamento concluído: {len(mapped_df)} registros estruturados")
         
-        # Create new DataFrame with base structure
-        mapped_df = pd.DataFrame(columns=self.base_columns)
-        
-        # Map existing columns
-        column_mapping = {
-            'title': 'title',
-            'author': 'author',
-            'link': 'link',
-            'fonte': 'database',
-            'termo': 'category'
+        return mapped_df
+    
+    def _map_rows(self, df):
+        """Build the base structure columns for the given rows"""
+        # Base column -> scraped column
+        source_columns = {new_col: old_col for old_col, new_col in COLUMN_MAPPING.items()}
+        defaults = {
+            'id': [str(uuid.uuid4()) for _ in range(len(df))],
+            'timestamp': datetime.now().strftime("%d/%m/%Y %H:%M:%S"),
+            'year': 'N/A',
+            'type': 'Artigo',  # Default type for scraped results
         }
         
-        for old_col, new_col in column_mapping.items():
+        # Build every column at once, already in the base structure order
+        data = {}
+        for col in self.base_columns:
+            old_col = source_columns.get(col)
             if old_col in df.columns:
-                mapped_df[new_col] = df[old_col]
+                data[col] = df[old_col].to_numpy()
+            else:
+                data[col] = defaults.get(col, '')
+        
+        # Keep the filter evidence for each record (after the base columns)
+        for col in ('matched_keywords', 'portuguese_score'):
+            if col in df.columns:
+                data[col] = df[col].to_numpy()
         
-        # Fill missing columns with default values
-        mapped_df['id'] = [str(uuid.uuid4()) for _ in range(len(mapped_df))]
-        mapped_df['timestamp'] = datetime.now().strftime("%d/%m/%Y %H:%M:%S")
-        mapped_df['year'] = mapped_df.get('date', pd.Series(['N/A'] * len(mapped_df)))
-        mapped_df['type'] = 'Artigo'  # Default type for scraped results
-        mapped_df['cover_image'] = ''
-        mapped_df['🔐 Softr Record ID'] = ''
+        mapped_df = pd.DataFrame(data, index=df.index)
         
         # Clean up year column
-        if 'year' in mapped_df.columns:
-            mapped_df['year'] = mapped_df['year'].fillna('N/A')
+        mapped_df['year'] = mapped_df['year'].fillna('N/A')
         
-        # Ensure all required columns exist
-        for col in self.base_columns:
-            if col not in mapped_df.columns:
-                mapped_df[col] = ''
+        return mapped_df
+    
+    def transform(self, df):
+        """
+        Single pass over the raw results: filter once, map once
+
+        Returns:
+            FilterResult with the masks, counts and mapped DataFrame
+        """
+        print(f"🚀 Iniciando transformação de {len(df)} registros...")
         
-        # Reorder columns to match base structure
-        mapped_df = mapped_df[self.base_columns]
+        result = self.transform_chunks([df])
+        self.language_scores = result.language_scores
+        self._scored_df = df
+        return result
+    
+    def transform_chunks(self, chunks):
+        """
+        Single pass over the raw results read in chunks (e.g. pd.read_csv(chunksize=...))
+
+        Each chunk is filtered and only its selected rows are kept, so peak memory
+        is bounded by the chunk size plus the filtered output.
         
-        print(f"✅ Mapeamento concluído: {len(mapped_df)} registros estruturados")
+        Returns:
+            FilterResult with the masks, counts and mapped DataFrame
+        """
+        scores_parts, portuguese_parts, keyword_parts, selected_parts = [], [], [], []
+        
+        for chunk in chunks:
+            if chunk.empty:
+                continue
+            scores, portuguese_mask, keyword_mask = self._apply_filters(chunk)
+            scores_parts.append(scores)
+            portuguese_parts.append(portuguese_mask)
+            keyword_parts.append(keyword_mask)
+            if keyword_mask.any():
+                selected_parts.append(self._select(chunk, scores, keyword_mask))
+        
+        if not scores_parts:
+            empty = np.zeros(0, dtype=bool)
+            return FilterResult(0, empty, empty, pd.Series(dtype=float), pd.DataFrame())
+        
+        portuguese_mask = np.concatenate(portuguese_parts)
+        keyword_mask = np.concatenate(keyword_parts)
+        language_scores = pd.concat(scores_parts) if len(scores_parts) > 1 else scores_parts[0]
+        
+        print(f"🔍 Filtrando {len(keyword_mask)} resultados...")
+        print(f"   📝 Títulos em português: {int(portuguese_mask.sum())}")
+        print(f"   🎯 Contém palavras-chave: {int(keyword_mask.sum())}")
+        
+        if not selected_parts:
+            print("⚠️ Nenhum resultado passou pelos filtros")
+            mapped_df = pd.DataFrame()
+        else:
+            filtered_df = pd.concat(selected_parts) if len(selected_parts) > 1 else selected_parts[0]
+            mapped_df = self.map_to_base_structure(filtered_df)
+            print(f"✨ Transformação concluída: {len(mapped_df)} registros válidos")
         
-        return mapped_df
+        result = FilterResult(len(keyword_mask), portuguese_mask, keyword_mask, language_scores, mapped_df)
+        self.last_result = result
+        return result
+    
+    def transform_batch(self, df):
+        """
+        Filter and map one batch of a streaming run, without progress output
+
+        Returns:
+            FilterResult for the batch (its counts are summed by the caller)
+        """
+        if df.empty or 'title' not in df.columns:
+            empty = np.zeros(len(df), dtype=bool)
+            return FilterResult(len(df), empty, empty, pd.Series(dtype=float), pd.DataFrame())
+        
+        scores, portuguese_mask, keyword_mask = self._apply_filters(df)
+        mapped_df = pd.DataFrame()
+        if keyword_mask.any():
+            mapped_df = self._map_rows(self._select(df, scores, keyword_mask))
+        return FilterResult(len(df), portuguese_mask, keyword_mask, scores, mapped_df)
     
     def transform_and_filter(self, df):
         """
@@ -161,25 +272,11 @@ class DataTransformer:
         if df.empty:
             return df
         
-        print(f"🚀 Iniciando transformação de {len(df)} registros...")
-        
-        # Step 1: Filter results
-        filtered_df = self.filter_results(df)
-        
-        if filtered_df.empty:
-            print("⚠️ Nenhum resultado passou pelos filtros")
-            return filtered_df
-        
-        # Step 2: Map to base structure
-        mapped_df = self.map_to_base_structure(filtered_df)
-        
-        print(f"✨ Transformação concluída: {len(mapped_df)} registros válidos")
-        
-        return mapped_df
+        return self.transform(df).mapped_df
     
-    def save_filtered_results(self, df, output_path):
+    def save_filtered_results(self, df, output_path, parquet=False):
         """
-        Save filtered and transformed results to CSV
+        Save filtered and transformed results to CSV (and to a Parquet copy next to it)
         """
         if df.empty:
             print("⚠️ Nenhum dado para salvar")
@@ -193,6 +290,9 @@ class DataTransformer:
             # Save to CSV
             df.to_csv(output_path, index=False, encoding='utf-8')
             print(f"💾 Resultados filtrados salvos em: {output_path}")
+            if parquet:
+                write_parquet(df, parquet_path(output_path))
+                print(f"💾 Cópia Parquet salva em: {parquet_path(output_path)}")
             print(f"   📊 Total de registros: {len(df)}")
             
         except Exception as e:
@@ -202,9 +302,13 @@ class DataTransformer:
         """
         Get statistics about the filtering process
         """
+        scores = self.language_scores
+        if original_df is not self._scored_df:
+            scores = self.language_detector.scores(original_df['title'])
+        
         stats = {
             'total_original': len(original_df),
-            'portuguese_titles': len(original_df[original_df['title'].apply(self.is_portuguese_title)]),
+            'portuguese_titles': int(self.language_detector.mask(original_df['title'], scores).sum()),
             'with_keywords': len(filtered_df),
             'filtered_out': len(original_df) - len(filtered_df)
         }
@@ -214,7 +318,7 @@ class DataTransformer:
 
 def transform_search_results(input_path, output_path):
     """
-    Transform and filter search results from scrapers
+    Transform and filter search results from scrapers (file-based wrapper for the CLI)
     
     Args:
         input_path: Path to raw search results CSV
@@ -223,35 +327,92 @@ def transform_search_results(input_path, output_path):
     print("🔄 Iniciando transformação dos resultados de busca...")
     
     try:
-        # Load data
-        df = pd.read_csv(input_path)
-        print(f"📥 Dados carregados: {len(df)} registros")
-        
-        # Transform and filter
-        transformer = DataTransformer()
-        transformed_df = transformer.transform_and_filter(df)
+        # Stream the raw file (only the columns used by the base structure),
+        # filtering each chunk and mapping the selected rows once
+        chunks = pd.read_csv(
+            input_path,
+            usecols=lambda col: col in COLUMN_MAPPING,
+            chunksize=TRANSFORM_CHUNK_ROWS
+        )
+        return _transform_and_save(chunks, output_path)
         
-        if not transformed_df.empty:
-            # Save filtered results
-            transformer.save_filtered_results(transformed_df, output_path)
-            
-            # Show statistics
-            stats = transformer.get_filtering_stats(df, transformed_df)
-            print(f"\n📊 Estatísticas do filtro:")
-            print(f"   Total original: {stats['total_original']}")
-            print(f"   Títulos em português: {stats['portuguese_titles']}")
-            print(f"   Com palavras-chave: {stats['with_keywords']}")
-            print(f"   Filtrados: {stats['filtered_out']}")
-        else:
-            print("⚠️ Nenhum resultado válido encontrado após filtros")
+    except Exception as e:
+        print(f"❌ Erro na transformação: {e}")
+        return pd.DataFrame()
+
+
+def transform_records(df, output_path=None, parquet=False):
+    """
+    Transform and filter raw results already in memory (DataFrame in, DataFrame out)
+    
+    Args:
+        df: Raw results (e.g. publications_to_frame of the scraped records)
+        output_path: Optional path to also save the filtered results
+        parquet: Also save the filtered results as Parquet (same name, .parquet)
+    """
+    print("🔄 Iniciando transformação dos resultados de busca...")
+    
+    try:
+        # Only the columns used by the base structure, as when reading the raw CSV
+        columns = [col for col in df.columns if col in COLUMN_MAPPING]
+        return _transform_and_save([df[columns]], output_path, parquet)
         
-        return transformed_df
+    except Exception as e:
+        print(f"❌ Erro na transformação: {e}")
+        return pd.DataFrame()
+
+
+def transform_raw_results(store, output_path, parquet=False, **filters):
+    """
+    Transform and filter the results kept in a RawResultsStore
+    
+    Args:
+        store: RawResultsStore with one partition per pipeline run
+        output_path: Path to save filtered results
+        parquet: Also save the filtered results as Parquet (same name, .parquet)
+        **filters: Partition filters (run_ids, sources, terms, since, until)
+    """
+    print("🔄 Iniciando transformação dos resultados de busca...")
+    
+    try:
+        # Partitions are read lazily, one chunk at a time
+        chunks = store.iter_partitions(
+            columns=list(COLUMN_MAPPING),
+            chunksize=TRANSFORM_CHUNK_ROWS,
+            **filters
+        )
+        return _transform_and_save(chunks, output_path, parquet)
         
     except Exception as e:
         print(f"❌ Erro na transformação: {e}")
         return pd.DataFrame()
 
 
+def _transform_and_save(chunks, output_path=None, parquet=False):
+    """Filter and map raw chunks, save the selected rows (if output_path) and print the statistics"""
+    transformer = DataTransformer()
+    result = transformer.transform_chunks(chunks)
+    print(f"📥 Dados processados: {result.total} registros")
+    transformed_df = result.mapped_df
+    
+    if not transformed_df.empty:
+        # Save filtered results
+        if output_path:
+            transformer.save_filtered_results(transformed_df, output_path, parquet)
+        
+        # Show statistics (counted during the filter pass)
+        stats = result.stats()
+        print(f"\n📊 Estatísticas do filtro:")
+        print(f"   Total original: {stats['total_original']}")
+        print(f"   Títulos em português: {stats['portuguese_titles']}")
+        print(f"   Com palavras-chave: {stats['with_keywords']}")
+        print(f"   Filtrados: {stats['filtered_out']}")
+    else:
+        print("⚠️ Nenhum resultado válido encontrado após filtros")
+    
+    return transformed_df
+
+
 if __name__ == "__main__":
     # Example usage
     transform_search_results(
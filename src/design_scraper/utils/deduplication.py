@@ -1,25 +1,70 @@
 import pandas as pd
+import json
 import os
+import threading
 from datetime import datetime
 
+from .columnar import parquet_path, read_table, write_parquet
+from .link_index import DEFAULT_INDEX_PATH, LinkIndex, normalize_link
+from .near_duplicates import NearDuplicateDetector
+
 
 class Deduplicator:
     """Classe para deduplicação de resultados de scraping"""
     
-    def __init__(self, base_db_path="data/raw/base_database.csv"):
+    def __init__(self, base_db_path="data/raw/base_database.csv", index_path=DEFAULT_INDEX_PATH,
+                 near_duplicates=None, export_parquet=False):
         self.base_db_path = base_db_path
-        self.base_df = self._load_base_database()
+        self.index = LinkIndex(base_db_path, index_path)
+        # Detector de quase-duplicatas por título/autores (None = apenas links)
+        self.near_duplicates = near_duplicates
+        # Grava também os novos registros em Parquet, ao lado do CSV
+        self.export_parquet = export_parquet
+        self._base_df = None
+        # Links normalizados da base, consultados em memória
+        self.links = frozenset()
+        self.base_stamp = self._stat_base()
+        self.base_exists = self._load_base_index()
+    
+    def _stat_base(self):
+        """(mtime, tamanho) da base, ou None se ela não existe"""
+        try:
+            stat = os.stat(self.base_db_path)
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+    
+    def is_stale(self):
+        """Indica se a base mudou depois de carregada"""
+        return self._stat_base() != self.base_stamp
+    
+    def _load_base_index(self):
+        """Atualiza o índice de links da base existente (sem carregar o CSV no pandas)"""
+        try:
+            if self.index.ensure_current() == "missing":
+                print(f"⚠️ Base de dados não encontrada em: {self.base_db_path}")
+                return False
+            self.links = self.index.load_links()
+            total = self.index.statistics()["total_records"]
+            print(f"📚 Base de dados carregada: {total} registros existentes")
+            return True
+        except Exception as e:
+            print(f"❌ Erro ao carregar base de dados: {e}")
+            return False
+    
+    @property
+    def base_df(self):
+        """Base completa em um DataFrame (carregada apenas quando acessada)"""
+        if self._base_df is None:
+            self._base_df = self._load_base_database()
+        return self._base_df
     
     def _load_base_database(self):
         """Carrega a base de dados existente"""
         try:
             if os.path.exists(self.base_db_path):
-                df = pd.read_csv(self.base_db_path)
-                print(f"📚 Base de dados carregada: {len(df)} registros existentes")
-                return df
-            else:
-                print(f"⚠️ Base de dados não encontrada em: {self.base_db_path}")
-                return pd.DataFrame()
+                return read_table(self.base_db_path)
+            return pd.DataFrame()
         except Exception as e:
             print(f"❌ Erro ao carregar base de dados: {e}")
             return pd.DataFrame()
@@ -29,7 +74,7 @@ class Deduplicator:
         Encontra registros novos comparando com a base existente
         
         Args:
-            filtered_results_path: Caminho para o CSV com resultados filtrados
+            filtered_results_path: Caminho para os resultados filtrados (CSV ou Parquet)
             output_path: Caminho para salvar apenas os novos registros
         
         Returns:
@@ -37,15 +82,33 @@ class Deduplicator:
         """
         try:
             # Carrega resultados filtrados
-            filtered_df = pd.read_csv(filtered_results_path)
+            filtered_df = read_table(filtered_results_path)
+        except Exception as e:
+            print(f"❌ Erro na deduplicação: {e}")
+            return pd.DataFrame()
+        
+        return self.find_new_records_in(filtered_df, output_path)
+    
+    def find_new_records_in(self, filtered_df, output_path=None):
+        """
+        Encontra registros novos em resultados filtrados já carregados
+        
+        Args:
+            filtered_df: DataFrame com os resultados filtrados
+            output_path: Caminho para salvar apenas os novos registros (opcional)
+        
+        Returns:
+            DataFrame com apenas os registros novos
+        """
+        try:
             print(f"🔍 Analisando {len(filtered_df)} resultados filtrados...")
             
-            if self.base_df.empty:
+            if not self.links:
                 print("✅ Base de dados vazia - todos os registros são novos")
-                new_records = filtered_df
-            else:
-                # Remove duplicatas baseado no campo 'link'
-                new_records = self._remove_duplicates(filtered_df)
+            
+            new_records = self.deduplicate(filtered_df)
+            
+            if self.links:
                 print(f"✅ {len(new_records)} registros novos encontrados")
             
             # Salva apenas os novos registros
@@ -58,20 +121,64 @@ class Deduplicator:
             print(f"❌ Erro na deduplicação: {e}")
             return pd.DataFrame()
     
+    def deduplicate(self, df):
+        """
+        Registros de um DataFrame que ainda não estão na base (sem ler ou gravar arquivos)
+        
+        Args:
+            df: DataFrame com os resultados (coluna 'link')
+        
+        Returns:
+            DataFrame com apenas os registros novos
+        """
+        if not self.links:
+            new_records = df
+        else:
+            new_records = self._remove_duplicates(df)
+        
+        if self.near_duplicates is not None:
+            new_records = self.near_duplicates.apply(new_records, self.base_db_path)
+        
+        return new_records
+    
+    def deduplicate_stream(self, df, seen_links):
+        """
+        deduplicate() para um bloco de uma execução em streaming
+        
+        Também descarta os links já entregues em blocos anteriores da mesma
+        execução; `seen_links` (links normalizados) é atualizado com os novos.
+        As quase-duplicatas, por outro lado, são comparadas apenas com a base e
+        dentro do próprio bloco: títulos equivalentes em blocos diferentes da
+        mesma execução não são detectados.
+        """
+        if df.empty:
+            return df
+        
+        new_records = self.deduplicate(df)
+        if new_records.empty or 'link' not in new_records.columns:
+            return new_records
+        
+        normalized = new_records['link'].map(normalize_link)
+        keep = ~(normalized.map(seen_links.__contains__).to_numpy(dtype=bool)
+                 | normalized.duplicated(keep='first').to_numpy())
+        seen_links.update(normalized[keep])
+        return new_records[keep]
+    
     def _remove_duplicates(self, filtered_df):
         """Remove registros duplicados baseado no campo 'link'"""
         if 'link' not in filtered_df.columns:
             print("⚠️ Campo 'link' não encontrado - usando todos os registros")
             return filtered_df
         
-        # Combina base existente com novos resultados
-        combined_df = pd.concat([self.base_df, filtered_df], ignore_index=True)
+        normalized = filtered_df['link'].map(normalize_link)
         
-        # Remove duplicatas baseado no link
-        deduplicated_df = combined_df.drop_duplicates(subset=['link'], keep='first')
+        # Consulta cada link no conjunto em memória dos links da base
+        in_base = normalized.map(self.links.__contains__).to_numpy(dtype=bool)
         
-        # Filtra apenas os registros que estavam nos novos resultados
-        new_records = deduplicated_df.iloc[len(self.base_df):]
+        # Entre os novos resultados, mantém a primeira ocorrência de cada link
+        first_occurrence = ~normalized.duplicated(keep='first').to_numpy()
+        
+        new_records = filtered_df[~in_base & first_occurrence]
         
         return new_records
     
@@ -85,6 +192,9 @@ class Deduplicator:
             new_records.to_csv(output_path, index=False)
             print(f"💾 Novos registros salvos em: {output_path}")
             print(f"   📊 Total de novos registros: {len(new_records)}")
+            if self.export_parquet:
+                write_parquet(new_records, parquet_path(output_path))
+                print(f"💾 Cópia Parquet salva em: {parquet_path(output_path)}")
             
             # IMPORTANTE: NÃO atualiza a base de dados automaticamente
             # Os novos registros são salvos separadamente para revisão manual
@@ -96,16 +206,11 @@ class Deduplicator:
     
     def get_statistics(self):
         """Retorna estatísticas da base de dados"""
-        if self.base_df.empty:
+        if not self.base_exists:
             return {"total_records": 0, "unique_sources": 0, "unique_terms": 0}
         
-        stats = {
-            "total_records": len(self.base_df),
-            "unique_sources": self.base_df['database'].nunique() if 'database' in self.base_df.columns else 0,
-            "unique_terms": self.base_df['category'].nunique() if 'category' in self.base_df.columns else 0
-        }
-        
-        return stats
+        # Totais calculados na indexação da base
+        return self.index.statistics()
     
     def get_new_records_summary(self, new_records_df):
         """Retorna resumo dos novos registros encontrados"""
@@ -131,22 +236,99 @@ class Deduplicator:
         return summary
 
 
+_shared_deduplicators = {}
+_shared_lock = threading.Lock()
+
+
+def get_shared_deduplicator(base_db_path="data/raw/base_database.csv", index_path=DEFAULT_INDEX_PATH,
+                            near_duplicates=None):
+    """
+    Deduplicator compartilhado pelo processo (ex.: todas as sessões do Streamlit)
+    
+    A base é carregada uma única vez e recarregada apenas quando o mtime ou o
+    tamanho do arquivo mudam.
+    """
+    key = (
+        os.path.abspath(base_db_path),
+        os.path.abspath(index_path),
+        json.dumps(near_duplicates, sort_keys=True),
+    )
+    with _shared_lock:
+        deduplicator = _shared_deduplicators.get(key)
+        if deduplicator is None or deduplicator.is_stale():
+            detector = NearDuplicateDetector.from_config({"near_duplicates": near_duplicates})
+            # Deduplicação apenas em memória: nenhum arquivo é gravado
+            deduplicator = Deduplicator(base_db_path, index_path, detector)
+            _shared_deduplicators[key] = deduplicator
+        return deduplicator
+
+
+def deduplicate_records(df, base_db_path="data/raw/base_database.csv", index_path=DEFAULT_INDEX_PATH,
+                        near_duplicates=None):
+    """
+    Registros novos de um DataFrame, comparados com a base compartilhada do processo
+    
+    Args:
+        df: DataFrame com os resultados (coluna 'link')
+        base_db_path: Caminho para a base de dados existente
+        index_path: Caminho do índice SQLite de links da base
+        near_duplicates: Configuração da detecção de quase-duplicatas
+    
+    Returns:
+        DataFrame com apenas os registros novos
+    """
+    return get_shared_deduplicator(base_db_path, index_path, near_duplicates).deduplicate(df)
+
+
 def run_deduplication(filtered_results_path, base_db_path="data/raw/base_database.csv", 
-                     output_path="data/processed/new_records.csv"):
+                     output_path="data/processed/new_records.csv", index_path=DEFAULT_INDEX_PATH,
+                     near_duplicates=None, export_parquet=False):
     """
-    Função principal para executar a deduplicação
+    Executa a deduplicação a partir de um arquivo (wrapper usado pela linha de comando)
     
     Args:
-        filtered_results_path: Caminho para o CSV com resultados filtrados
+        filtered_results_path: Caminho para os resultados filtrados (CSV ou Parquet)
+        Demais argumentos: ver deduplicate_results
+    """
+    return _report_deduplication(
+        lambda deduplicator: deduplicator.find_new_records(filtered_results_path, output_path),
+        base_db_path, output_path, index_path, near_duplicates, export_parquet
+    )
+
+
+def deduplicate_results(filtered_df, base_db_path="data/raw/base_database.csv",
+                        output_path="data/processed/new_records.csv", index_path=DEFAULT_INDEX_PATH,
+                        near_duplicates=None, export_parquet=False):
+    """
+    Executa a deduplicação de resultados filtrados já em memória (DataFrame in/out)
+    
+    Args:
+        filtered_df: DataFrame com os resultados filtrados
         base_db_path: Caminho para a base de dados existente
         output_path: Caminho para salvar apenas os novos registros
+        index_path: Caminho do índice SQLite de links da base
+        near_duplicates: Configuração da detecção de quase-duplicatas
+            (enabled, threshold, action, num_perm, min_title_length, cache_path)
+        export_parquet: Grava também os novos registros em Parquet (mesmo nome, .parquet)
+    
+    Returns:
+        DataFrame com apenas os registros novos
     """
+    return _report_deduplication(
+        lambda deduplicator: deduplicator.find_new_records_in(filtered_df, output_path),
+        base_db_path, output_path, index_path, near_duplicates, export_parquet
+    )
+
+
+def _report_deduplication(find, base_db_path, output_path, index_path, near_duplicates, export_parquet):
+    """Cria o deduplicador, executa `find` e mostra as estatísticas e o resumo"""
     print("🔄 Iniciando processo de deduplicação...")
     
-    deduplicator = Deduplicator(base_db_path)
+    detector = NearDuplicateDetector.from_config({"near_duplicates": near_duplicates})
+    deduplicator = Deduplicator(base_db_path, index_path, detector, export_parquet)
     
     # Executa deduplicação
-    new_records = deduplicator.find_new_records(filtered_results_path, output_path)
+    new_records = find(deduplicator)
     
     # Mostra estatísticas da base
     base_stats = deduplicator.get_statistics()
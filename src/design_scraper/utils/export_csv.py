@@ -1,4 +1,5 @@
 import csv 
+import os
 
 class CSVExporter:
     """Classe para exportação de dados para CSV"""
@@ -15,4 +16,47 @@ class CSVExporter:
 
 def export_to_csv(filename, data, fieldnames):
     """Função de conveniência para exportação CSV"""
-    CSVExporter.export_to_csv(filename, data, fieldnames)
\ No newline at end of file
+    CSVExporter.export_to_csv(filename, data, fieldnames)
+
+
+class IncrementalCSVWriter:
+    """
+    Grava um CSV em blocos, à medida que os registros chegam
+
+    O cabeçalho é definido pelo primeiro bloco (os seguintes são alinhados a
+    ele) e cada bloco é enviado ao disco logo após ser gravado. O arquivo só é
+    criado (e o anterior substituído) quando o primeiro bloco chega.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.columns = None
+        self.rows = 0
+        self._file = None
+
+    def write(self, df):
+        """Acrescenta um bloco (DataFrame) ao arquivo"""
+        if df.empty:
+            return
+        if self._file is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._file = open(self.path, "w", newline="", encoding="utf-8")
+            self.columns = list(df.columns)
+            df.to_csv(self._file, index=False)
+        else:
+            df.reindex(columns=self.columns).to_csv(self._file, index=False, header=False)
+        self._file.flush()
+        self.rows += len(df)
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
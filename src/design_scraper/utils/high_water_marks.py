@@ -0,0 +1,112 @@
+"""
+Estado do crawl incremental.
+Guarda, para cada par (repositório, termo), o link e a data do resultado mais
+recente já visto ("high-water mark"), permitindo que buscas ordenadas por data
+parem assim que alcançam conteúdo conhecido.
+"""
+
+import json
+import os
+import threading
+from datetime import datetime
+
+import pandas as pd
+
+from .link_index import normalize_link
+
+
+class HighWaterMarks:
+    """High-water marks por (repositório, termo), persistidas em JSON"""
+
+    def __init__(self, path="data/state/high_water_marks.json"):
+        self.path = path
+        self._lock = threading.Lock()
+        self.marks = self._load()
+
+    @staticmethod
+    def _key(repo_name, term):
+        return f"{repo_name}|{term}"
+
+    def _load(self):
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+        except ValueError:
+            print(f"⚠️ Estado incremental inválido em {self.path} - começando do zero")
+            return {}
+
+    def get(self, repo_name, term):
+        """Retorna a marca do par (repositório, termo), ou None"""
+        with self._lock:
+            return self.marks.get(self._key(repo_name, term))
+
+    def update(self, repo_name, term, results):
+        """Registra o resultado mais recente (o primeiro de uma busca ordenada por data)"""
+        if not results:
+            return
+        newest = results[0]
+        mark = {
+            "link": newest.link,
+            "date": newest.date,
+            "updated_at": datetime.now().isoformat(timespec="seconds"),
+        }
+        # Colheitas OAI-PMH: guarda o maior datestamp para o próximo from=
+        datestamps = [r.get("datestamp") for r in results if r.get("datestamp")]
+        if datestamps:
+            mark["datestamp"] = max(datestamps)
+
+        with self._lock:
+            previous = self.marks.get(self._key(repo_name, term)) or {}
+            if "datestamp" not in mark and previous.get("datestamp"):
+                mark["datestamp"] = previous["datestamp"]
+            self.marks[self._key(repo_name, term)] = mark
+
+    def save(self):
+        """Grava as marcas de forma atômica"""
+        with self._lock:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self.marks, f, ensure_ascii=False, indent=2)
+            os.replace(tmp_path, self.path)
+
+
+class IncrementalState:
+    """Links conhecidos e high-water marks usados por uma execução incremental"""
+
+    def __init__(self, marks, known_links):
+        self.marks = marks
+        self.known_links = known_links
+
+    @classmethod
+    def from_config(cls, config):
+        """Carrega o estado a partir das seções 'incremental' e 'deduplication'"""
+        incremental = config.get("incremental", {}) or {}
+        dedup_config = config.get("deduplication", {}) or {}
+        marks = HighWaterMarks(incremental.get("state_file", "data/state/high_water_marks.json"))
+        known_links = load_known_links(dedup_config.get("base_database", "data/raw/base_database.csv"))
+        return cls(marks, known_links)
+
+    def stop_link(self, repo_name, term):
+        """Link mais recente já visto para o par (repositório, termo)"""
+        mark = self.marks.get(repo_name, term)
+        return mark.get("link") if mark else None
+
+    def from_date(self, repo_name, term):
+        """Datestamp (AAAA-MM-DD) a partir do qual colher novamente via OAI-PMH"""
+        mark = self.marks.get(repo_name, term)
+        datestamp = mark.get("datestamp") if mark else None
+        return datestamp[:10] if datestamp else None
+
+
+def load_known_links(base_db_path):
+    """Lê apenas a coluna 'link' da base existente (links normalizados com normalize_link)"""
+    try:
+        links = pd.read_csv(base_db_path, usecols=["link"])["link"]
+    except (FileNotFoundError, ValueError):
+        return frozenset()
+    return frozenset(normalize_link(link) for link in links.dropna())
@@ -0,0 +1,60 @@
+import re
+
+import pandas as pd
+
+
+class KeywordMatcher:
+    """
+    Matches a fixed keyword set against whole title columns
+
+    The keywords are compiled once into a single alternation regex (longest
+    keywords first). Matching keeps the substring semantics of the original
+    per-title check: 'user' matches 'username', 'ux' matches 'ux design'.
+    """
+
+    def __init__(self, keywords):
+        # Lowercased, deduplicated, original order preserved
+        self.keywords = list(dict.fromkeys(k.lower() for k in keywords if k))
+        self._order = {keyword: i for i, keyword in enumerate(self.keywords)}
+
+        alternation = "|".join(
+            re.escape(k) for k in sorted(self.keywords, key=len, reverse=True)
+        )
+        self.pattern = re.compile(alternation)
+        # Zero-width lookahead: finds the longest keyword starting at every position
+        self.overlapping_pattern = re.compile(f"(?=({alternation}))")
+
+        # Keywords found inside each keyword ('experiência' in 'experiência mobile'),
+        # which the lookahead hides when they start at the same position
+        self.contained = {
+            keyword: frozenset(other for other in self.keywords if other in keyword)
+            for keyword in self.keywords
+        }
+
+    def _lower(self, titles):
+        return titles.fillna("").astype(str).str.lower()
+
+    def mask(self, titles):
+        """Boolean Series: True where the title contains at least one keyword"""
+        if not self.keywords:
+            return pd.Series(False, index=titles.index)
+        return self._lower(titles).str.contains(self.pattern, regex=True)
+
+    def matches(self, titles):
+        """Series of '; '-joined matched keywords (in keyword list order) per title"""
+        if not self.keywords:
+            return pd.Series("", index=titles.index)
+        found = self._lower(titles).str.findall(self.overlapping_pattern)
+        return found.map(self._expand)
+
+    def _expand(self, found):
+        matched = set()
+        for keyword in found:
+            matched |= self.contained[keyword]
+        return "; ".join(sorted(matched, key=self._order.__getitem__))
+
+    def contains_any(self, title):
+        """Single-title check"""
+        if not title or pd.isna(title) or not self.keywords:
+            return False
+        return self.pattern.search(str(title).lower()) is not None
@@ -0,0 +1,86 @@
+import numpy as np
+import pandas as pd
+
+# Portuguese-specific characters
+PORTUGUESE_CHARS = frozenset('áàãâéêíóôõúçñ')
+
+# Common Portuguese words
+PORTUGUESE_WORDS = frozenset([
+    'de', 'da', 'do', 'das', 'dos', 'para', 'com', 'sem', 'em', 'na', 'no',
+    'nas', 'nos', 'por', 'pelo', 'pela', 'pelos', 'pelas', 'que', 'qual',
+    'quais', 'como', 'onde', 'quando', 'quem', 'cujo', 'cuja', 'cujos', 'cujas',
+    'este', 'esta', 'estes', 'estas', 'esse', 'essa', 'esses', 'essas',
+    'aquele', 'aquela', 'aqueles', 'aquelas', 'mesmo', 'mesma', 'mesmos', 'mesmas',
+    'próprio', 'própria', 'próprios', 'próprias', 'outro', 'outra', 'outros', 'outras',
+    'todo', 'toda', 'todos', 'todas', 'algum', 'alguma', 'alguns', 'algumas',
+    'nenhum', 'nenhuma', 'nenhuns', 'nenhumas', 'certo', 'certa', 'certos', 'certas',
+    'vário', 'vária', 'vários', 'várias', 'pouco', 'pouca', 'poucos', 'poucas',
+    'muito', 'muita', 'muitos', 'muitas', 'bastante', 'bastantes', 'demasiado',
+    'demasiada', 'demasiados', 'demasiadas', 'mais', 'menos', 'melhor', 'pior',
+    'maior', 'menor', 'ótimo', 'ótima', 'ótimos', 'ótimas', 'péssimo', 'péssima',
+    'péssimos', 'péssimas', 'bom', 'boa', 'bons', 'boas', 'mau', 'má', 'maus', 'más'
+])
+
+# Distinct Portuguese words needed when the title has no Portuguese characters
+MIN_PORTUGUESE_WORDS = 3
+
+# Titles scoring at least this are considered Portuguese
+PORTUGUESE_THRESHOLD = 1.0
+
+# Titles tokenized at a time (bounds the memory used by the exploded tokens)
+CHUNK_SIZE = 50000
+
+
+class PortugueseDetector:
+    """
+    Detects Portuguese titles over whole columns
+
+    A title is Portuguese when it has a Portuguese-specific character or at
+    least three distinct common Portuguese words. The score expresses the same
+    rule as a confidence between 0 and 1: 1.0 for a Portuguese character,
+    otherwise the fraction of the three words found.
+    """
+
+    def __init__(self, chars=PORTUGUESE_CHARS, words=PORTUGUESE_WORDS,
+                 min_words=MIN_PORTUGUESE_WORDS):
+        self.chars = frozenset(chars)
+        self.words = frozenset(words)
+        self.min_words = min_words
+        self._chars_pattern = "[" + "".join(sorted(self.chars)) + "]"
+
+    def scores(self, titles):
+        """Float Series (same index as titles) with the Portuguese confidence score"""
+        scores = np.zeros(len(titles))
+        for start in range(0, len(titles), CHUNK_SIZE):
+            chunk = titles.iloc[start:start + CHUNK_SIZE]
+            scores[start:start + len(chunk)] = self._score_chunk(chunk)
+        return pd.Series(scores, index=titles.index)
+
+    def _score_chunk(self, titles):
+        lower = titles.fillna("").astype(str).str.lower().reset_index(drop=True)
+        has_chars = lower.str.contains(self._chars_pattern, regex=True).to_numpy()
+
+        # Tokenize once; count distinct Portuguese words per title
+        tokens = lower.str.split().explode()
+        hits = tokens[tokens.isin(self.words)]
+        word_counts = np.zeros(len(lower))
+        if not hits.empty:
+            counts = hits.groupby(level=0).nunique()
+            word_counts[counts.index.to_numpy()] = counts.to_numpy()
+
+        return np.where(has_chars, 1.0, np.minimum(word_counts / self.min_words, 1.0))
+
+    def mask(self, titles, scores=None):
+        """Boolean Series: True for Portuguese titles"""
+        if scores is None:
+            scores = self.scores(titles)
+        return scores >= PORTUGUESE_THRESHOLD
+
+    def is_portuguese(self, title):
+        """Single-title check"""
+        if not title or pd.isna(title):
+            return False
+        title_lower = str(title).lower()
+        if not self.chars.isdisjoint(title_lower):
+            return True
+        return len(self.words.intersection(title_lower.split())) >= self.min_words
@@ -0,0 +1,277 @@
+"""
+Índice persistente dos links da base de dados para a deduplicação.
+Os links normalizados ficam em uma tabela SQLite (chave primária), construída uma
+única vez a partir do CSV da base e reconstruída automaticamente quando o arquivo
+muda. Quando a base apenas recebeu linhas novas no final, somente essas linhas
+são indexadas. Uma base em Parquet é lida apenas nas colunas indexadas.
+"""
+
+import hashlib
+import os
+import sqlite3
+import tempfile
+from contextlib import contextmanager
+from io import BytesIO
+
+import pandas as pd
+
+from ..scrapers.http_cache import normalize_link
+from .columnar import is_parquet, iter_parquet
+
+DEFAULT_INDEX_PATH = "data/state/link_index.sqlite"
+
+# Linhas da base lidas por vez ao construir o índice
+READ_CHUNK_ROWS = 50000
+
+# Colunas da base usadas pelo índice
+INDEXED_COLUMNS = ("link", "database", "category")
+
+# Links consultados por vez
+QUERY_BATCH_SIZE = 5000
+
+
+def file_sha256(path, limit=None):
+    """Hash SHA-256 do arquivo (ou dos primeiros `limit` bytes)"""
+    digest = hashlib.sha256()
+    remaining = limit
+    with open(path, "rb") as f:
+        while remaining is None or remaining > 0:
+            size = 1 << 20 if remaining is None else min(1 << 20, remaining)
+            block = f.read(size)
+            if not block:
+                break
+            digest.update(block)
+            if remaining is not None:
+                remaining -= len(block)
+    return digest.hexdigest()
+
+
+class LinkIndex:
+    """Conjunto persistente dos links normalizados da base de dados"""
+
+    def __init__(self, base_db_path="data/raw/base_database.csv", index_path=DEFAULT_INDEX_PATH):
+        self.base_db_path = base_db_path
+        self.index_path = index_path
+
+    @contextmanager
+    def _connect(self, path=None):
+        """Conexão que confirma a transação ao sair do bloco e é sempre fechada"""
+        conn = sqlite3.connect(path or self.index_path)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    @staticmethod
+    def _create_schema(conn):
+        conn.executescript("""
+            CREATE TABLE IF NOT EXISTS links (link TEXT PRIMARY KEY) WITHOUT ROWID;
+            CREATE TABLE IF NOT EXISTS sources (name TEXT PRIMARY KEY) WITHOUT ROWID;
+            CREATE TABLE IF NOT EXISTS categories (name TEXT PRIMARY KEY) WITHOUT ROWID;
+            CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+        """)
+
+    def _read_meta(self):
+        if not os.path.exists(self.index_path):
+            return {}
+        try:
+            with self._connect() as conn:
+                return dict(conn.execute("SELECT key, value FROM meta"))
+        except sqlite3.DatabaseError:
+            return {}
+
+    def ensure_current(self):
+        """
+        Garante que o índice corresponde à base atual
+
+        Compara caminho, tamanho e mtime da base; se mudaram, compara o hash.
+        Conteúdo apenas acrescentado no final é indexado incrementalmente;
+        qualquer outra mudança reconstrói o índice.
+
+        Returns:
+            str: 'current', 'updated', 'rebuilt' ou 'missing' (base inexistente)
+        """
+        if not os.path.exists(self.base_db_path):
+            return "missing"
+
+        stat = os.stat(self.base_db_path)
+        meta = self._read_meta()
+        base_path = os.path.abspath(self.base_db_path)
+
+        if meta.get("base_path") != base_path:
+            self.rebuild()
+            return "rebuilt"
+
+        if meta.get("mtime_ns") == str(stat.st_mtime_ns) and meta.get("size") == str(stat.st_size):
+            return "current"
+
+        sha256 = file_sha256(self.base_db_path)
+        if sha256 == meta.get("sha256"):
+            # Apenas o mtime mudou (ex.: arquivo copiado/tocado)
+            self._write_meta({"mtime_ns": stat.st_mtime_ns, "size": stat.st_size})
+            return "current"
+
+        old_size = int(meta.get("size", 0))
+        # Um arquivo Parquet é regravado por inteiro (rodapé no final): não há acréscimo
+        appendable = not is_parquet(self.base_db_path)
+        if appendable and 0 < old_size < stat.st_size and self._is_append(old_size, meta.get("sha256")):
+            self._index_tail(old_size, stat, sha256)
+            return "updated"
+
+        self.rebuild()
+        return "rebuilt"
+
+    def _is_append(self, old_size, old_sha256):
+        """Verifica se a base atual começa exatamente com o conteúdo já indexado"""
+        with open(self.base_db_path, "rb") as f:
+            f.seek(old_size - 1)
+            if f.read(1) != b"\n":
+                return False
+        return file_sha256(self.base_db_path, limit=old_size) == old_sha256
+
+    def rebuild(self):
+        """Reconstrói o índice a partir da base (gravação atômica)"""
+        directory = os.path.dirname(self.index_path) or "."
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        os.close(fd)
+
+        try:
+            with self._connect(tmp_path) as conn:
+                self._create_schema(conn)
+                if is_parquet(self.base_db_path):
+                    chunks = iter_parquet(self.base_db_path, INDEXED_COLUMNS, batch_size=READ_CHUNK_ROWS)
+                    rows = self._insert_chunks(conn, chunks)
+                else:
+                    with open(self.base_db_path, "rb") as f:
+                        rows = self._insert_rows(conn, f)
+                stat = os.stat(self.base_db_path)
+                self._store_meta(conn, {
+                    "base_path": os.path.abspath(self.base_db_path),
+                    "mtime_ns": stat.st_mtime_ns,
+                    "size": stat.st_size,
+                    "sha256": file_sha256(self.base_db_path),
+                    "rows": rows,
+                })
+            os.replace(tmp_path, self.index_path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+        print(f"🗂️ Índice de links reconstruído: {len(self)} links")
+
+    def _index_tail(self, old_size, stat, sha256):
+        """Indexa apenas as linhas acrescentadas ao final da base"""
+        with open(self.base_db_path, "rb") as f:
+            header = f.readline()
+            f.seek(old_size)
+            tail = f.read()
+
+        rows = int(self._read_meta().get("rows", 0))
+        with self._connect() as conn:
+            rows += self._insert_rows(conn, BytesIO(header + tail))
+            self._store_meta(conn, {
+                "mtime_ns": stat.st_mtime_ns,
+                "size": stat.st_size,
+                "sha256": sha256,
+                "rows": rows,
+            })
+
+        print(f"🗂️ Índice de links atualizado: {len(self)} links")
+
+    @classmethod
+    def _insert_rows(cls, conn, handle):
+        """Indexa as linhas de um CSV da base; retorna o número de linhas lidas"""
+        try:
+            chunks = pd.read_csv(handle, usecols=lambda c: c in INDEXED_COLUMNS, chunksize=READ_CHUNK_ROWS)
+            return cls._insert_chunks(conn, chunks)
+        except pd.errors.EmptyDataError:
+            return 0
+
+    @staticmethod
+    def _insert_chunks(conn, chunks):
+        """Indexa blocos (DataFrames) da base; retorna o número de linhas lidas"""
+        rows = 0
+        for chunk in chunks:
+            rows += len(chunk)
+            if "link" in chunk.columns:
+                links = (normalize_link(link) for link in chunk["link"])
+                conn.executemany(
+                    "INSERT OR IGNORE INTO links VALUES (?)",
+                    ((link,) for link in links if link is not None)
+                )
+            for column, table in (("database", "sources"), ("category", "categories")):
+                if column in chunk.columns:
+                    conn.executemany(
+                        f"INSERT OR IGNORE INTO {table} VALUES (?)",
+                        ((str(v),) for v in chunk[column].dropna().unique())
+                    )
+        return rows
+
+    def _write_meta(self, values):
+        with self._connect() as conn:
+            self._store_meta(conn, values)
+
+    @staticmethod
+    def _store_meta(conn, values):
+        conn.executemany(
+            "INSERT OR REPLACE INTO meta VALUES (?, ?)",
+            ((key, str(value)) for key, value in values.items())
+        )
+
+    def contains(self, links):
+        """
+        Verifica quais links já estão na base
+
+        Args:
+            links: sequência de links (não normalizados)
+
+        Returns:
+            list[bool]: na mesma ordem dos links
+        """
+        normalized = [normalize_link(link) for link in links]
+        found = set()
+
+        if not os.path.exists(self.index_path):
+            return [False] * len(normalized)
+
+        with self._connect() as conn:
+            for start in range(0, len(normalized), QUERY_BATCH_SIZE):
+                batch = [link for link in normalized[start:start + QUERY_BATCH_SIZE] if link is not None]
+                if not batch:
+                    continue
+                placeholders = ",".join("?" * len(batch))
+                found.update(
+                    row[0] for row in conn.execute(
+                        f"SELECT link FROM links WHERE link IN ({placeholders})", batch
+                    )
+                )
+
+        return [link is not None and link in found for link in normalized]
+
+    def load_links(self):
+        """Todos os links normalizados da base, para consultas em memória"""
+        if not os.path.exists(self.index_path):
+            return frozenset()
+        with self._connect() as conn:
+            return frozenset(row[0] for row in conn.execute("SELECT link FROM links"))
+
+    def statistics(self):
+        """Totais da base calculados na indexação (sem ler o CSV)"""
+        if not os.path.exists(self.index_path):
+            return {"total_records": 0, "unique_sources": 0, "unique_terms": 0}
+        with self._connect() as conn:
+            rows = conn.execute("SELECT value FROM meta WHERE key = 'rows'").fetchone()
+            return {
+                "total_records": int(rows[0]) if rows else 0,
+                "unique_sources": conn.execute("SELECT COUNT(*) FROM sources").fetchone()[0],
+                "unique_terms": conn.execute("SELECT COUNT(*) FROM categories").fetchone()[0],
+            }
+
+    def __len__(self):
+        if not os.path.exists(self.index_path):
+            return 0
+        with self._connect() as conn:
+            return conn.execute("SELECT COUNT(*) FROM links").fetchone()[0]
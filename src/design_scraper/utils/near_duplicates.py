@@ -0,0 +1,421 @@
+"""
+Detecção de quase-duplicatas por título e autores.
+Complementa a deduplicação exata por link: o mesmo artigo pode aparecer com URLs
+diferentes (article/view/821 e article/view/821/655, http e https) ou indexado por
+dois periódicos. Os títulos normalizados viram assinaturas MinHash indexadas em
+tabelas LSH, de modo que cada registro só é comparado com os candidatos que
+caem no mesmo balde (sem comparações O(n²)).
+"""
+
+import json
+import os
+import re
+import threading
+import unicodedata
+
+import numpy as np
+import pandas as pd
+
+from .columnar import read_table
+
+DEFAULT_CACHE_PATH = "data/state/near_duplicates.npz"
+
+# Constantes de 64 bits dos hashes multiplicativos (aritmética módulo 2^64)
+_GOLDEN = np.uint64(0x9E3779B97F4A7C15)
+_MIX = np.uint64(0xBF58476D1CE4E5B9)
+_SHIFT = np.uint64(32)
+
+_NON_ALNUM = re.compile(r"[^0-9a-z]+")
+
+# Valores de preenchimento dos scrapers que não identificam autores
+UNKNOWN_AUTHORS = {"autor desconhecido", "n a", ""}
+
+# Conectivos entre nomes de autores ("Silva e Souza", "Smith and Jones")
+_AUTHOR_CONNECTIVES = {"and"}
+
+
+def normalize_title(title):
+    """Título sem acentos, pontuação e diferenças de caixa/espaços"""
+    if title is None or pd.isna(title):
+        return ""
+    ascii_text = unicodedata.normalize("NFKD", str(title)).encode("ascii", "ignore").decode("ascii")
+    return _NON_ALNUM.sub(" ", ascii_text.lower()).strip()
+
+
+def normalize_titles(titles):
+    """normalize_title aplicada a uma coluna inteira"""
+    return (
+        titles.fillna("").astype(str)
+        .str.normalize("NFKD").str.encode("ascii", "ignore").str.decode("ascii")
+        .str.lower().str.replace(_NON_ALNUM, " ", regex=True).str.strip()
+    )
+
+
+def author_words(normalized):
+    """Palavras (3+ letras) dos nomes de autores já normalizados com normalize_title"""
+    if normalized in UNKNOWN_AUTHORS:
+        return frozenset()
+    return frozenset(
+        w for w in normalized.split() if len(w) >= 3 and w not in _AUTHOR_CONNECTIVES
+    )
+
+
+def normalize_authors(authors):
+    """Conjunto de palavras (3+ letras) dos nomes dos autores"""
+    return author_words(normalize_title(authors))
+
+
+def choose_bands(num_perm, threshold):
+    """
+    Escolhe (bandas, linhas por banda) para o LSH
+
+    Usa a divisão cujo limiar aproximado (1/b)^(1/r) é o maior que ainda fica
+    abaixo do limiar de similaridade, privilegiando não perder candidatos.
+    """
+    best = (num_perm, 1)
+    best_threshold = 0.0
+    for rows in range(1, num_perm + 1):
+        if num_perm % rows:
+            continue
+        bands = num_perm // rows
+        approx = (1 / bands) ** (1 / rows)
+        if best_threshold < approx <= threshold:
+            best, best_threshold = (bands, rows), approx
+    return best
+
+
+class MinHasher:
+    """Assinaturas MinHash de shingles de caracteres"""
+
+    def __init__(self, num_perm=64, shingle_size=5, seed=1):
+        if not 1 <= shingle_size <= 8:
+            raise ValueError("shingle_size deve estar entre 1 e 8 bytes")
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+        self.seed = seed
+        # Permutações por hash multiply-shift: (a * x + b) mod 2^64 >> 32, com a ímpar
+        rng = np.random.RandomState(seed)
+        high = rng.randint(0, 1 << 32, size=(2, num_perm), dtype=np.uint64)
+        low = rng.randint(0, 1 << 32, size=(2, num_perm), dtype=np.uint64)
+        self._a = (high[0] << _SHIFT) | low[0] | np.uint64(1)
+        self._b = (high[1] << _SHIFT) | low[1]
+
+    def _shingle_hashes(self, texts):
+        """
+        Hashes de 32 bits dos shingles de todos os textos, concatenados
+
+        Cada shingle de k bytes é empacotado em um inteiro e espalhado com um hash
+        multiplicativo, tudo em NumPy sobre os bytes do lote inteiro.
+
+        Returns:
+            tuple: (hashes, posição do primeiro shingle de cada texto)
+        """
+        k = self.shingle_size
+        encoded = [text.encode("utf-8").ljust(k) for text in texts]
+        lengths = np.fromiter(map(len, encoded), dtype=np.int64, count=len(encoded))
+        data = np.frombuffer(b"".join(encoded), dtype=np.uint8).astype(np.uint64)
+
+        windows = len(data) - k + 1
+        packed = np.zeros(windows, dtype=np.uint64)
+        for j in range(k):
+            packed = (packed << np.uint64(8)) | data[j:j + windows]
+
+        # Descarta as janelas que atravessam o fim de um texto
+        counts = lengths - k + 1
+        starts = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+        offsets = np.concatenate(([0], np.cumsum(counts)[:-1]))
+        positions = np.arange(counts.sum()) + np.repeat(starts - offsets, counts)
+
+        hashes = (packed[positions] * _GOLDEN) >> _SHIFT
+        return hashes, offsets
+
+    def signature(self, text):
+        """Assinatura (uint32[num_perm]) do texto já normalizado; None para texto vazio"""
+        if not text:
+            return None
+        return self.signatures([text])[0]
+
+    def signatures(self, texts, batch_size=5000):
+        """Matriz de assinaturas (uma linha por texto, já normalizado e não vazio)"""
+        result = np.empty((len(texts), self.num_perm), dtype=np.uint32)
+        for start in range(0, len(texts), batch_size):
+            batch = texts[start:start + batch_size]
+            hashes, offsets = self._shingle_hashes(batch)
+            # Uma permutação por vez sobre os shingles de todo o lote
+            for i in range(self.num_perm):
+                permuted = (self._a[i] * hashes + self._b[i]) >> _SHIFT
+                result[start:start + len(batch), i] = np.minimum.reduceat(permuted, offsets)
+        return result
+
+
+class LSHIndex:
+    """
+    Tabelas LSH (uma por banda) sobre assinaturas MinHash
+
+    Cada banda de uma assinatura é reduzida a uma chave de 64 bits. As chaves
+    indexadas em bloco ficam em arrays ordenados (consultados por busca binária);
+    as adicionadas uma a uma ficam em dicionários.
+    """
+
+    def __init__(self, bands, rows):
+        self.bands = bands
+        self.rows = rows
+        self.signatures = np.zeros((0, bands * rows), dtype=np.uint32)
+        self.links = []
+        self.authors = []
+        self._pending = []
+        self._sorted_keys = [np.zeros(0, dtype=np.uint64) for _ in range(bands)]
+        self._sorted_positions = [np.zeros(0, dtype=np.int64) for _ in range(bands)]
+        self._tables = [{} for _ in range(bands)]
+
+    def _band_keys(self, signatures):
+        """Chave de cada banda de cada assinatura: matriz (assinaturas x bandas)"""
+        grouped = signatures.reshape(len(signatures), self.bands, self.rows).astype(np.uint64)
+        keys = np.zeros(grouped.shape[:2], dtype=np.uint64)
+        for j in range(self.rows):
+            keys = (keys ^ grouped[:, :, j]) * _MIX
+        return keys
+
+    def add(self, signature, link, authors):
+        """Adiciona uma assinatura (authors: autores já normalizados)"""
+        position = len(self)
+        self._pending.append(signature)
+        self.links.append(link)
+        self.authors.append(authors)
+        for table, key in zip(self._tables, self._band_keys(signature[None, :])[0]):
+            table.setdefault(int(key), []).append(position)
+
+    def add_many(self, signatures, links, authors):
+        """Indexa uma matriz de assinaturas de uma vez (authors: autores já normalizados)"""
+        if self._pending:
+            # Mantém as posições: as assinaturas avulsas passam para a matriz
+            self.signatures = np.vstack([self.signatures, *self._pending])
+            self._pending = []
+        first = len(self)
+        self.signatures = np.vstack([self.signatures, signatures])
+        self.links.extend(links)
+        self.authors.extend(authors)
+
+        keys = self._band_keys(signatures)
+        positions = np.arange(first, first + len(signatures))
+        for i in range(self.bands):
+            merged_keys = np.concatenate([self._sorted_keys[i], keys[:, i]])
+            merged_positions = np.concatenate([self._sorted_positions[i], positions])
+            order = np.argsort(merged_keys, kind="stable")
+            self._sorted_keys[i] = merged_keys[order]
+            self._sorted_positions[i] = merged_positions[order]
+
+    def signature_at(self, position):
+        if position < len(self.signatures):
+            return self.signatures[position]
+        return self._pending[position - len(self.signatures)]
+
+    def candidates(self, signature):
+        """Posições das assinaturas que compartilham ao menos uma banda"""
+        found = set()
+        for i, key in enumerate(self._band_keys(signature[None, :])[0]):
+            keys = self._sorted_keys[i]
+            left = np.searchsorted(keys, key, side="left")
+            right = np.searchsorted(keys, key, side="right")
+            found.update(self._sorted_positions[i][left:right].tolist())
+            found.update(self._tables[i].get(int(key), ()))
+        return found
+
+    def __len__(self):
+        return len(self.links)
+
+
+class NearDuplicateDetector:
+    """
+    Sinaliza (ou remove) registros quase idênticos à base ou a outro registro novo
+
+    Dois registros são quase-duplicatas quando a similaridade de Jaccard estimada
+    entre os títulos normalizados atinge o limiar e, se ambos têm autores, eles
+    compartilham ao menos um nome.
+    """
+
+    def __init__(self, threshold=0.85, num_perm=64, action="flag", min_title_length=20,
+                 cache_path=DEFAULT_CACHE_PATH):
+        if action not in ("flag", "drop"):
+            raise ValueError(f"Ação inválida para quase-duplicatas: {action}")
+        self.threshold = threshold
+        self.action = action
+        self.min_title_length = min_title_length
+        self.cache_path = cache_path
+        self.hasher = MinHasher(num_perm)
+        self.bands, self.rows = choose_bands(num_perm, threshold)
+
+    @classmethod
+    def from_config(cls, config):
+        """Cria o detector a partir da seção 'near_duplicates' (None se desativado)"""
+        section = config.get("near_duplicates", {}) or {}
+        if not section.get("enabled", False):
+            return None
+        return cls(
+            threshold=section.get("threshold", 0.85),
+            num_perm=section.get("num_perm", 64),
+            action=section.get("action", "flag"),
+            min_title_length=section.get("min_title_length", 20),
+            cache_path=section.get("cache_path", DEFAULT_CACHE_PATH),
+        )
+
+    def _new_index(self):
+        return LSHIndex(self.bands, self.rows)
+
+    @staticmethod
+    def _columns(df):
+        """Colunas title, author e link (vazias quando ausentes)"""
+        empty = pd.Series("", index=df.index)
+        return tuple(df[c] if c in df.columns else empty for c in ("title", "author", "link"))
+
+    # ------------------------------------------------------------------
+    # Índice da base (assinaturas em cache no disco)
+    # ------------------------------------------------------------------
+
+    def _fingerprint(self, base_db_path):
+        stat = os.stat(base_db_path)
+        return {
+            "base_path": os.path.abspath(base_db_path),
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "num_perm": self.hasher.num_perm,
+            "shingle_size": self.hasher.shingle_size,
+            "seed": self.hasher.seed,
+            "min_title_length": self.min_title_length,
+        }
+
+    def _load_cache(self, fingerprint):
+        try:
+            with np.load(self.cache_path) as data:
+                if json.loads(str(data["meta"])) != fingerprint:
+                    return None
+                return data["signatures"], data["links"].tolist(), data["authors"].tolist()
+        except (OSError, KeyError, ValueError):
+            return None
+
+    def _save_cache(self, fingerprint, signatures, links, authors):
+        directory = os.path.dirname(self.cache_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{self.cache_path}.tmp.npz"
+        np.savez(
+            tmp_path,
+            meta=np.array(json.dumps(fingerprint)),
+            signatures=signatures,
+            links=np.array(links, dtype=str),
+            authors=np.array(authors, dtype=str),
+        )
+        os.replace(tmp_path, self.cache_path)
+
+    def index_base(self, base_db_path):
+        """Índice LSH dos títulos da base (assinaturas reaproveitadas do cache)"""
+        index = self._new_index()
+        if not os.path.exists(base_db_path):
+            return index
+
+        fingerprint = self._fingerprint(base_db_path)
+        cached = self._load_cache(fingerprint)
+
+        if cached is None:
+            base = read_table(base_db_path, columns=("title", "author", "link"))
+            titles, authors, links = self._columns(base)
+
+            normalized = normalize_titles(titles)
+            keep = (normalized.str.len() >= self.min_title_length).to_numpy()
+            cached = (
+                self.hasher.signatures(normalized[keep].tolist()),
+                links[keep].fillna("").astype(str).tolist(),
+                normalize_titles(authors[keep]).tolist(),
+            )
+            self._save_cache(fingerprint, *cached)
+
+        index.add_many(*cached)
+        return index
+
+    # ------------------------------------------------------------------
+    # Detecção
+    # ------------------------------------------------------------------
+
+    def _best_match(self, index, signature, authors):
+        best_link, best_score = None, 0.0
+        for position in index.candidates(signature):
+            other_authors = author_words(index.authors[position])
+            if authors and other_authors and authors.isdisjoint(other_authors):
+                continue
+            score = float(np.mean(index.signature_at(position) == signature))
+            if score >= self.threshold and score > best_score:
+                best_link, best_score = index.links[position], score
+        return best_link, best_score
+
+    def find(self, df, base_index):
+        """
+        Procura, para cada registro, uma quase-duplicata na base ou em um registro anterior
+
+        Returns:
+            tuple: (Series com o link do registro semelhante ou '', Series com a similaridade)
+        """
+        batch_index = self._new_index()
+        matches, scores = [], []
+
+        titles, authors_col, links_col = self._columns(df)
+        normalized = normalize_titles(titles)
+        comparable = (normalized.str.len() >= self.min_title_length).to_numpy()
+        signatures = iter(self.hasher.signatures(normalized[comparable].tolist()))
+
+        for ok, author, link in zip(comparable, normalize_titles(authors_col), links_col):
+            if not ok:
+                matches.append("")
+                scores.append(0.0)
+                continue
+
+            signature = next(signatures)
+            authors = author_words(author)
+            match, score = self._best_match(base_index, signature, authors)
+            if match is None:
+                match, score = self._best_match(batch_index, signature, authors)
+
+            matches.append(match or "")
+            scores.append(round(score, 3) if match is not None else 0.0)
+            if match is None:
+                # Só registros não duplicados servem de referência para os seguintes
+                batch_index.add(signature, "" if pd.isna(link) else str(link), author)
+
+        return pd.Series(matches, index=df.index), pd.Series(scores, index=df.index)
+
+    def apply(self, df, base_db_path):
+        """Sinaliza (colunas near_duplicate_of/near_duplicate_score) ou remove as quase-duplicatas"""
+        if df.empty:
+            return df
+
+        base_index = get_base_index(self, base_db_path)
+        matches, scores = self.find(df, base_index)
+        duplicated = matches != ""
+        print(f"🔎 Quase-duplicatas (similaridade ≥ {self.threshold}): {int(duplicated.sum())}")
+
+        if self.action == "drop":
+            return df[~duplicated]
+
+        df = df.copy()
+        df["near_duplicate_of"] = matches
+        df["near_duplicate_score"] = scores
+        return df
+
+
+_base_indexes = {}
+_base_indexes_lock = threading.Lock()
+
+
+def get_base_index(detector, base_db_path):
+    """Índice LSH da base compartilhado no processo (refeito quando a base muda)"""
+    fingerprint = (
+        json.dumps(detector._fingerprint(base_db_path), sort_keys=True)
+        if os.path.exists(base_db_path) else base_db_path
+    )
+    key = (fingerprint, detector.bands, detector.rows)
+    with _base_indexes_lock:
+        index = _base_indexes.get(key)
+        if index is None:
+            # Mantém apenas o índice da versão atual da base
+            _base_indexes.clear()
+            index = _base_indexes[key] = detector.index_base(base_db_path)
+        return index
@@ -0,0 +1,331 @@
+"""
+Armazenamento dos resultados brutos dos scrapers em partições por execução.
+Cada execução do pipeline grava apenas as suas linhas em data/raw/runs/<run_id>/
+(CSV comprimido ou Parquet), e um manifesto registra as partições com o número de linhas,
+as colunas, as fontes e os termos. Gravar é proporcional às linhas novas, e a
+leitura percorre as partições sob demanda, pulando as que o manifesto mostra
+não terem linhas de interesse. No modo streaming, a partição de uma execução é
+gravada em partes (part-00000, part-00001, ...) à medida que os resultados chegam.
+"""
+
+import json
+import os
+import secrets
+import shutil
+import threading
+from datetime import datetime
+
+import pandas as pd
+
+from .columnar import iter_parquet, require_pyarrow, write_parquet
+
+DEFAULT_DIRECTORY = "data/raw/runs"
+DEFAULT_FORMAT = "csv.gz"
+MANIFEST_NAME = "manifest.json"
+
+# Formatos de partição: extensão do arquivo e opções de leitura/escrita do pandas
+FORMATS = {
+    "csv.gz": {"filename": "results.csv.gz", "compression": "gzip"},
+    "csv": {"filename": "results.csv", "compression": None},
+    # Colunar: categoricals como dicionário, leitura com projeção e filtros (requer pyarrow)
+    "parquet": {"filename": "results.parquet", "compression": None},
+}
+
+# Nome das partes de uma partição gravada em streaming (+ extensão = nome do formato)
+PART_NAME = "part-{:05d}"
+
+
+def new_run_id():
+    """Identificador de execução ordenável por data (ex.: 20250824T101500_a1b2c3)"""
+    return f"{datetime.now().strftime('%Y%m%dT%H%M%S')}_{secrets.token_hex(3)}"
+
+
+class RawResultsStore:
+    """Partições (uma por execução) dos resultados brutos, com manifesto"""
+
+    def __init__(self, directory=DEFAULT_DIRECTORY, file_format=DEFAULT_FORMAT):
+        if file_format not in FORMATS:
+            raise ValueError(f"Formato de partição não suportado: {file_format}")
+        if file_format == "parquet":
+            require_pyarrow()
+        self.directory = directory
+        self.file_format = file_format
+        self.manifest_path = os.path.join(directory, MANIFEST_NAME)
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, config):
+        """Cria o armazenamento a partir da seção 'raw_results'"""
+        section = config.get("raw_results", {}) or {}
+        default_format = "parquet" if config.get("interchange_format") == "parquet" else DEFAULT_FORMAT
+        return cls(
+            directory=section.get("directory", DEFAULT_DIRECTORY),
+            file_format=section.get("format", default_format),
+        )
+
+    # ------------------------------------------------------------------
+    # Manifesto
+    # ------------------------------------------------------------------
+
+    def _load_manifest(self):
+        try:
+            with open(self.manifest_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {"version": 1, "runs": []}
+
+    def _save_manifest(self, manifest):
+        """Grava o manifesto de forma atômica (arquivo temporário + rename)"""
+        tmp_path = f"{self.manifest_path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, self.manifest_path)
+
+    def runs(self, run_ids=None, sources=None, terms=None, since=None, until=None):
+        """
+        Entradas do manifesto que podem conter linhas de interesse
+
+        Args:
+            run_ids: execuções a considerar
+            sources: valores aceitos da coluna 'fonte'
+            terms: valores aceitos da coluna 'termo'
+            since, until: limites (inclusivos) da data de gravação da execução
+        """
+        since = pd.Timestamp(since) if since is not None else None
+        until = pd.Timestamp(until) if until is not None else None
+        selected = []
+        for run in self._load_manifest()["runs"]:
+            if run_ids is not None and run["run_id"] not in run_ids:
+                continue
+            if sources is not None and set(run["sources"]).isdisjoint(sources):
+                continue
+            if terms is not None and set(run["terms"]).isdisjoint(terms):
+                continue
+            created_at = pd.Timestamp(run["created_at"])
+            if (since is not None and created_at < since) or (until is not None and created_at > until):
+                continue
+            selected.append(run)
+        return selected
+
+    def total_rows(self):
+        """Total de linhas em todas as partições (lido do manifesto)"""
+        return sum(run["rows"] for run in self._load_manifest()["runs"])
+
+    def __len__(self):
+        return len(self._load_manifest()["runs"])
+
+    # ------------------------------------------------------------------
+    # Escrita
+    # ------------------------------------------------------------------
+
+    def append(self, df, run_id=None, imported_from=None):
+        """
+        Grava os resultados de uma execução como uma nova partição
+
+        Returns:
+            dict: entrada do manifesto da partição
+        """
+        run_id = run_id or new_run_id()
+        relative_path = os.path.join(run_id, FORMATS[self.file_format]["filename"])
+        self._write_file(df, relative_path)
+
+        entry = {
+            "run_id": run_id,
+            "path": relative_path,
+            "format": self.file_format,
+            "rows": len(df),
+            "columns": list(df.columns),
+            "created_at": datetime.now().isoformat(timespec="seconds"),
+            "sources": self._distinct(df, "fonte"),
+            "terms": self._distinct(df, "termo"),
+        }
+        if imported_from:
+            entry["imported_from"] = imported_from
+
+        self._register(entry)
+        return entry
+
+    def open_run(self, run_id=None):
+        """Abre a partição de uma execução para gravação em partes (streaming)"""
+        return PartitionWriter(self, run_id or new_run_id())
+
+    def _write_file(self, df, relative_path):
+        """Grava um arquivo da partição (a gravação é atômica)"""
+        path = os.path.join(self.directory, relative_path)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        if self.file_format == "parquet":
+            write_parquet(df, path)
+        else:
+            tmp_path = f"{path}.tmp"
+            df.to_csv(tmp_path, index=False, compression=FORMATS[self.file_format]["compression"])
+            os.replace(tmp_path, path)
+
+    def _register(self, entry):
+        """Acrescenta a entrada ao manifesto (a partição só aparece depois de gravada por completo)"""
+        with self._lock:
+            manifest = self._load_manifest()
+            manifest["runs"].append(entry)
+            self._save_manifest(manifest)
+
+    @staticmethod
+    def _distinct(df, column):
+        if column not in df.columns:
+            return []
+        return sorted(str(v) for v in df[column].dropna().unique())
+
+    def remove_run(self, run_id):
+        """
+        Remove a partição de uma execução (ex.: a tentativa interrompida de uma execução retomada)
+
+        Returns:
+            int: linhas removidas, segundo o manifesto
+        """
+        with self._lock:
+            manifest = self._load_manifest()
+            removed = [run for run in manifest["runs"] if run["run_id"] == run_id]
+            if removed:
+                manifest["runs"] = [run for run in manifest["runs"] if run["run_id"] != run_id]
+                self._save_manifest(manifest)
+        # Também as partes gravadas em streaming que não chegaram ao manifesto
+        shutil.rmtree(os.path.join(self.directory, run_id), ignore_errors=True)
+        return sum(run["rows"] for run in removed)
+
+    def import_legacy(self, csv_path):
+        """
+        Importa uma vez o CSV acumulado (search_results.csv) como partição
+
+        Returns:
+            dict | None: entrada criada, ou None se não há o que importar
+        """
+        if not os.path.exists(csv_path):
+            return None
+        source = os.path.abspath(csv_path)
+        if any(run.get("imported_from") == source for run in self._load_manifest()["runs"]):
+            return None
+        try:
+            df = pd.read_csv(csv_path)
+        except pd.errors.EmptyDataError:
+            return None
+        return self.append(df, run_id=f"legacy_{new_run_id()}", imported_from=source)
+
+    # ------------------------------------------------------------------
+    # Leitura
+    # ------------------------------------------------------------------
+
+    def partition_path(self, run):
+        return os.path.join(self.directory, run["path"])
+
+    def partition_files(self, run):
+        """Arquivos de uma partição (as partes, se foi gravada em streaming)"""
+        return [os.path.join(self.directory, part) for part in run.get("parts", [run["path"]])]
+
+    def iter_partitions(self, columns=None, chunksize=None, **filters):
+        """
+        Percorre as partições selecionadas sob demanda (uma de cada vez)
+
+        Args:
+            columns: colunas a ler (as ausentes em uma partição são ignoradas)
+            chunksize: lê cada partição em blocos de até este número de linhas
+            **filters: run_ids, sources, terms, since, until (ver runs())
+
+        Yields:
+            DataFrame de cada partição (ou bloco), já filtrado por fonte/termo
+        """
+        sources = filters.get("sources")
+        terms = filters.get("terms")
+        usecols = None
+        if columns is not None:
+            # As colunas dos filtros são lidas mesmo fora da projeção
+            wanted = set(columns)
+            wanted.update(c for c, f in (("fonte", sources), ("termo", terms)) if f is not None)
+            usecols = wanted.__contains__
+
+        for run in self.runs(**filters):
+            for path in self.partition_files(run):
+                if run["format"] == "parquet":
+                    # Projeção e filtros aplicados na leitura do próprio arquivo
+                    yield from iter_parquet(
+                        path,
+                        columns=columns,
+                        filters={"fonte": sources, "termo": terms},
+                        batch_size=chunksize,
+                    )
+                    continue
+                reader = pd.read_csv(
+                    path,
+                    usecols=usecols,
+                    compression=FORMATS[run["format"]]["compression"],
+                    chunksize=chunksize,
+                )
+                for chunk in reader if chunksize else [reader]:
+                    if sources is not None and "fonte" in chunk.columns:
+                        chunk = chunk[chunk["fonte"].isin(sources)]
+                    if terms is not None and "termo" in chunk.columns:
+                        chunk = chunk[chunk["termo"].isin(terms)]
+                    if columns is not None:
+                        chunk = chunk[[c for c in chunk.columns if c in columns]]
+                    yield chunk
+
+    def read(self, columns=None, **filters):
+        """Resultados das partições selecionadas em um único DataFrame"""
+        frames = list(self.iter_partitions(columns=columns, **filters))
+        if not frames:
+            return pd.DataFrame(columns=columns or [])
+        return pd.concat(frames, ignore_index=True)
+
+
+class PartitionWriter:
+    """
+    Partição de uma execução gravada em partes, à medida que os resultados chegam
+
+    Cada parte é um arquivo completo (as colunas podem variar entre partes); a
+    partição entra no manifesto em close().
+    """
+
+    def __init__(self, store, run_id):
+        self.store = store
+        self.run_id = run_id
+        self.parts = []
+        self.rows = 0
+        self.columns = {}
+        self.sources = set()
+        self.terms = set()
+        self.created_at = datetime.now().isoformat(timespec="seconds")
+
+    def write(self, df):
+        """Grava um bloco de resultados como a próxima parte"""
+        if df.empty:
+            return
+        filename = f"{PART_NAME.format(len(self.parts))}.{self.store.file_format}"
+        relative_path = os.path.join(self.run_id, filename)
+        self.store._write_file(df, relative_path)
+
+        self.parts.append(relative_path)
+        self.rows += len(df)
+        self.columns.update(dict.fromkeys(df.columns))
+        self.sources.update(self.store._distinct(df, "fonte"))
+        self.terms.update(self.store._distinct(df, "termo"))
+
+    def close(self):
+        """
+        Registra a partição no manifesto
+
+        Returns:
+            dict | None: entrada do manifesto, ou None se nenhuma parte foi gravada
+        """
+        if not self.parts:
+            return None
+        entry = {
+            "run_id": self.run_id,
+            "path": self.run_id,
+            "parts": self.parts,
+            "format": self.store.file_format,
+            "rows": self.rows,
+            "columns": list(self.columns),
+            "created_at": self.created_at,
+            "sources": sorted(self.sources),
+            "terms": sorted(self.terms),
+        }
+        self.store._register(entry)
+        return entry
@@ -0,0 +1,170 @@
+"""
+Diário de execução (checkpoints) do pipeline automatizado.
+Cada unidade de trabalho (repositório, termo) tem os seus resultados gravados em
+data/state/runs/<run_id>/units/ à medida que chegam, e o diário (journal.json,
+gravado de forma atômica) registra o estado de cada unidade: concluída, com
+falha ou ignorada, e quantos resultados obteve. Se a execução é interrompida
+(erro, queda da máquina, Ctrl-C), `--resume <run_id>` relê as unidades
+concluídas e busca apenas as restantes.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import threading
+from datetime import datetime
+
+import pandas as pd
+
+from ..scrapers.publication import Publication, publications_to_frame
+
+DEFAULT_DIRECTORY = "data/state/runs"
+JOURNAL_NAME = "journal.json"
+UNITS_DIRECTORY = "units"
+
+# Estados de uma unidade no diário; apenas as concluídas são puladas ao retomar
+DONE = "done"
+FAILED = "failed"
+SKIPPED = "skipped"
+
+# Estados da execução
+RUNNING = "running"
+COMPLETED = "completed"
+
+
+class RunJournal:
+    """Estado por unidade de trabalho de uma execução, persistido em JSON"""
+
+    def __init__(self, run_id, directory=DEFAULT_DIRECTORY):
+        self.run_id = run_id
+        self.path = os.path.join(directory, run_id)
+        self.journal_path = os.path.join(self.path, JOURNAL_NAME)
+        self._lock = threading.Lock()
+        self.exists = os.path.exists(self.journal_path)
+        self.state = self._load()
+        # Partes gravadas por unidade nesta tentativa (ainda não registradas no diário)
+        self._parts = {}
+
+    @classmethod
+    def from_config(cls, config, run_id, force=False):
+        """
+        Cria o diário a partir da seção 'checkpoints'
+
+        Returns:
+            RunJournal | None: None se desativado (a menos que `force`, usado ao retomar)
+        """
+        section = config.get("checkpoints", {}) or {}
+        if not (force or section.get("enabled", False)):
+            return None
+        return cls(run_id, section.get("directory", DEFAULT_DIRECTORY))
+
+    @staticmethod
+    def _key(repo_name, term):
+        return f"{repo_name}|{term}"
+
+    def _load(self):
+        try:
+            with open(self.journal_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {
+                "version": 1,
+                "run_id": self.run_id,
+                "status": RUNNING,
+                "created_at": datetime.now().isoformat(timespec="seconds"),
+                "units": {},
+            }
+
+    def save(self):
+        """Grava o diário de forma atômica (arquivo temporário + rename)"""
+        with self._lock:
+            self._save()
+
+    def _save(self):
+        os.makedirs(self.path, exist_ok=True)
+        self.state["updated_at"] = datetime.now().isoformat(timespec="seconds")
+        tmp_path = f"{self.journal_path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.state, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, self.journal_path)
+        self.exists = True
+
+    # ------------------------------------------------------------------
+    # Consulta
+    # ------------------------------------------------------------------
+
+    @property
+    def status(self):
+        return self.state["status"]
+
+    def completed_units(self):
+        """Entradas das unidades concluídas"""
+        with self._lock:
+            return [unit for unit in self.state["units"].values() if unit["status"] == DONE]
+
+    def restore(self, repo_name, term):
+        """
+        Resultados de uma unidade concluída em uma tentativa anterior
+
+        Returns:
+            list[Publication] | None: None se a unidade ainda precisa ser buscada
+        """
+        with self._lock:
+            entry = self.state["units"].get(self._key(repo_name, term))
+        if entry is None or entry["status"] != DONE:
+            return None
+
+        records = []
+        for part in entry["parts"]:
+            # Texto como foi gravado (ex.: anos e datas não viram números)
+            df = pd.read_csv(os.path.join(self.path, part), dtype=str, compression="gzip")
+            for row in df.to_dict("records"):
+                records.append(Publication(**{k: v for k, v in row.items() if isinstance(v, str)}))
+        return records
+
+    # ------------------------------------------------------------------
+    # Escrita
+    # ------------------------------------------------------------------
+
+    def add(self, repo_name, term, records):
+        """Grava (de forma atômica) um bloco de resultados de uma unidade"""
+        if not records:
+            return
+        key = self._key(repo_name, term)
+        digest = hashlib.sha1(key.encode("utf-8")).hexdigest()[:12]
+        with self._lock:
+            parts = self._parts.setdefault(key, [])
+            relative_path = os.path.join(UNITS_DIRECTORY, f"{digest}-{len(parts):04d}.csv.gz")
+            parts.append(relative_path)
+
+        path = os.path.join(self.path, relative_path)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        publications_to_frame(records).to_csv(tmp_path, index=False, compression="gzip")
+        os.replace(tmp_path, path)
+
+    def complete(self, repo_name, term, status, records=0, error=None):
+        """Registra o fim de uma unidade (apenas as concluídas são puladas ao retomar)"""
+        key = self._key(repo_name, term)
+        with self._lock:
+            parts = self._parts.pop(key, [])
+            self.state["units"][key] = {
+                "repo": repo_name,
+                "term": term,
+                "status": status,
+                "records": records,
+                "parts": parts if status == DONE else [],
+                "error": error,
+                "finished_at": datetime.now().isoformat(timespec="seconds"),
+            }
+            self._save()
+
+    def finish(self):
+        """Marca a execução como concluída e remove os resultados das unidades"""
+        with self._lock:
+            self.state["status"] = COMPLETED
+            for unit in self.state["units"].values():
+                unit["parts"] = []
+            self._save()
+        shutil.rmtree(os.path.join(self.path, UNITS_DIRECTORY), ignore_errors=True)
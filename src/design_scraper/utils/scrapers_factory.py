@@ -1,28 +1,24 @@
-from ..scrapers.estudosemdesign_scraper import EstudosEmDesignScraper
-from ..scrapers.infodesign_scraper import InfoDesignScraper
-
-from ..scrapers.humanfactorsindesign_scraper import HumanFactorsinDesignScraper
-from ..scrapers.arcosdesign_scraper import ArcosDesignScraper
-from ..scrapers.designetecnologia_scraper import DesigneTecnologiaScraper
-from ..scrapers.triades_scraper import TriadesScraper
 from ..scrapers.educacaografica_scraper import EducacaoGraficaScraper
+from ..scrapers.oai_pmh_scraper import OAIPMHScraper
+from ..scrapers.ojs_scraper import OJSScraper, load_ojs_profiles
 
 class ScrapterFactory:
     @staticmethod
     def get_scraper(scraper_name: str):
         scrapers = {
-            "estudos_em_design": EstudosEmDesignScraper(base_url="https://estudosemdesign.emnuvens.com.br/design/search/search"),
-            "infodesign": InfoDesignScraper(base_url="https://www.infodesign.org.br/infodesign/search/index"),
-            "human_factors_in_design": HumanFactorsinDesignScraper(base_url="https://www.revistas.udesc.br/index.php/hfd/search/index"),
-            "arcos_design": ArcosDesignScraper(base_url="https://www.e-publicacoes.uerj.br/arcosdesign/search/index"),
-            "design_e_tecnologia": DesigneTecnologiaScraper(base_url="https://www.ufrgs.br/det/index.php/det/search/search"),
-            "triades": TriadesScraper(base_url="https://periodicos.ufjf.br/index.php/triades/search/search"),
-            "educacao_grafica": EducacaoGraficaScraper(base_url="https://www.educacaografica.inf.br/")
+            "educacao_grafica": EducacaoGraficaScraper(base_url="https://www.educacaografica.inf.br/"),
         }
 
+        # Periódicos OJS: um perfil por periódico em config/ojs_profiles.yaml,
+        # com a variante "_oai" para colheita em lote via OAI-PMH
+        for name, profile in load_ojs_profiles().items():
+            scrapers[name] = OJSScraper(profile=profile)
+            if profile.oai_url:
+                scrapers[f"{name}_oai"] = OAIPMHScraper(base_url=profile.oai_url)
+
         scraper = scrapers.get(scraper_name)
 
         if scraper is None:
             raise ValueError(f"Scraper '{scraper_name}' não encontrado.")
         
-        return scraper
\ No newline at end of file
+        return scraper
@@ -0,0 +1,365 @@
+"""
+Armazenamento opcional do pipeline em SQLite.
+Os resultados brutos, filtrados, os novos registros e a base ficam em tabelas de
+um único arquivo, com índices em link, database, category e year. A deduplicação
+vira um anti-join indexado e as estatísticas, consultas agregadas; os CSVs
+continuam sendo exportados para a importação no Softr.
+"""
+
+import os
+import sqlite3
+from contextlib import contextmanager
+from datetime import datetime
+
+import pandas as pd
+
+from .columnar import is_parquet, iter_parquet
+from .link_index import normalize_link
+
+DEFAULT_PATH = "data/state/pipeline.sqlite"
+
+RAW_TABLE = "raw_results"
+FILTERED_TABLE = "filtered_results"
+NEW_RECORDS_TABLE = "new_records"
+BASE_TABLE = "base_records"
+TABLES = (RAW_TABLE, FILTERED_TABLE, NEW_RECORDS_TABLE, BASE_TABLE)
+
+# Colunas indexadas quando existem na tabela (fonte/termo são database/category nos brutos)
+INDEXED_COLUMNS = ("link", "database", "category", "year", "fonte", "termo")
+
+# Colunas internas (prefixo "_"): ordem de gravação, execução e link normalizado
+INTERNAL_COLUMNS = ("_rowid", "_run_id", "_link_key")
+
+# Linhas gravadas/lidas por vez
+WRITE_BATCH_ROWS = 5000
+READ_CHUNK_ROWS = 50000
+
+
+def _quote(name):
+    """Identificador SQL entre aspas (a base tem colunas como '🔐 Softr Record ID')"""
+    return '"' + str(name).replace('"', '""') + '"'
+
+
+class SQLiteStore:
+    """Tabelas do pipeline em um arquivo SQLite (modo WAL: leituras concorrentes)"""
+
+    def __init__(self, path=DEFAULT_PATH):
+        self.path = path
+
+    @classmethod
+    def from_config(cls, config):
+        """Cria o armazenamento se storage.backend for 'sqlite' (None caso contrário)"""
+        section = config.get("storage", {}) or {}
+        if section.get("backend", "csv") != "sqlite":
+            return None
+        return cls(section.get("sqlite_path", DEFAULT_PATH))
+
+    @contextmanager
+    def _connect(self):
+        """Conexão que confirma a transação ao sair do bloco e é sempre fechada"""
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        conn = sqlite3.connect(self.path, timeout=30)
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    # ------------------------------------------------------------------
+    # Esquema
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _columns(conn, table):
+        """Colunas de dados da tabela (sem as internas), na ordem de criação"""
+        return [
+            row[1] for row in conn.execute(f"PRAGMA table_info({table})")
+            if row[1] not in INTERNAL_COLUMNS
+        ]
+
+    def _ensure_table(self, conn, table, columns):
+        """Cria a tabela e acrescenta as colunas que ainda não existem (com índices)"""
+        conn.execute(
+            f"CREATE TABLE IF NOT EXISTS {table} "
+            "(_rowid INTEGER PRIMARY KEY, _run_id TEXT, _link_key TEXT)"
+        )
+        conn.execute(f"CREATE INDEX IF NOT EXISTS {table}__link_key ON {table} (_link_key)")
+        conn.execute(f"CREATE INDEX IF NOT EXISTS {table}__run_id ON {table} (_run_id)")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS runs "
+            "(run_id TEXT PRIMARY KEY, created_at TEXT, rows INTEGER)"
+        )
+        conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+
+        existing = set(self._columns(conn, table))
+        for column in columns:
+            if column in existing:
+                continue
+            # Sem tipo declarado: cada valor mantém o próprio tipo (ex.: year inteiro ou 'N/A')
+            conn.execute(f"ALTER TABLE {table} ADD COLUMN {_quote(column)}")
+            if column in INDEXED_COLUMNS:
+                conn.execute(
+                    f"CREATE INDEX IF NOT EXISTS {table}_{column} ON {table} ({_quote(column)})"
+                )
+
+    # ------------------------------------------------------------------
+    # Escrita
+    # ------------------------------------------------------------------
+
+    def write(self, table, df, run_id=None, replace=False):
+        """
+        Grava um DataFrame em uma tabela
+
+        Args:
+            table: uma de TABLES
+            df: registros a gravar
+            run_id: execução que produziu os registros
+            replace: apaga o conteúdo anterior da tabela (mesma transação)
+
+        Returns:
+            int: linhas gravadas
+        """
+        if table not in TABLES:
+            raise ValueError(f"Tabela desconhecida: {table}")
+
+        with self._connect() as conn:
+            if replace and self._exists(conn, table):
+                conn.execute(f"DELETE FROM {table}")
+            self._insert(conn, table, df, run_id)
+
+            if run_id is not None and table == RAW_TABLE:
+                conn.execute(
+                    "INSERT OR REPLACE INTO runs VALUES (?, ?, ?)",
+                    (run_id, datetime.now().isoformat(timespec="seconds"), len(df))
+                )
+        return len(df)
+
+    def _insert(self, conn, table, df, run_id=None):
+        """Insere as linhas do DataFrame na transação da conexão"""
+        columns = [str(c) for c in df.columns]
+        self._ensure_table(conn, table, columns)
+
+        placeholders = ", ".join("?" * (len(columns) + 2))
+        insert = (
+            f"INSERT INTO {table} (_run_id, _link_key, {', '.join(map(_quote, columns))}) "
+            f"VALUES ({placeholders})"
+        )
+        links = df["link"] if "link" in df.columns else pd.Series(None, index=df.index)
+        for start in range(0, len(df), WRITE_BATCH_ROWS):
+            batch = df.iloc[start:start + WRITE_BATCH_ROWS]
+            values = batch.astype(object).where(batch.notna(), None).itertuples(index=False)
+            keys = links.iloc[start:start + WRITE_BATCH_ROWS].map(normalize_link)
+            conn.executemany(
+                insert,
+                ((run_id, key, *row) for key, row in zip(keys, values))
+            )
+
+    def delete_run(self, table, run_id):
+        """
+        Apaga as linhas gravadas por uma execução (ex.: ao retomá-la)
+
+        Returns:
+            int: linhas apagadas
+        """
+        if table not in TABLES:
+            raise ValueError(f"Tabela desconhecida: {table}")
+        with self._connect() as conn:
+            if not self._exists(conn, table):
+                return 0
+            deleted = conn.execute(f"DELETE FROM {table} WHERE _run_id = ?", (run_id,)).rowcount
+            if table == RAW_TABLE and self._exists(conn, "runs"):
+                conn.execute("DELETE FROM runs WHERE run_id = ?", (run_id,))
+        return deleted
+
+    def sync_base(self, base_db_path):
+        """
+        Recarrega a tabela da base quando o CSV muda (caminho, tamanho ou mtime)
+
+        A tabela é esvaziada e recarregada em uma única transação: se a leitura
+        falhar no meio, a base anterior continua intacta.
+
+        Returns:
+            str: 'current', 'loaded' ou 'missing'
+        """
+        if not os.path.exists(base_db_path):
+            return "missing"
+
+        stat = os.stat(base_db_path)
+        fingerprint = f"{os.path.abspath(base_db_path)}|{stat.st_size}|{stat.st_mtime_ns}"
+        with self._connect() as conn:
+            conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+            row = conn.execute("SELECT value FROM meta WHERE key = 'base_fingerprint'").fetchone()
+        if row and row[0] == fingerprint:
+            return "current"
+
+        if is_parquet(base_db_path):
+            chunks = iter_parquet(base_db_path, batch_size=READ_CHUNK_ROWS)
+        else:
+            chunks = pd.read_csv(base_db_path, chunksize=READ_CHUNK_ROWS)
+        with self._connect() as conn:
+            # Esvazia a tabela antes da carga: uma base sem linhas pode não gerar nenhum bloco
+            # (ex.: Parquet vazio), e a tabela ficaria com a base anterior
+            if self._exists(conn, BASE_TABLE):
+                conn.execute(f"DELETE FROM {BASE_TABLE}")
+            for chunk in chunks:
+                self._insert(conn, BASE_TABLE, chunk)
+            conn.execute(
+                "INSERT OR REPLACE INTO meta VALUES ('base_fingerprint', ?)", (fingerprint,)
+            )
+        print(f"🗂️ Base carregada no SQLite: {self.count(BASE_TABLE)} registros")
+        return "loaded"
+
+    # ------------------------------------------------------------------
+    # Leitura
+    # ------------------------------------------------------------------
+
+    def _exists(self, conn, table):
+        return conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (table,)
+        ).fetchone() is not None
+
+    def _select(self, conn, table, columns=None):
+        available = self._columns(conn, table)
+        if columns is not None:
+            available = [c for c in available if c in columns]
+        return ", ".join(map(_quote, available)) or "NULL AS _empty"
+
+    def read(self, table, columns=None):
+        """Conteúdo de uma tabela como DataFrame (na ordem de gravação)"""
+        with self._connect() as conn:
+            if not self._exists(conn, table):
+                return pd.DataFrame(columns=columns or [])
+            query = f"SELECT {self._select(conn, table, columns)} FROM {table} ORDER BY _rowid"
+            return pd.read_sql_query(query, conn)
+
+    def iter_partitions(self, columns=None, chunksize=None, run_ids=None, sources=None,
+                        terms=None, since=None, until=None):
+        """
+        Percorre os resultados brutos em blocos (mesma interface do RawResultsStore)
+
+        Os filtros viram condições SQL sobre colunas indexadas.
+        """
+        conditions, params = [], []
+        if run_ids is not None:
+            conditions.append(f"_run_id IN ({', '.join('?' * len(run_ids))})")
+            params.extend(run_ids)
+        if since is not None or until is not None:
+            bounds, bound_params = [], []
+            if since is not None:
+                bounds.append("created_at >= ?")
+                bound_params.append(pd.Timestamp(since).isoformat())
+            if until is not None:
+                bounds.append("created_at <= ?")
+                bound_params.append(pd.Timestamp(until).isoformat())
+            conditions.append(f"_run_id IN (SELECT run_id FROM runs WHERE {' AND '.join(bounds)})")
+            params.extend(bound_params)
+
+        with self._connect() as conn:
+            if not self._exists(conn, RAW_TABLE):
+                return
+            available = set(self._columns(conn, RAW_TABLE))
+            for column, values in (("fonte", sources), ("termo", terms)):
+                if values is None:
+                    continue
+                if column not in available:
+                    return
+                conditions.append(f"{column} IN ({', '.join('?' * len(values))})")
+                params.extend(values)
+
+            where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+            query = (
+                f"SELECT {self._select(conn, RAW_TABLE, columns)} FROM {RAW_TABLE} "
+                f"{where} ORDER BY _rowid"
+            )
+            reader = pd.read_sql_query(query, conn, params=params, chunksize=chunksize)
+            for chunk in reader if chunksize else [reader]:
+                yield chunk
+
+    def count(self, table):
+        with self._connect() as conn:
+            if not self._exists(conn, table):
+                return 0
+            return conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+
+    # ------------------------------------------------------------------
+    # Deduplicação e estatísticas
+    # ------------------------------------------------------------------
+
+    def find_new_records(self):
+        """
+        Registros filtrados cujo link não está na base (anti-join pelo link normalizado)
+
+        Entre os próprios resultados filtrados mantém a primeira ocorrência de cada link.
+        """
+        with self._connect() as conn:
+            if not self._exists(conn, FILTERED_TABLE):
+                return pd.DataFrame()
+            columns = self._select(conn, FILTERED_TABLE)
+            if not self._exists(conn, BASE_TABLE) or not conn.execute(
+                f"SELECT 1 FROM {BASE_TABLE} LIMIT 1"
+            ).fetchone():
+                # Base vazia: todos os registros são novos
+                return pd.read_sql_query(
+                    f"SELECT {columns} FROM {FILTERED_TABLE} ORDER BY _rowid", conn
+                )
+            query = f"""
+                SELECT {columns} FROM {FILTERED_TABLE} AS f
+                WHERE NOT EXISTS (
+                    SELECT 1 FROM {BASE_TABLE} AS b WHERE b._link_key = f._link_key
+                )
+                AND f._rowid = (
+                    SELECT MIN(_rowid) FROM {FILTERED_TABLE} WHERE _link_key IS f._link_key
+                )
+                ORDER BY f._rowid
+            """
+            return pd.read_sql_query(query, conn)
+
+    def statistics(self):
+        """Totais da base (mesmas chaves de Deduplicator.get_statistics)"""
+        with self._connect() as conn:
+            if not self._exists(conn, BASE_TABLE):
+                return {"total_records": 0, "unique_sources": 0, "unique_terms": 0}
+            available = set(self._columns(conn, BASE_TABLE))
+            aggregates = ["COUNT(*)"] + [
+                f"COUNT(DISTINCT {column})" if column in available else "0"
+                for column in ("database", "category")
+            ]
+            total, sources, terms = conn.execute(
+                f"SELECT {', '.join(aggregates)} FROM {BASE_TABLE}"
+            ).fetchone()
+        return {"total_records": total, "unique_sources": sources, "unique_terms": terms}
+
+    def status(self):
+        """Número de linhas de cada tabela e de execuções gravadas"""
+        status = {f"{table}_rows": self.count(table) for table in TABLES}
+        with self._connect() as conn:
+            status["raw_runs"] = (
+                conn.execute("SELECT COUNT(*) FROM runs").fetchone()[0]
+                if self._exists(conn, "runs") else 0
+            )
+        return status
+
+    # ------------------------------------------------------------------
+    # Exportação
+    # ------------------------------------------------------------------
+
+    def export_csv(self, table, output_path):
+        """Exporta uma tabela para CSV (ex.: para importação no Softr)"""
+        directory = os.path.dirname(output_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with self._connect() as conn:
+            if not self._exists(conn, table):
+                pd.DataFrame().to_csv(output_path, index=False)
+                return 0
+            query = f"SELECT {self._select(conn, table)} FROM {table} ORDER BY _rowid"
+            rows = 0
+            for i, chunk in enumerate(pd.read_sql_query(query, conn, chunksize=READ_CHUNK_ROWS)):
+                chunk.to_csv(output_path, index=False, mode="w" if i == 0 else "a", header=i == 0)
+                rows += len(chunk)
+            if rows == 0:
+                pd.DataFrame(columns=self._columns(conn, table)).to_csv(output_path, index=False)
+        return rows
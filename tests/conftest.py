@@ -0,0 +1,101 @@
+import os
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+# Add the src directory to the Python path (as the scripts in cli/ do)
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from design_scraper.scrapers.base_scraper import BaseScraper  # noqa: E402
+from design_scraper.scrapers.fetch_policy import CircuitBreaker, RetryPolicy  # noqa: E402
+from design_scraper.scrapers.publication import Publication  # noqa: E402
+from design_scraper.scrapers.transport import HTTPTransport  # noqa: E402
+
+
+class StubSite:
+    """
+    Servidor HTTP local para os testes
+
+    `handler(path, query, headers)` retorna (status, cabeçalhos, corpo); cada
+    requisição fica registrada em `requests` como (path, query, headers).
+    """
+
+    def __init__(self):
+        self.handler = lambda path, query, headers: (404, {}, "")
+        self.requests = []
+        site = self
+
+        class Handler(BaseHTTPRequestHandler):
+            # Mantém a conexão aberta entre requisições (keep-alive)
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                parsed = urlparse(self.path)
+                query = parse_qs(parsed.query)
+                site.requests.append((parsed.path, query, dict(self.headers)))
+                status, headers, body = site.handler(parsed.path, query, self.headers)
+                body = body.encode("utf-8") if isinstance(body, str) else body
+                self.send_response(status)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+def results_page(links, page, total_pages):
+    """Página de resultados com a marcação de paginação "Página N de M" """
+    items = "".join(f'<li><a href="{link}">Design de interfaces {link}</a></li>' for link in links)
+    return (
+        f'<html><body><ul class="search_results">{items}</ul>'
+        f'<div class="pagination">Página {page} de {total_pages}</div></body></html>'
+    )
+
+
+def page_number(query):
+    return int(query.get("searchPage", ["1"])[0])
+
+
+class ListScraper(BaseScraper):
+    """Scraper mínimo para as páginas de results_page"""
+
+    newest_first_params = {"sort": "date"}
+
+    def build_url(self, term, page):
+        return f"{self.base_url}/search?query={term}&searchPage={page}"
+
+    def parse_results(self, soup):
+        return [
+            Publication(title=a.get_text(strip=True), link=a["href"])
+            for a in soup.select("ul.search_results li a")
+        ]
+
+
+def make_transport(max_retries=0, failure_threshold=5, cache=None):
+    """Transporte sem espera entre tentativas nem limite de taxa"""
+    return HTTPTransport(
+        cache=cache,
+        retry_policy=RetryPolicy(max_retries=max_retries, backoff_base=0, backoff_max=0),
+        circuit_breaker=CircuitBreaker(failure_threshold=failure_threshold),
+    )
+
+
+@pytest.fixture
+def stub_site():
+    site = StubSite()
+    yield site
+    site.close()
@@ -0,0 +1,83 @@
+import os
+
+import pandas as pd
+import pytest
+import yaml
+
+from design_scraper.utils.deduplication import deduplicate_records, get_shared_deduplicator
+
+ROOT = os.path.join(os.path.dirname(__file__), "..")
+
+
+def test_deduplicate_records_keeps_only_links_missing_from_base(tmp_path):
+    base_db_path = tmp_path / "base_database.csv"
+    pd.DataFrame({
+        "title": ["Design de interfaces"],
+        "link": ["https://revista.br/article/view/1"],
+        "database": ["Estudos em Design"],
+        "category": ["interface"],
+    }).to_csv(base_db_path, index=False)
+
+    results = pd.DataFrame({
+        "title": ["Design de interfaces", "Ergonomia informacional", "Ergonomia informacional"],
+        "link": [
+            "https://revista.br/article/view/1/",
+            "https://revista.br/article/view/2",
+            "https://revista.br/article/view/2",
+        ],
+    })
+
+    new_records = deduplicate_records(
+        results,
+        base_db_path=str(base_db_path),
+        index_path=str(tmp_path / "link_index.sqlite"),
+        near_duplicates={"enabled": False},
+    )
+
+    assert list(new_records["link"]) == ["https://revista.br/article/view/2"]
+
+
+@pytest.mark.parametrize("config_path", ["config.yaml", "src/design_scraper/config/config.yaml"])
+def test_shipped_config_keeps_softr_columns(tmp_path, config_path):
+    with open(os.path.join(ROOT, config_path), encoding="utf-8") as f:
+        near_duplicates = yaml.safe_load(f)["deduplication"]["near_duplicates"]
+
+    results = pd.DataFrame({
+        "title": ["Ergonomia informacional em interfaces digitais"] * 2,
+        "link": ["https://revista.br/article/view/2", "https://outra.br/article/view/9"],
+    })
+    new_records = deduplicate_records(
+        results,
+        base_db_path=str(tmp_path / "base_database.csv"),
+        index_path=str(tmp_path / "link_index.sqlite"),
+        near_duplicates=near_duplicates,
+    )
+
+    assert list(new_records.columns) == ["title", "link"]
+    assert len(new_records) == 2
+
+
+def test_shared_deduplicator_is_reused_until_base_changes(tmp_path):
+    base_db_path = tmp_path / "base_database.csv"
+    index_path = str(tmp_path / "link_index.sqlite")
+    pd.DataFrame({"title": ["Design"], "link": ["https://revista.br/article/view/1"]}).to_csv(
+        base_db_path, index=False
+    )
+    results = pd.DataFrame({
+        "title": ["Design", "Ergonomia"],
+        "link": ["https://revista.br/article/view/1", "https://revista.br/article/view/2"],
+    })
+
+    first = get_shared_deduplicator(str(base_db_path), index_path)
+    assert get_shared_deduplicator(str(base_db_path), index_path) is first
+    assert get_shared_deduplicator(str(base_db_path), index_path, {"enabled": False}) is not first
+    assert list(first.deduplicate(results)["link"]) == ["https://revista.br/article/view/2"]
+
+    # A base recebe o segundo link: o deduplicador compartilhado é recarregado
+    results.tail(1).to_csv(base_db_path, mode="a", header=False, index=False)
+    second = get_shared_deduplicator(str(base_db_path), index_path)
+    assert second is not first
+    assert deduplicate_records(results, str(base_db_path), index_path).empty
+
+    # Deduplicação em memória: além da base, apenas o índice existe no diretório
+    assert sorted(os.listdir(tmp_path)) == ["base_database.csv", "link_index.sqlite"]
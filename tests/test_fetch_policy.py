@@ -0,0 +1,56 @@
+import pytest
+
+from conftest import ListScraper, make_transport, page_number, results_page
+from design_scraper.core import fetch_engine
+from design_scraper.core.fetch_engine import FetchEngine
+from design_scraper.scrapers.fetch_policy import CircuitOpenError, FetchError
+
+PAGE_1 = ["https://revista.br/article/view/1", "https://revista.br/article/view/2"]
+
+
+def test_retries_then_raises_fetch_error_with_last_response(stub_site):
+    stub_site.handler = lambda path, query, headers: (503, {}, "")
+    transport = make_transport(max_retries=2)
+
+    with pytest.raises(FetchError) as excinfo:
+        transport.get(f"{stub_site.url}/search")
+
+    assert excinfo.value.response.status_code == 503
+    assert len(stub_site.requests) == 3
+    assert transport.get_stats()["retries"] == 2
+    assert transport.get_stats()["failures"] == 1
+
+
+def test_circuit_opens_after_consecutive_failures(stub_site):
+    stub_site.handler = lambda path, query, headers: (500, {}, "")
+    transport = make_transport(failure_threshold=2)
+
+    for _ in range(2):
+        with pytest.raises(FetchError):
+            transport.get(f"{stub_site.url}/search")
+
+    with pytest.raises(CircuitOpenError):
+        transport.get(f"{stub_site.url}/search")
+    assert len(stub_site.requests) == 2
+
+
+def test_persistent_5xx_reports_unit_as_errored_and_keeps_partial_results(stub_site, monkeypatch):
+    def handler(path, query, headers):
+        if page_number(query) == 1:
+            return 200, {}, results_page(PAGE_1, 1, 3)
+        return 503, {}, ""
+
+    stub_site.handler = handler
+    transport = make_transport(max_retries=1)
+    monkeypatch.setattr(
+        fetch_engine.ScrapterFactory, "get_scraper",
+        staticmethod(lambda key: ListScraper(stub_site.url, transport)),
+    )
+
+    results, repo_stats = FetchEngine(transport=transport).run({"Stub": "stub"}, ["design"], 3)
+
+    assert repo_stats["Stub"]["errors"] == 1
+    assert repo_stats["Stub"]["results"] == len(PAGE_1)
+    assert [(r.link, r.fonte, r.termo) for r in results] == [
+        (link, "Stub", "design") for link in PAGE_1
+    ]
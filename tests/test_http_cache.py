@@ -0,0 +1,81 @@
+import os
+
+import requests
+
+from conftest import make_transport
+from design_scraper.scrapers.http_cache import ResponseCache
+
+
+def _response(url, body):
+    response = requests.Response()
+    response.status_code = 200
+    response.url = url
+    response._content = body
+    return response
+
+
+def _disk_size(directory):
+    return sum(
+        os.path.getsize(os.path.join(folder, name))
+        for folder, _, names in os.walk(directory) for name in names
+    )
+
+
+def test_size_is_counted_once_per_store(tmp_path):
+    cache = ResponseCache(str(tmp_path / "cache"), max_size_mb=10)
+
+    cache.store("https://revista.br/1", _response("https://revista.br/1", b"a" * 1000))
+    assert cache._current_size() == _disk_size(cache.directory)
+
+    cache.store("https://revista.br/1", _response("https://revista.br/1", b"b" * 400))
+    cache.store("https://revista.br/2", _response("https://revista.br/2", b"c" * 700))
+    assert cache._current_size() == _disk_size(cache.directory)
+
+
+def test_least_recently_used_entries_are_evicted_first(tmp_path):
+    cache = ResponseCache(str(tmp_path / "cache"), max_size_mb=2500 / (1024 * 1024))
+
+    for name in ("1", "2"):
+        url = f"https://revista.br/{name}"
+        cache.store(url, _response(url, b"x" * 1000))
+    os.utime(cache._paths(cache.key_for("https://revista.br/2"))[0], (1, 1))
+
+    cache.store("https://revista.br/3", _response("https://revista.br/3", b"x" * 1000))
+
+    assert cache.lookup("https://revista.br/2") is None
+    assert cache.lookup("https://revista.br/1") is not None
+    assert cache.lookup("https://revista.br/3") is not None
+    assert cache._current_size() == _disk_size(cache.directory)
+
+
+def test_expired_entry_is_revalidated_with_etag(stub_site, tmp_path):
+    def handler(path, query, headers):
+        if headers.get("If-None-Match") == '"v1"':
+            return 304, {}, ""
+        return 200, {"ETag": '"v1"'}, "<html>página</html>"
+
+    stub_site.handler = handler
+    cache = ResponseCache(str(tmp_path / "cache"), ttl_seconds=0)
+    transport = make_transport(cache=cache)
+    url = f"{stub_site.url}/search?query=design"
+
+    first = transport.get(url)
+    second = transport.get(url)
+
+    assert len(stub_site.requests) == 2
+    assert "If-None-Match" not in stub_site.requests[0][2]
+    assert stub_site.requests[1][2]["If-None-Match"] == '"v1"'
+    assert second.status_code == 200 and second.text == first.text == "<html>página</html>"
+    assert transport.get_stats()["cache_revalidated"] == 1
+
+
+def test_fresh_entry_is_served_without_a_request(stub_site, tmp_path):
+    stub_site.handler = lambda path, query, headers: (200, {}, "<html>página</html>")
+    transport = make_transport(cache=ResponseCache(str(tmp_path / "cache"), ttl_seconds=3600))
+    url = f"{stub_site.url}/search?query=design"
+
+    transport.get(url)
+    cached = transport.get(url)
+
+    assert len(stub_site.requests) == 1
+    assert cached.from_cache and cached.text == "<html>página</html>"
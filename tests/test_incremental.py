@@ -0,0 +1,53 @@
+import pandas as pd
+
+from conftest import ListScraper, make_transport, page_number, results_page
+from design_scraper.core import fetch_engine
+from design_scraper.core.fetch_engine import FetchEngine
+from design_scraper.utils.high_water_marks import HighWaterMarks, IncrementalState, load_known_links
+
+
+def _links(page):
+    return [f"https://revista.br/article/view/{page}{i}" for i in range(2)]
+
+
+def test_incremental_run_stops_on_first_known_page(stub_site, tmp_path, monkeypatch):
+    def handler(path, query, headers):
+        page = page_number(query)
+        assert query["sort"] == ["date"]
+        return 200, {}, results_page(_links(page), page, 5)
+
+    stub_site.handler = handler
+    # A base guarda os links da página 2 com outra grafia (host, barra final, fragmento)
+    base_path = tmp_path / "base.csv"
+    pd.DataFrame({"link": [
+        "HTTPS://Revista.br/article/view/20/",
+        "https://revista.br/article/view/21#resumo",
+    ]}).to_csv(base_path, index=False)
+    incremental = IncrementalState(
+        HighWaterMarks(str(tmp_path / "marks.json")), load_known_links(str(base_path))
+    )
+
+    transport = make_transport()
+    monkeypatch.setattr(
+        fetch_engine.ScrapterFactory, "get_scraper",
+        staticmethod(lambda key: ListScraper(stub_site.url, transport)),
+    )
+    results, _ = FetchEngine(transport=transport, incremental=incremental).run(
+        {"Stub": "stub"}, ["design"], 5
+    )
+
+    assert [page_number(query) for _, query, _ in stub_site.requests] == [1, 2]
+    assert [r.link for r in results] == _links(1) + _links(2)
+    assert incremental.stop_link("Stub", "design") == _links(1)[0]
+
+
+def test_stop_link_is_compared_normalized(stub_site):
+    stub_site.handler = lambda path, query, headers: (
+        200, {}, results_page(_links(page_number(query)), page_number(query), 5)
+    )
+    scraper = ListScraper(stub_site.url, make_transport())
+    scraper.newest_first = True
+
+    results = scraper.search("design", 5, stop_link="https://REVISTA.br/article/view/30/")
+
+    assert [r.link for r in results] == _links(1) + _links(2) + _links(3)
@@ -0,0 +1,54 @@
+import pandas as pd
+
+from design_scraper.utils.data_transformer import DataTransformer
+from design_scraper.utils.keyword_matcher import KeywordMatcher
+
+TITLES = [
+    "User Experience em aplicativos bancários",
+    "Username e senha: usabilidade de formulários",
+    "Experiência mobile para idosos",
+    "Design participativo na escola",
+    "UX DESIGN em serviços públicos",
+    "Tipografia e história do livro",
+    "Web semântica e interface",
+    "",
+    None,
+    float("nan"),
+    "Produto, product design e neurodesign",
+]
+
+
+def _old_matches(keywords, title):
+    """Verificação anterior, título a título"""
+    if not title or pd.isna(title):
+        return []
+    title_lower = str(title).lower()
+    return [keyword for keyword in keywords if keyword in title_lower]
+
+
+def test_mask_and_matches_agree_with_per_title_check():
+    keywords = DataTransformer().required_keywords
+    matcher = KeywordMatcher(keywords)
+    titles = pd.Series(TITLES, index=range(10, 10 + len(TITLES)))
+
+    expected = [_old_matches(keywords, title) for title in TITLES]
+
+    assert list(matcher.mask(titles)) == [bool(found) for found in expected]
+    assert list(matcher.matches(titles)) == ["; ".join(found) for found in expected]
+    assert [matcher.contains_any(title) for title in TITLES] == [bool(found) for found in expected]
+    assert list(matcher.mask(titles).index) == list(titles.index)
+
+
+def test_nested_and_special_keywords():
+    matcher = KeywordMatcher(["user", "user experience", "experience", "c++", "UX"])
+    titles = pd.Series(["A user experience study", "Programação em C++", "Sem relação"])
+
+    assert list(matcher.matches(titles)) == ["user; user experience; experience", "c++", ""]
+    assert list(matcher.mask(titles)) == [True, True, False]
+
+
+def test_empty_keyword_list_matches_nothing():
+    matcher = KeywordMatcher([])
+    titles = pd.Series(["Design"])
+    assert list(matcher.mask(titles)) == [False]
+    assert list(matcher.matches(titles)) == [""]
@@ -0,0 +1,73 @@
+import pandas as pd
+
+from design_scraper.utils.data_transformer import DataTransformer
+from design_scraper.utils.language_detection import PortugueseDetector
+
+# Lista da verificação anterior, título a título (com a repetição de 'ótimas')
+OLD_CHARS = ['á', 'à', 'ã', 'â', 'é', 'ê', 'í', 'ó', 'ô', 'õ', 'ú', 'ç', 'ñ']
+OLD_WORDS = [
+    'de', 'da', 'do', 'das', 'dos', 'para', 'com', 'sem', 'em', 'na', 'no',
+    'nas', 'nos', 'por', 'pelo', 'pela', 'pelos', 'pelas', 'que', 'qual',
+    'quais', 'como', 'onde', 'quando', 'quem', 'cujo', 'cuja', 'cujos', 'cujas',
+    'este', 'esta', 'estes', 'estas', 'esse', 'essa', 'esses', 'essas',
+    'aquele', 'aquela', 'aqueles', 'aquelas', 'mesmo', 'mesma', 'mesmos', 'mesmas',
+    'próprio', 'própria', 'próprios', 'próprias', 'outro', 'outra', 'outros', 'outras',
+    'todo', 'toda', 'todos', 'todas', 'algum', 'alguma', 'alguns', 'algumas',
+    'nenhum', 'nenhuma', 'nenhuns', 'nenhumas', 'certo', 'certa', 'certos', 'certas',
+    'vário', 'vária', 'vários', 'várias', 'pouco', 'pouca', 'poucos', 'poucas',
+    'muito', 'muita', 'muitos', 'muitas', 'bastante', 'bastantes', 'demasiado',
+    'demasiada', 'demasiados', 'demasiadas', 'mais', 'menos', 'melhor', 'pior',
+    'maior', 'menor', 'ótimo', 'ótima', 'ótimas', 'ótimas', 'péssimo', 'péssima',
+    'péssimos', 'péssimas', 'bom', 'boa', 'bons', 'boas', 'mau', 'má', 'maus', 'más'
+]
+
+TITLES = [
+    "Design de interfaces para idosos",           # acento ausente, 2 palavras
+    "Design de interfaces para todos os idosos",  # 3 palavras distintas
+    "Usabilidade em sistemas com muito uso",      # 3 palavras
+    "de de de design",                            # a mesma palavra repetida
+    "Ergonomia e informação",                     # caractere português
+    "User experience in mobile banking",
+    "Design  para\tcom  sem  espaços",            # espaços variados
+    "DESIGN PARA COM SEM",                        # maiúsculas
+    "Diseño de señalética",                       # ñ
+    "",
+    None,
+    float("nan"),
+    12345,
+]
+
+
+def _old_is_portuguese(title):
+    if not title or pd.isna(title):
+        return False
+    title_lower = str(title).lower()
+    has_portuguese_chars = any(char in title_lower for char in OLD_CHARS)
+    portuguese_word_count = sum(1 for word in OLD_WORDS if word in title_lower.split())
+    return has_portuguese_chars or portuguese_word_count >= 3
+
+
+def test_detector_agrees_with_per_title_check():
+    detector = PortugueseDetector()
+    titles = pd.Series(TITLES, index=range(100, 100 + len(TITLES)))
+    expected = [_old_is_portuguese(title) for title in TITLES]
+
+    assert list(detector.mask(titles)) == expected
+    assert [detector.is_portuguese(title) for title in TITLES] == expected
+    assert [DataTransformer().is_portuguese_title(title) for title in TITLES] == expected
+
+
+def test_scores_express_the_same_rule():
+    scores = PortugueseDetector().scores(pd.Series([
+        "Ergonomia e informação", "Design para idosos", "Design de interfaces para idosos",
+        "User experience", "Design para todos com idosos",
+    ]))
+    assert list(scores.round(3)) == [1.0, 0.333, 0.667, 0.0, 1.0]
+
+
+def test_scores_are_computed_in_chunks(monkeypatch):
+    from design_scraper.utils import language_detection
+
+    monkeypatch.setattr(language_detection, "CHUNK_SIZE", 4)
+    titles = pd.Series(TITLES)
+    assert list(PortugueseDetector().mask(titles)) == [_old_is_portuguese(t) for t in TITLES]
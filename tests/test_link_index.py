@@ -0,0 +1,91 @@
+import os
+
+import pandas as pd
+import pytest
+
+from design_scraper.utils.link_index import LinkIndex, normalize_link
+
+ROWS = pd.DataFrame({
+    "title": ["Design de interfaces", "Ergonomia", "Tipografia"],
+    "link": [
+        "https://revista.br/article/view/1",
+        "https://revista.br/article/view/2",
+        "https://outra.br/article/view/3",
+    ],
+    "database": ["Estudos em Design", "Estudos em Design", "Arcos Design"],
+    "category": ["interface", "ergonomia", "tipografia"],
+})
+
+
+@pytest.fixture
+def base(tmp_path):
+    path = tmp_path / "base_database.csv"
+    ROWS.head(2).to_csv(path, index=False)
+    return path
+
+
+@pytest.fixture
+def index(base, tmp_path):
+    return LinkIndex(str(base), str(tmp_path / "state" / "link_index.sqlite"))
+
+
+def _bump_mtime(path):
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+
+@pytest.mark.parametrize("link, expected", [
+    ("HTTPS://Revista.BR/article/view/1/", "https://revista.br/article/view/1"),
+    ("https://revista.br/article/view/1#resumo", "https://revista.br/article/view/1"),
+    ("https://revista.br/search?b=2&a=1", "https://revista.br/search?a=1&b=2"),
+    ("https://revista.br/", "https://revista.br/"),
+    ("  Sem URL ", "Sem URL"),
+    (None, None),
+    (float("nan"), None),
+])
+def test_normalize_link(link, expected):
+    assert normalize_link(link) == expected
+
+
+def test_index_answers_membership_with_normalized_links(index):
+    assert index.ensure_current() == "rebuilt"
+    assert index.ensure_current() == "current"
+
+    assert index.contains([
+        "https://REVISTA.br/article/view/1/", "https://revista.br/article/view/9", None,
+    ]) == [True, False, False]
+    assert index.load_links() == {
+        "https://revista.br/article/view/1", "https://revista.br/article/view/2",
+    }
+    assert index.statistics() == {"total_records": 2, "unique_sources": 1, "unique_terms": 2}
+
+
+def test_appended_rows_are_indexed_incrementally(index, base):
+    index.ensure_current()
+    ROWS.tail(1).to_csv(base, mode="a", header=False, index=False)
+
+    assert index.ensure_current() == "updated"
+    assert len(index) == 3
+    assert index.statistics() == {"total_records": 3, "unique_sources": 2, "unique_terms": 3}
+
+
+def test_rewritten_base_rebuilds_the_index(index, base):
+    index.ensure_current()
+    ROWS.tail(2).to_csv(base, index=False)
+    _bump_mtime(base)
+
+    assert index.ensure_current() == "rebuilt"
+    assert index.contains(ROWS["link"]) == [False, True, True]
+
+
+def test_touched_base_with_same_content_is_current(index, base):
+    index.ensure_current()
+    _bump_mtime(base)
+    assert index.ensure_current() == "current"
+
+
+def test_missing_base(tmp_path):
+    index = LinkIndex(str(tmp_path / "ausente.csv"), str(tmp_path / "link_index.sqlite"))
+    assert index.ensure_current() == "missing"
+    assert index.contains(["https://revista.br/1"]) == [False]
+    assert len(index) == 0
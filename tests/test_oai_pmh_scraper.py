@@ -0,0 +1,96 @@
+import importlib.util
+import os
+
+import pytest
+
+from conftest import make_transport
+from design_scraper.scrapers.fetch_policy import FetchError
+from design_scraper.scrapers.oai_pmh_scraper import OAIPMHScraper
+
+STUB_PATH = os.path.join(os.path.dirname(__file__), "..", "cli", "oai_stub_server.py")
+
+
+def _load_stub():
+    spec = importlib.util.spec_from_file_location("oai_stub_server", STUB_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+oai_stub_server = _load_stub()
+
+
+@pytest.fixture
+def endpoint():
+    """Servidor OAI-PMH local em uma porta livre"""
+    server, url = oai_stub_server.start_server()
+    yield url
+    server.shutdown()
+    server.server_close()
+
+
+def test_harvest_follows_resumption_tokens(endpoint):
+    records = list(OAIPMHScraper(endpoint).iter_records())
+
+    sample = oai_stub_server.SAMPLE_RECORDS
+    assert len(sample) > oai_stub_server.PAGE_SIZE
+    assert [r.link for r in records] == [s["link"] for s in sample]
+    assert [r["datestamp"] for r in records] == [s["datestamp"] for s in sample]
+
+
+def test_harvest_stops_at_max_pages(endpoint):
+    records = list(OAIPMHScraper(endpoint).iter_records(max_pages=1))
+
+    assert len(records) == oai_stub_server.PAGE_SIZE
+
+
+def test_incremental_harvest_sends_from_date(endpoint):
+    records = list(OAIPMHScraper(endpoint).iter_records(from_date="2024-01-01"))
+
+    expected = [s["link"] for s in oai_stub_server.SAMPLE_RECORDS if s["datestamp"] >= "2024-01-01"]
+    assert [r.link for r in records] == expected
+
+
+def test_incremental_search_matches_terms_after_from_date(endpoint):
+    scraper = OAIPMHScraper(endpoint)
+
+    results = scraper.search_batch(["usabilidade", "acessibilidade"], None, from_date="2024-01-01")
+
+    assert [(r.link, r.termo) for r in results] == [
+        ("https://stub.local/index.php/revista/article/view/103", "acessibilidade"),
+    ]
+    assert scraper.search_batch(["usabilidade"], None, from_date="2025-01-01") == []
+
+
+def _failing_after_first_page(path, query, headers):
+    """ListRecords com a primeira página e 503 a partir do resumptionToken"""
+    if "resumptionToken" in query:
+        return 503, {}, ""
+    body = oai_stub_server.render_list_records(oai_stub_server.SAMPLE_RECORDS, 0, None)
+    return 200, {"Content-Type": "text/xml; charset=utf-8"}, body
+
+
+def test_non_200_response_raises_fetch_error(stub_site):
+    stub_site.handler = lambda path, query, headers: (404, {}, "")
+    scraper = OAIPMHScraper(f"{stub_site.url}/oai", transport=make_transport())
+
+    with pytest.raises(FetchError) as excinfo:
+        list(scraper.iter_records())
+    assert excinfo.value.response.status_code == 404
+
+
+def test_failed_harvest_keeps_only_the_term_matches_as_partial_results(stub_site):
+    stub_site.handler = _failing_after_first_page
+    scraper = OAIPMHScraper(f"{stub_site.url}/oai", transport=make_transport())
+
+    with pytest.raises(FetchError) as excinfo:
+        scraper.search_batch(["usabilidade", "tipografia"], None)
+
+    partial = excinfo.value.partial_results
+    assert [(r.link, r.termo) for r in partial] == [
+        ("https://stub.local/index.php/revista/article/view/101", "usabilidade"),
+    ]
+
+    with pytest.raises(FetchError) as excinfo:
+        scraper.search("design thinking", None)
+    assert [r.title for r in excinfo.value.partial_results] == ["Design thinking na educação"]
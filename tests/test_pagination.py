@@ -0,0 +1,73 @@
+import pytest
+from bs4 import BeautifulSoup
+
+from conftest import ListScraper, make_transport, page_number, results_page
+
+
+def _links(page):
+    return [f"https://revista.br/article/view/{page}{i}" for i in range(2)]
+
+
+def _unpaginated(links):
+    """Página de resultados sem marcação de paginação reconhecível"""
+    return results_page(links, 1, 1).replace("Página 1 de 1", "")
+
+
+def _search(stub_site, handler, max_pages=10):
+    stub_site.handler = handler
+    results = ListScraper(stub_site.url, make_transport()).search("design", max_pages)
+    return [r.link for r in results], [page_number(query) for _, query, _ in stub_site.requests]
+
+
+def test_stops_at_last_page_of_pagination_markup(stub_site):
+    links, pages = _search(
+        stub_site,
+        lambda path, query, headers: (200, {}, results_page(_links(page_number(query)), page_number(query), 2)),
+    )
+    assert pages == [1, 2]
+    assert links == _links(1) + _links(2)
+
+
+def test_stops_at_first_empty_page(stub_site):
+    def handler(path, query, headers):
+        page = page_number(query)
+        links = _links(page) if page < 3 else []
+        return 200, {}, _unpaginated(links)
+
+    links, pages = _search(stub_site, handler)
+    assert pages == [1, 2, 3]
+    assert links == _links(1) + _links(2)
+
+
+def test_stops_when_page_repeats_items_already_seen(stub_site):
+    # O site ignora o número da página e devolve sempre os mesmos resultados
+    links, pages = _search(
+        stub_site,
+        lambda path, query, headers: (200, {}, _unpaginated(_links(1))),
+    )
+    assert pages == [1, 2]
+    assert links == _links(1)
+
+
+def test_stops_at_max_pages(stub_site):
+    links, pages = _search(
+        stub_site,
+        lambda path, query, headers: (200, {}, results_page(_links(page_number(query)), page_number(query), 9)),
+        max_pages=3,
+    )
+    assert pages == [1, 2, 3]
+
+
+@pytest.mark.parametrize("markup, page, expected", [
+    ('<div class="cmp_pagination">1 - 20 de 40 itens</div>', 1, True),
+    ('<div class="cmp_pagination">21 - 40 de 40 itens</div>', 2, False),
+    ('<table class="listing"><tr><td>Itens 1 - 25 de 25</td></tr></table>', 1, False),
+    ('<div class="pagination">Page 3 of 3</div>', 3, False),
+    ('<div class="nav-links"><a href="/page/2/">2</a><a href="/page/3/">3</a></div>', 3, False),
+    ('<div class="nav-links"><a href="/page/2/">2</a><a href="/page/3/">3</a></div>', 2, True),
+    ('<a class="next" href="?searchPage=4">Próxima</a>', 3, True),
+    ('<p>Sem paginação</p>', 1, True),
+])
+def test_has_next_page(markup, page, expected):
+    soup = BeautifulSoup(f"<html><body>{markup}</body></html>", "html.parser")
+    assert ListScraper("https://revista.br").has_next_page(soup, page) is expected
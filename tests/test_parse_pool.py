@@ -0,0 +1,75 @@
+import time
+
+import pytest
+
+from conftest import ListScraper, make_transport, page_number, results_page
+from design_scraper.scrapers import base_scraper
+from design_scraper.scrapers.parse_pool import ParsePool
+
+PARSE_SECONDS = 0.5
+
+
+class SlowListScraper(ListScraper):
+    """Parsing lento, para que a busca da página seguinte aconteça durante ele"""
+
+    def extract_page(self, content, page):
+        time.sleep(PARSE_SECONDS)
+        return super().extract_page(content, page)
+
+
+def _links(page):
+    return [f"https://revista.br/article/view/{page}{i}" for i in range(2)]
+
+
+@pytest.fixture
+def pool():
+    pool = ParsePool(workers=1, queue_size=2)
+    yield pool
+    pool.close()
+
+
+def test_next_page_is_fetched_while_current_one_is_parsed(stub_site, pool, monkeypatch):
+    fetched_at = {}
+
+    def handler(path, query, headers):
+        page = page_number(query)
+        fetched_at[page] = time.perf_counter()
+        return 200, {}, results_page(_links(page), page, 3)
+
+    stub_site.handler = handler
+    monkeypatch.setattr(base_scraper, "get_parse_pool", lambda: pool)
+    scraper = SlowListScraper(stub_site.url, make_transport())
+
+    yielded_at, links = {}, []
+    for item in scraper.iter_search("design", 5):
+        page = int(item.link[-2])
+        yielded_at.setdefault(page, time.perf_counter())
+        links.append(item.link)
+
+    assert links == _links(1) + _links(2) + _links(3)
+    # A página 4 foi buscada à frente e descartada quando a 3 se revelou a última
+    assert sorted(fetched_at) == [1, 2, 3, 4]
+    # Cada página seguinte já foi buscada antes de a atual sair do parsing
+    assert fetched_at[2] < yielded_at[1]
+    assert fetched_at[3] < yielded_at[2]
+    assert pool.get_stats()["pages"] == 4
+    # Todos os lugares da fila foram liberados
+    assert pool.reserve(block=False) and pool.reserve(block=False)
+
+
+def test_full_queue_refuses_prefetch_and_results_come_in_order(stub_site, pool):
+    scraper = ListScraper(stub_site.url)
+    pages = []
+    for page in (1, 2):
+        assert pool.reserve()
+        pages.append(pool.submit(scraper, results_page(_links(page), page, 2).encode(), page))
+
+    assert not pool.reserve(block=False)
+
+    items, has_next = pages[0].result()
+    assert [item.link for item in items] == _links(1) and has_next
+    assert pool.reserve(block=False)
+    pool.release()
+
+    items, has_next = pages[1].result()
+    assert [item.link for item in items] == _links(2) and not has_next
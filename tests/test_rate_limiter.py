@@ -0,0 +1,64 @@
+import pytest
+
+from design_scraper.scrapers import rate_limiter
+from design_scraper.scrapers.rate_limiter import RateLimiter, TokenBucket
+
+
+class FakeClock:
+    """Relógio controlado pelo teste; sleep() apenas registra a espera"""
+
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(rate_limiter, "time", clock)
+    return clock
+
+
+def test_burst_then_one_request_per_delay(clock):
+    bucket = TokenBucket(delay_between_requests=2, burst=2)
+
+    # Sem o tempo passar, cada chamada reserva a próxima vaga da fila
+    assert [bucket.acquire() for _ in range(4)] == [0.0, 0.0, 2.0, 4.0]
+    assert clock.sleeps == [2.0, 4.0]
+
+
+def test_tokens_refill_up_to_burst(clock):
+    bucket = TokenBucket(delay_between_requests=1, burst=2)
+    bucket.acquire()
+    bucket.acquire()
+
+    clock.now += 10
+    assert [bucket.acquire() for _ in range(3)] == [0.0, 0.0, 1.0]
+
+
+def test_zero_delay_never_waits(clock):
+    bucket = TokenBucket(delay_between_requests=0)
+    assert [bucket.acquire() for _ in range(5)] == [0.0] * 5
+
+
+def test_hosts_have_independent_buckets(clock):
+    limiter = RateLimiter(delay_between_requests=1)
+    limiter.configure_host("lento.br", delay_between_requests=5)
+
+    assert limiter.acquire("https://revista.br/a") == 0.0
+    assert limiter.acquire("https://outra.br/a") == 0.0
+    assert limiter.acquire("https://revista.br/b") == 1.0
+    assert limiter.acquire("https://lento.br/a") == 0.0
+    assert limiter.acquire("https://lento.br/b") == 5.0
+
+
+def test_from_config_reads_delay_and_burst(clock):
+    limiter = RateLimiter.from_config({"delay_between_requests": 3, "burst": 2})
+    bucket = limiter.bucket_for("revista.br")
+    assert (bucket.delay, bucket.capacity) == (3.0, 2)
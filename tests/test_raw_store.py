@@ -0,0 +1,62 @@
+import json
+
+import pandas as pd
+import pytest
+
+from design_scraper.utils.raw_store import RawResultsStore
+
+
+def _results(source, term, titles):
+    return pd.DataFrame({
+        "title": titles,
+        "link": [f"https://revista.br/{t}" for t in titles],
+        "fonte": source,
+        "termo": term,
+    })
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = RawResultsStore(str(tmp_path / "runs"))
+    store.append(_results("Estudos em Design", "usabilidade", ["a", "b"]), run_id="run1")
+    store.append(_results("Arcos Design", "ergonomia", ["c"]), run_id="run2")
+    return store
+
+
+def test_manifest_records_each_partition(store):
+    with open(store.manifest_path, encoding="utf-8") as f:
+        runs = json.load(f)["runs"]
+
+    assert [(r["run_id"], r["rows"], r["sources"], r["terms"]) for r in runs] == [
+        ("run1", 2, ["Estudos em Design"], ["usabilidade"]),
+        ("run2", 1, ["Arcos Design"], ["ergonomia"]),
+    ]
+    assert runs[0]["columns"] == ["title", "link", "fonte", "termo"]
+    assert store.total_rows() == 3 and len(store) == 2
+
+
+def test_filters_skip_partitions_using_the_manifest(store):
+    assert [r["run_id"] for r in store.runs(sources=["Arcos Design"])] == ["run2"]
+    assert [r["run_id"] for r in store.runs(terms=["usabilidade", "outro"])] == ["run1"]
+    assert store.runs(run_ids=["run3"]) == []
+    assert store.runs(until="2000-01-01") == []
+
+    df = store.read(columns=["title"], sources=["Estudos em Design"])
+    assert list(df.columns) == ["title"] and list(df["title"]) == ["a", "b"]
+
+
+def test_chunked_iteration_and_run_removal(store):
+    chunks = list(store.iter_partitions(chunksize=1))
+    assert [list(chunk["title"]) for chunk in chunks] == [["a"], ["b"], ["c"]]
+
+    assert store.remove_run("run1") == 2
+    assert list(store.read()["title"]) == ["c"]
+
+
+def test_legacy_csv_is_imported_once(store, tmp_path):
+    legacy = tmp_path / "search_results.csv"
+    _results("Legado", "design", ["x"]).to_csv(legacy, index=False)
+
+    assert store.import_legacy(str(legacy))["imported_from"] == str(legacy)
+    assert store.import_legacy(str(legacy)) is None
+    assert store.total_rows() == 4
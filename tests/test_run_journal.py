@@ -0,0 +1,59 @@
+import pytest
+
+from conftest import ListScraper, make_transport, page_number, results_page
+from design_scraper.core import fetch_engine
+from design_scraper.core.fetch_engine import FetchEngine
+from design_scraper.utils.run_journal import DONE, FAILED, RunJournal
+
+
+def _links(term, page):
+    return [f"https://revista.br/{term}/{page}/{i}" for i in range(2)]
+
+
+def _unit_status(journal):
+    return {key: unit["status"] for key, unit in journal.state["units"].items()}
+
+
+def test_resume_replays_done_units_and_fetches_failed_and_unfinished_ones(stub_site, tmp_path,
+                                                                          monkeypatch):
+    state = {"failing": True}
+
+    def handler(path, query, headers):
+        term, page = query["query"][0], page_number(query)
+        if term == "b" and page == 2 and state["failing"]:
+            return 503, {}, ""
+        return 200, {}, results_page(_links(term, page), page, 2)
+
+    class InterruptedScraper(ListScraper):
+        def build_url(self, term, page):
+            if term == "c" and state["failing"]:
+                raise KeyboardInterrupt()
+            return super().build_url(term, page)
+
+    stub_site.handler = handler
+    transport = make_transport()
+    monkeypatch.setattr(
+        fetch_engine.ScrapterFactory, "get_scraper",
+        staticmethod(lambda key: InterruptedScraper(stub_site.url, transport)),
+    )
+    repos, terms = {"Stub": "stub"}, ["a", "b", "c"]
+
+    # Primeira tentativa: "a" conclui, "b" é interrompido por 503 e "c" pelo Ctrl-C
+    journal = RunJournal("run1", str(tmp_path))
+    with pytest.raises(KeyboardInterrupt):
+        FetchEngine(transport=transport, journal=journal).run(repos, terms, 5)
+    assert _unit_status(RunJournal("run1", str(tmp_path))) == {"Stub|a": DONE, "Stub|b": FAILED}
+
+    # Retomada: "a" é relido do diário, "b" e "c" são buscados de novo
+    state["failing"] = False
+    stub_site.requests.clear()
+    journal = RunJournal("run1", str(tmp_path))
+    results, repo_stats = FetchEngine(transport=transport, journal=journal).run(repos, terms, 5)
+
+    fetched_terms = {query["query"][0] for _, query, _ in stub_site.requests}
+    assert fetched_terms == {"b", "c"}
+    assert [(r.link, r.termo, r.fonte) for r in results] == [
+        (link, term, "Stub") for term in terms for page in (1, 2) for link in _links(term, page)
+    ]
+    assert repo_stats["Stub"]["errors"] == 0
+    assert _unit_status(journal) == {"Stub|a": DONE, "Stub|b": DONE, "Stub|c": DONE}
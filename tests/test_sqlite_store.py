@@ -0,0 +1,57 @@
+import os
+
+import pandas as pd
+import pytest
+
+from design_scraper.utils import sqlite_store
+from design_scraper.utils.sqlite_store import BASE_TABLE, FILTERED_TABLE, SQLiteStore
+
+BASE = pd.DataFrame({
+    "title": ["Design de interfaces", "Ergonomia"],
+    "link": ["https://revista.br/1", "https://revista.br/2"],
+})
+
+
+def _touch(path):
+    """Muda o mtime para que a base seja recarregada"""
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+
+@pytest.fixture
+def store(tmp_path):
+    return SQLiteStore(str(tmp_path / "pipeline.sqlite"))
+
+
+def test_sync_base_empties_table_when_base_has_no_rows(store, tmp_path):
+    base_db_path = tmp_path / "base_database.csv"
+    BASE.to_csv(base_db_path, index=False)
+    assert store.sync_base(str(base_db_path)) == "loaded"
+    assert store.count(BASE_TABLE) == 2
+
+    # Base esvaziada: apenas o cabeçalho
+    base_db_path.write_text("title,link\n", encoding="utf-8")
+    _touch(base_db_path)
+    assert store.sync_base(str(base_db_path)) == "loaded"
+    assert store.count(BASE_TABLE) == 0
+
+    store.write(FILTERED_TABLE, BASE.head(1))
+    assert list(store.find_new_records()["link"]) == ["https://revista.br/1"]
+
+
+def test_sync_base_keeps_previous_base_when_reload_fails(store, tmp_path, monkeypatch):
+    base_db_path = tmp_path / "base_database.csv"
+    BASE.to_csv(base_db_path, index=False)
+    assert store.sync_base(str(base_db_path)) == "loaded"
+
+    # Os primeiros blocos são gravados; a aspa sem fechamento falha no meio da carga
+    monkeypatch.setattr(sqlite_store, "READ_CHUNK_ROWS", 1)
+    base_db_path.write_text(
+        'title,link\nNovo,https://revista.br/3\nOutro,https://revista.br/4\nQuebrado,"https://\n',
+        encoding="utf-8",
+    )
+    _touch(base_db_path)
+    with pytest.raises(pd.errors.ParserError):
+        store.sync_base(str(base_db_path))
+
+    assert list(store.read(BASE_TABLE)["link"]) == list(BASE["link"])
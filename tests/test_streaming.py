@@ -0,0 +1,94 @@
+import pandas as pd
+
+from conftest import ListScraper, make_transport, page_number, results_page
+from design_scraper.core import fetch_engine
+from design_scraper.core.fetch_engine import FetchEngine
+from design_scraper.utils.export_csv import IncrementalCSVWriter
+from design_scraper.utils.raw_store import RawResultsStore
+
+
+def _links(term, page):
+    return [f"https://revista.br/{term}/{page}/{i}" for i in range(3)]
+
+
+def test_incremental_csv_writer_aligns_blocks_to_first_header(tmp_path):
+    path = tmp_path / "processed" / "new_records.csv"
+    path.parent.mkdir()
+    path.write_text("antigo\n1\n", encoding="utf-8")
+
+    with IncrementalCSVWriter(str(path)) as writer:
+        writer.write(pd.DataFrame(columns=["title", "link"]))
+        assert path.read_text(encoding="utf-8") == "antigo\n1\n"
+
+        writer.write(pd.DataFrame({"title": ["A"], "link": ["https://revista.br/1"]}))
+        # Cada bloco já está no disco antes do fechamento
+        assert len(pd.read_csv(path)) == 1
+
+        writer.write(pd.DataFrame({"link": ["https://revista.br/2"], "extra": ["x"]}))
+
+    df = pd.read_csv(path)
+    assert list(df.columns) == ["title", "link"]
+    assert list(df["link"]) == ["https://revista.br/1", "https://revista.br/2"]
+    assert writer.rows == 2
+
+
+def test_incremental_csv_writer_without_blocks_creates_nothing(tmp_path):
+    path = tmp_path / "new_records.csv"
+    with IncrementalCSVWriter(str(path)):
+        pass
+    assert not path.exists()
+
+
+def test_partition_enters_manifest_only_when_closed(tmp_path):
+    store = RawResultsStore(str(tmp_path / "runs"))
+    writer = store.open_run("run1")
+    writer.write(pd.DataFrame({"title": ["A"], "fonte": ["Stub"], "termo": ["design"]}))
+    writer.write(pd.DataFrame({"title": ["B"], "fonte": ["Outra"], "termo": ["ux"], "year": [2024]}))
+    assert len(store) == 0
+
+    entry = writer.close()
+    assert entry["parts"] == ["run1/part-00000.csv.gz", "run1/part-00001.csv.gz"]
+    assert (entry["rows"], entry["sources"], entry["terms"]) == (2, ["Outra", "Stub"], ["design", "ux"])
+    assert list(store.read()["title"]) == ["A", "B"]
+    assert list(store.read(sources=["Outra"])["title"]) == ["B"]
+
+
+def _engine(stub_site, monkeypatch, **options):
+    stub_site.handler = lambda path, query, headers: (
+        200, {}, results_page(_links(query["query"][0], page_number(query)), page_number(query), 3)
+    )
+    transport = make_transport()
+    monkeypatch.setattr(
+        fetch_engine.ScrapterFactory, "get_scraper",
+        staticmethod(lambda key: ListScraper(stub_site.url, transport)),
+    )
+    return FetchEngine(transport=transport, **options)
+
+
+def test_stream_delivers_all_results_in_bounded_batches(stub_site, monkeypatch):
+    engine = _engine(stub_site, monkeypatch, stream_batch_size=4, stream_queue_size=1)
+    repos, terms = {"Stub": "stub"}, ["a", "b"]
+    repo_stats = engine.new_stats(repos)
+
+    batches = list(engine.stream(repos, terms, 5, repo_stats))
+
+    assert all(len(batch) <= 4 for batch in batches)
+    records = [(r.link, r.fonte, r.termo) for batch in batches for r in batch]
+    assert sorted(records) == sorted(
+        (link, "Stub", term) for term in terms for page in (1, 2, 3) for link in _links(term, page)
+    )
+    assert repo_stats["Stub"]["results"] == 18
+
+
+def test_stream_stops_fetching_when_consumer_exits_early(stub_site, monkeypatch):
+    engine = _engine(stub_site, monkeypatch, stream_batch_size=3, stream_queue_size=1)
+    repos = {"Stub": "stub"}
+    terms = [f"termo{i}" for i in range(20)]
+
+    stream = engine.stream(repos, terms, 5, engine.new_stats(repos))
+    first = next(stream)
+    stream.close()
+
+    assert len(first) == 3
+    # Apenas as unidades em andamento chegam ao fim: os demais termos nem são buscados
+    assert len({query["query"][0] for _, query, _ in stub_site.requests}) < len(terms)
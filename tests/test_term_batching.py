@@ -0,0 +1,65 @@
+from urllib.parse import quote
+
+from conftest import ListScraper, make_transport, page_number
+from design_scraper.core import fetch_engine
+from design_scraper.core.fetch_engine import FetchEngine
+from design_scraper.scrapers.term_matching import batch_terms, build_or_query, match_terms
+
+TERMS = ["usabilidade", "design thinking", "ergonomia", "tipografia"]
+
+
+class ORListScraper(ListScraper):
+    supports_or_queries = True
+
+    def build_url(self, term, page):
+        return f"{self.base_url}/search?query={quote(term)}&searchPage={page}"
+
+
+def test_build_or_query_quotes_multiword_terms():
+    assert build_or_query(["usabilidade", "design thinking"]) == 'usabilidade OR "design thinking"'
+
+
+def test_batch_terms_respects_query_length_and_order():
+    groups = batch_terms(TERMS, max_query_length=40)
+
+    assert [term for group in groups for term in group] == TERMS
+    assert all(len(build_or_query(group)) <= 40 for group in groups)
+    assert len(groups) == 2
+    # Um termo maior que o limite fica sozinho no seu grupo
+    assert batch_terms(["a" * 50, "b"], max_query_length=10) == [["a" * 50], ["b"]]
+
+
+def test_match_terms_ignores_accents_and_case():
+    assert match_terms("ERGONÔMIA e Usabilidade", TERMS) == ["usabilidade", "ergonomia"]
+
+
+def test_batched_run_sends_one_query_and_attributes_terms(stub_site, monkeypatch):
+    titles = ["Usabilidade e ergonomia", "Tipografia brasileira", "Estudo sem os termos"]
+
+    def handler(path, query, headers):
+        items = "".join(
+            f'<li><a href="https://revista.br/{i}">{title}</a></li>' for i, title in enumerate(titles)
+        )
+        page = page_number(query)
+        return 200, {}, (
+            f'<ul class="search_results">{items}</ul>'
+            f'<div class="pagination">Página {page} de 1</div>'
+        )
+
+    stub_site.handler = handler
+    transport = make_transport()
+    monkeypatch.setattr(
+        fetch_engine.ScrapterFactory, "get_scraper",
+        staticmethod(lambda key: ORListScraper(stub_site.url, transport)),
+    )
+    engine = FetchEngine(transport=transport, term_batching=True)
+
+    results, _ = engine.run({"Stub": "stub"}, TERMS, 3)
+
+    assert [query["query"] for _, query, _ in stub_site.requests] == [[build_or_query(TERMS)]]
+    assert [(r.link, r.termo) for r in results] == [
+        ("https://revista.br/0", "usabilidade"),
+        ("https://revista.br/0", "ergonomia"),
+        ("https://revista.br/1", "tipografia"),
+        ("https://revista.br/2", build_or_query(TERMS)),
+    ]
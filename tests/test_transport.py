@@ -0,0 +1,32 @@
+from conftest import StubSite, make_transport
+
+
+def test_requests_to_a_host_reuse_one_keep_alive_connection(stub_site):
+    stub_site.handler = lambda path, query, headers: (200, {}, "<html></html>")
+    transport = make_transport()
+
+    for page in range(3):
+        assert transport.get(f"{stub_site.url}/search?searchPage={page}").status_code == 200
+
+    stats = transport.get_stats()
+    assert stats["requests"] == 3
+    assert stats["connections_opened"] == 1
+    assert stats["connections_reused"] == 2
+    assert stub_site.requests[0][2]["User-Agent"].startswith("design-publications-scraper/")
+
+
+def test_each_host_gets_its_own_session(stub_site):
+    other = StubSite()
+    try:
+        for site in (stub_site, other):
+            site.handler = lambda path, query, headers: (200, {}, "<html></html>")
+        transport = make_transport()
+
+        for site in (stub_site, other, stub_site):
+            transport.get(f"{site.url}/search")
+
+        assert transport.session_for(stub_site.url) is transport.session_for(f"{stub_site.url}/x")
+        assert transport.session_for(stub_site.url) is not transport.session_for(other.url)
+        assert transport.get_stats()["connections_opened"] == 2
+    finally:
+        other.close()